@@ -0,0 +1,8 @@
+from django.apps import AppConfig
+
+
+class AfromartConfig(AppConfig):
+    name = "afromart"
+
+    def ready(self) -> None:
+        from . import signals  # noqa: F401
@@ -0,0 +1,294 @@
+import http.client
+import json
+import platform
+import subprocess
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from http.cookies import SimpleCookie
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlencode, urlsplit
+
+from django.db import connections
+
+# Django's default CSRF_COOKIE_NAME, which settings keep.
+CSRF_COOKIE = "csrftoken"
+
+
+@dataclass(frozen=True, slots=True)
+class Result:
+    name: str
+    concurrency: int
+    requests: int
+    errors: int
+    seconds: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+
+    @property
+    def throughput(self) -> float:
+        return self.requests / self.seconds if self.seconds else 0.0
+
+    def as_dict(self) -> dict[str, float | int | str]:
+        return asdict(self) | {"throughput": round(self.throughput, 2)}
+
+    def __str__(self) -> str:
+        return (
+            f"{self.name:<32} c={self.concurrency:<4} n={self.requests:<6} "
+            f"err={self.errors:<4} {self.throughput:>9.1f} req/s  "
+            f"p50={self.p50_ms:.2f}ms p95={self.p95_ms:.2f}ms p99={self.p99_ms:.2f}ms"
+        )
+
+
+def percentile(samples: list[float], q: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, round(q / 100 * (len(ordered) - 1)))]
+
+
+def run(
+    name: str, call: Callable[[], bool], *, concurrency: int, requests: int
+) -> Result:
+    """Run `call` `requests` times spread over `concurrency` threads."""
+
+    latencies: list[float] = []
+    errors = 0
+    lock = threading.Lock()
+    per_worker, remainder = divmod(requests, concurrency)
+
+    def worker(count: int) -> None:
+        nonlocal errors
+        local_latencies: list[float] = []
+        local_errors = 0
+        for _ in range(count):
+            started = time.perf_counter()
+            try:
+                ok = call()
+            except Exception:
+                ok = False
+            local_latencies.append((time.perf_counter() - started) * 1000)
+            local_errors += not ok
+        with lock:
+            latencies.extend(local_latencies)
+            errors += local_errors
+
+    started = time.perf_counter()
+    if concurrency == 1:
+        # In the calling thread, so `call` shares its database transaction.
+        worker(requests)
+    else:
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            for index in range(concurrency):
+                pool.submit(worker, per_worker + (index < remainder))
+    seconds = time.perf_counter() - started
+
+    return Result(
+        name=name,
+        concurrency=concurrency,
+        requests=len(latencies),
+        errors=errors,
+        seconds=seconds,
+        p50_ms=percentile(latencies, 50),
+        p95_ms=percentile(latencies, 95),
+        p99_ms=percentile(latencies, 99),
+    )
+
+
+def releasing(call: Callable[[], bool]) -> Callable[[], bool]:
+    """`call`, handing its thread's database connections back after each run.
+
+    A thread keeps its pooled connection until it closes it, so with more
+    threads than the pool holds the rest would wait out the pool's timeout.
+    Connections inside a transaction are left alone: a concurrency of 1 runs
+    in the caller's thread, which may be in one.
+    """
+
+    def released() -> bool:
+        try:
+            return call()
+        finally:
+            for connection in connections.all(initialized_only=True):
+                if not connection.in_atomic_block:
+                    connection.close()
+
+    return released
+
+
+def _sender(url: str, timeout: float) -> Callable[..., http.client.HTTPResponse]:
+    """Sends requests to `url`'s host over a keep-alive connection per calling
+    thread, reading each response in full."""
+
+    parts = urlsplit(url)
+    connection_class = (
+        http.client.HTTPSConnection
+        if parts.scheme == "https"
+        else http.client.HTTPConnection
+    )
+    local = threading.local()
+
+    def send(
+        method: str,
+        path: str,
+        body: str | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> http.client.HTTPResponse:
+        if (connection := getattr(local, "connection", None)) is None:
+            connection = local.connection = connection_class(
+                parts.netloc, timeout=timeout
+            )
+        try:
+            connection.request(method, path, body, headers or {})
+            response = connection.getresponse()
+            response.read()
+        except (OSError, http.client.HTTPException):
+            connection.close()
+            local.connection = None
+            raise
+        return response
+
+    return send
+
+
+def _path(url: str) -> str:
+    parts = urlsplit(url)
+    path = parts.path or "/"
+    return f"{path}?{parts.query}" if parts.query else path
+
+
+def http_get(url: str, *, timeout: float = 30) -> Callable[[], bool]:
+    """A keep-alive GET against `url`, one connection per calling thread."""
+
+    send, path = _sender(url, timeout), _path(url)
+
+    def call() -> bool:
+        return send("GET", path).status < 500
+
+    return call
+
+
+def http_post(
+    url: str, data: dict[str, str], *, timeout: float = 30
+) -> Callable[[], bool]:
+    """A keep-alive form POST of `data` to `url`, one connection per calling
+    thread.
+
+    Each thread first GETs `url` for a CSRF cookie and posts its value back as
+    the form's token. Anything but a 2xx or 3xx, a CSRF rejection included,
+    counts as an error.
+    """
+
+    send, path = _sender(url, timeout), _path(url)
+    parts = urlsplit(url)
+    origin = f"{parts.scheme}://{parts.netloc}"
+    local = threading.local()
+
+    def call() -> bool:
+        if (token := getattr(local, "csrf_token", None)) is None:
+            cookies = SimpleCookie()
+            for header in send("GET", path).msg.get_all("Set-Cookie") or ():
+                cookies.load(header)
+            token = local.csrf_token = cookies[CSRF_COOKIE].value
+        response = send(
+            "POST",
+            path,
+            urlencode(data | {"csrfmiddlewaretoken": token}),
+            {
+                "Content-Type": "application/x-www-form-urlencoded",
+                "Cookie": f"{CSRF_COOKIE}={token}",
+                "Origin": origin,
+                "Referer": url,
+            },
+        )
+        return response.status < 400
+
+    return call
+
+
+def commit() -> str:
+    """The checked out commit, marked dirty when there are local changes."""
+
+    try:
+        head = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+        dirty = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return f"{head}+dirty" if dirty else head
+
+
+def load_history(path: Path) -> list[dict[str, Any]]:
+    return json.loads(path.read_text()) if path.exists() else []
+
+
+def record(path: Path, results: list[dict[str, Any]]) -> dict[str, Any]:
+    """Append a run of `results` to the JSON history at `path`."""
+
+    run = {
+        "commit": commit(),
+        "recorded_at": datetime.now(UTC).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "results": results,
+    }
+    history = load_history(path)
+    history.append(run)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(history, indent=2) + "\n")
+    return run
+
+
+# Metric, whether higher is better, and the change worth flagging below the
+# relative threshold (latencies jitter by fractions of a millisecond).
+COMPARED = (
+    ("throughput", True, 0.0),
+    ("p50_ms", False, 1.0),
+    ("p95_ms", False, 1.0),
+    ("p99_ms", False, 1.0),
+    ("queries_per_request", False, 0.0),
+    ("cold_start_ms", False, 50.0),
+)
+
+
+def regressions(
+    before: dict[str, Any], after: dict[str, Any], *, threshold: float = 0.1
+) -> list[str]:
+    """Describe every result in `after` that got worse than in `before`.
+
+    Timings must worsen by more than `threshold` (relative) to count; any
+    extra query per request counts.
+    """
+
+    baseline = {
+        (result["name"], result["concurrency"]): result for result in before["results"]
+    }
+    found: list[str] = []
+
+    for result in after["results"]:
+        if (base := baseline.get((result["name"], result["concurrency"]))) is None:
+            continue
+        for metric, higher_is_better, noise in COMPARED:
+            old, new = base.get(metric), result.get(metric)
+            if old is None or new is None:
+                continue
+            worse = old - new if higher_is_better else new - old
+            allowed = 0.0 if metric == "queries_per_request" else abs(old) * threshold
+            if worse > max(allowed, noise) + 1e-9:
+                found.append(
+                    f"{result['name']} c={result['concurrency']}: {metric} "
+                    f"{old:.2f} → {new:.2f}"
+                )
+    return found
@@ -0,0 +1,318 @@
+"""A per-process LRU in front of Redis, for hot keys that rarely change.
+
+The "hot" cache serves repeat reads from memory. Every write, delete and
+clear drops the keys here and is published on CHANNEL, and a listener
+thread in each other process drops them there, so a change reaches every
+worker within a round trip. Read-through fills (fill, fill_many) aren't
+changes, and aren't published. Local entries expire after the LOCAL TIMEOUT
+in any case, which bounds the staleness of a missed message and of a key
+that expired in Redis. The tier is bypassed, and emptied, whenever the listener
+isn't subscribed.
+"""
+
+import json
+import logging
+import os
+import pickle
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from fnmatch import fnmatchcase
+from itertools import batched
+from typing import Any
+
+from django.core.cache import caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.utils.connection import ConnectionProxy
+from redis import Redis, RedisError
+
+from .instrumentation import record_cache
+from .instrumentation.cache import MISSING, RedisCache
+from .redis import namespaced
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = namespaced("cache", "invalidate")
+
+hot: Any = ConnectionProxy(caches, "hot")
+
+
+class LocalTier:
+    """One process's pickled copies of Redis values, by full key.
+
+    Bounded by entry count and total bytes, least recently used first out.
+    Values are stored pickled, as LocMemCache does, so callers can't mutate
+    each other's copies.
+    """
+
+    def __init__(
+        self, location: str, options: dict[str, Any], local: dict[str, Any]
+    ) -> None:
+        self.max_entries: int = local.get("MAX_ENTRIES", 5000)
+        self.max_bytes: int = local.get("MAX_BYTES", 32 * 1024 * 1024)
+        self.timeout: float = local.get("TIMEOUT", 30)
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        # Bumped by every invalidation; a fill whose Redis read started
+        # before one is dropped, since it may hold the old value.
+        self.generation = 0
+        self.live = False
+        # Tags what this process publishes. The writer has already dropped
+        # its own copy, and its fills since then are current.
+        self.sender = secrets.token_hex(8)
+
+        # Its own connection, with no read timeout: it idles between messages.
+        self._redis = Redis.from_url(location, **(options | {"socket_timeout": None}))
+        threading.Thread(
+            target=self._listen, name="cache-invalidation", daemon=True
+        ).start()
+
+    def get(self, key: str) -> Any:
+        if not self.live:
+            return MISSING
+        with self._lock:
+            if (entry := self._entries.get(key)) is None:
+                return MISSING
+            if entry[0] <= time.monotonic():
+                self._pop(key)
+                return MISSING
+            self._entries.move_to_end(key)
+        return pickle.loads(entry[1])
+
+    def fill(self, key: str, value: Any, generation: int) -> None:
+        data = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        # One large value mustn't flush the whole tier.
+        if len(data) > self.max_bytes // 16:
+            return
+        with self._lock:
+            if not self.live or generation != self.generation:
+                return
+            self._pop(key)
+            self._entries[key] = (time.monotonic() + self.timeout, data)
+            self._bytes += len(data)
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+
+    def discard(self, keys: list[str]) -> None:
+        with self._lock:
+            self.generation += 1
+            for key in keys:
+                self._pop(key)
+
+    def discard_matching(self, pattern: str) -> None:
+        with self._lock:
+            self.generation += 1
+            for key in [key for key in self._entries if fnmatchcase(key, pattern)]:
+                self._pop(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.generation += 1
+            self._entries.clear()
+            self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _pop(self, key: str) -> None:
+        if (entry := self._entries.pop(key, None)) is not None:
+            self._bytes -= len(entry[1])
+
+    def apply(self, message: dict[str, Any]) -> None:
+        if "keys" in message:
+            self.discard(message["keys"])
+        elif "match" in message:
+            self.discard_matching(message["match"])
+        else:
+            self.clear()
+
+    def _listen(self) -> None:
+        while True:
+            try:
+                pubsub = self._redis.pubsub()
+                pubsub.subscribe(CHANNEL)
+                for message in pubsub.listen():
+                    if message["type"] == "subscribe":
+                        # Anything may have changed while unsubscribed.
+                        self.clear()
+                        self.live = True
+                    elif message["type"] == "message":
+                        data = json.loads(message["data"])
+                        if data.get("sender") != self.sender:
+                            self.apply(data)
+            except (RedisError, OSError):
+                logger.warning("Cache invalidation listener lost Redis; retrying.")
+            self.live = False
+            self.clear()
+            time.sleep(1)
+
+
+_tiers: dict[tuple[str, str], LocalTier] = {}
+_tiers_lock = threading.Lock()
+# A forked child has none of its parent's threads, so no listener.
+os.register_at_fork(after_in_child=_tiers.clear)
+
+
+class TwoTierCache(RedisCache):
+    """The Redis cache, read through this process's LocalTier.
+
+    CACHES["hot"]["LOCAL"] sizes the tier: MAX_ENTRIES, MAX_BYTES and
+    TIMEOUT (seconds).
+    """
+
+    def __init__(self, server: str, params: dict[str, Any]) -> None:
+        super().__init__(server, params)
+        self._local_params: dict[str, Any] = params.get("LOCAL", {})
+
+    @property
+    def local(self) -> LocalTier:
+        # Shared by every thread's instance of this alias.
+        name = (self._servers[0], self.key_prefix)
+        if (tier := _tiers.get(name)) is None:
+            with _tiers_lock:
+                if (tier := _tiers.get(name)) is None:
+                    tier = _tiers[name] = LocalTier(
+                        self._servers[0], self._options, self._local_params
+                    )
+        return tier
+
+    def _local_get(self, key: Any, version: Any) -> Any:
+        started = time.perf_counter()
+        value = self.local.get(self.make_and_validate_key(key, version=version))
+        if value is not MISSING:
+            record_cache(started, hits=1, round_trips=0)
+        return value
+
+    def get(self, key: Any, default: Any = None, version: Any = None) -> Any:
+        if (value := self._local_get(key, version)) is not MISSING:
+            return value
+        generation = self.local.generation
+        if (value := super().get(key, MISSING, version)) is MISSING:
+            return default
+        self.local.fill(self.make_key(key, version=version), value, generation)
+        return value
+
+    async def aget(self, key: Any, default: Any = None, version: Any = None) -> Any:
+        # Hits skip the thread hop too.
+        if (value := self._local_get(key, version)) is not MISSING:
+            return value
+        return await super().aget(key, default, version)
+
+    def _split(self, keys: Any, version: Any) -> tuple[dict[Any, Any], list[Any]]:
+        started = time.perf_counter()
+        found: dict[Any, Any] = {}
+        remote: list[Any] = []
+        for key in dict.fromkeys(keys):
+            value = self.local.get(self.make_and_validate_key(key, version=version))
+            if value is MISSING:
+                remote.append(key)
+            else:
+                found[key] = value
+        if found:
+            record_cache(started, hits=len(found), round_trips=0)
+        return found, remote
+
+    def get_many(self, keys: Any, version: Any = None) -> dict[Any, Any]:
+        found, remote = self._split(keys, version)
+        if remote:
+            generation = self.local.generation
+            fetched = super().get_many(remote, version)
+            for key, value in fetched.items():
+                self.local.fill(self.make_key(key, version=version), value, generation)
+            found |= fetched
+        return found
+
+    async def aget_many(self, keys: Any, version: Any = None) -> dict[Any, Any]:
+        found, remote = self._split(keys, version)
+        if remote:
+            found |= await super().aget_many(remote, version)
+        return found
+
+    def _publish(self, message: dict[str, Any]) -> None:
+        """Drop the keys here, then in every other process."""
+
+        self.local.apply(message)
+        started = time.perf_counter()
+        try:
+            self._cache.get_client(write=True).publish(
+                CHANNEL, json.dumps(message | {"sender": self.local.sender})
+            )
+        finally:
+            record_cache(started)
+
+    def _changed(self, keys: Any, version: Any) -> None:
+        if keys:
+            self._publish(
+                {"keys": [self.make_key(key, version=version) for key in keys]}
+            )
+
+    def set(
+        self, key: Any, value: Any, timeout: Any = DEFAULT_TIMEOUT, version: Any = None
+    ) -> None:
+        super().set(key, value, timeout, version)
+        self._changed([key], version)
+
+    def set_many(
+        self, data: Any, timeout: Any = DEFAULT_TIMEOUT, version: Any = None
+    ) -> list[Any]:
+        failed = super().set_many(data, timeout, version)
+        self._changed(data, version)
+        return failed
+
+    # A value read through from the database is what every other process
+    # would read too, or their copy expires within the LOCAL TIMEOUT: no
+    # PUBLISH, and no generation bump to drop their own fills in flight.
+    # This process's copy is replaced, for an early refresh.
+    def fill(
+        self, key: Any, value: Any, timeout: Any = DEFAULT_TIMEOUT, version: Any = None
+    ) -> None:
+        self.fill_many({key: value}, timeout, version)
+
+    def fill_many(
+        self, data: Any, timeout: Any = DEFAULT_TIMEOUT, version: Any = None
+    ) -> list[Any]:
+        generation = self.local.generation
+        failed = super().set_many(data, timeout, version)
+        for key, value in data.items():
+            if key not in failed:
+                self.local.fill(self.make_key(key, version=version), value, generation)
+        return failed
+
+    def add(
+        self, key: Any, value: Any, timeout: Any = DEFAULT_TIMEOUT, version: Any = None
+    ) -> Any:
+        if added := super().add(key, value, timeout, version):
+            self._changed([key], version)
+        return added
+
+    def incr(self, key: Any, delta: int = 1, version: Any = None) -> Any:
+        value = super().incr(key, delta, version)
+        self._changed([key], version)
+        return value
+
+    def delete(self, key: Any, version: Any = None) -> Any:
+        deleted = super().delete(key, version)
+        self._changed([key], version)
+        return deleted
+
+    def delete_many(self, keys: Any, version: Any = None) -> None:
+        keys = list(keys)
+        super().delete_many(keys, version)
+        self._changed(keys, version)
+
+    def delete_matching(self, pattern: str, version: Any = None) -> None:
+        """Delete every key matching a glob `pattern`, in Redis and every process."""
+
+        pattern = self.make_key(pattern, version=version)
+        redis = self._cache.get_client(write=True)
+        for keys in batched(redis.scan_iter(match=pattern, count=1000), 500):
+            redis.unlink(*keys)
+        self._publish({"match": pattern})
+
+    def clear(self) -> Any:
+        cleared = super().clear()
+        self._publish({"clear": True})
+        return cleared
@@ -0,0 +1,23 @@
+from django.db import connections
+
+
+def pool_stats(alias: str = "default") -> dict[str, int | float]:
+    """This process's connection pool counters, plus the derived ones worth watching.
+
+    psycopg_pool counts connection attempts but not closes; every connection
+    it opened is either still in the pool or has been closed.
+    """
+
+    if (pool := connections[alias].pool) is None:  # pyright: ignore[reportAttributeAccessIssue]
+        return {}
+
+    stats = pool.get_stats()
+    opened = stats.get("connections_num", 0) - stats.get("connections_errors", 0)
+    requests = stats.get("requests_num", 0)
+    return stats | {
+        "connections_opened": opened,
+        "connections_closed": opened - stats.get("pool_size", 0),
+        "requests_wait_ms_avg": (
+            round(stats.get("requests_wait_ms", 0) / requests, 3) if requests else 0.0
+        ),
+    }
@@ -0,0 +1,32 @@
+import atexit
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from django.utils.functional import SimpleLazyObject, empty
+
+
+class Once(SimpleLazyObject):
+    """A SimpleLazyObject that builds its object once, however many threads
+    reach for it first."""
+
+    def __init__(self, func: Any) -> None:
+        self.__dict__["_lock"] = threading.Lock()
+        super().__init__(func)
+
+    def _setup(self) -> None:
+        with self.__dict__["_lock"]:
+            if self._wrapped is empty:
+                super()._setup()
+
+
+def lazy(**kwargs: Any) -> ThreadPoolExecutor:
+    """A ThreadPoolExecutor(**kwargs) made on first use, so importing settings
+    (or preloading the app before gunicorn forks) starts nothing."""
+
+    def build() -> ThreadPoolExecutor:
+        pool = ThreadPoolExecutor(**kwargs)
+        atexit.register(pool.shutdown, wait=True)
+        return pool
+
+    return Once(build)  # pyright: ignore[reportReturnType]
@@ -0,0 +1,48 @@
+import threading
+from collections.abc import Iterator
+from socket import gethostbyname_ex, gethostname
+from typing import Any
+
+
+class MachineHosts(list[str]):
+    """The given hosts, then this machine's hostname and addresses, which the
+    PaaS sends internal traffic to.
+
+    Looked up on first use, at the first request, rather than when settings
+    are imported: a DNS lookup there delays every worker's boot. A list,
+    since Django insists ALLOWED_HOSTS is one.
+    """
+
+    def __init__(self, *hosts: str) -> None:
+        super().__init__(hosts)
+        self._lock = threading.Lock()
+        self._resolved = False
+
+    def _resolve(self) -> None:
+        if self._resolved:
+            return
+        with self._lock:
+            if self._resolved:
+                return
+            try:
+                hostname = gethostname()
+                self.extend([hostname, *set(gethostbyname_ex(hostname)[2])])
+            except OSError:
+                pass
+            self._resolved = True
+
+    def __iter__(self) -> Iterator[str]:
+        self._resolve()
+        return super().__iter__()
+
+    def __len__(self) -> int:
+        self._resolve()
+        return super().__len__()
+
+    def __contains__(self, host: object) -> bool:
+        self._resolve()
+        return super().__contains__(host)
+
+    def __getitem__(self, index: Any) -> Any:
+        self._resolve()
+        return super().__getitem__(index)
@@ -0,0 +1,78 @@
+"""Per-request counters filled in by the database, cache and template hooks.
+
+TimingMiddleware wraps each request in measure(); the hooks are no-ops
+outside it. record_sql is on every database connection, see afromart.signals.
+"""
+
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from typing import Any
+
+
+@dataclass(slots=True)
+class Metrics:
+    total_ms: float = 0.0
+    sql_count: int = 0
+    sql_ms: float = 0.0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    cache_round_trips: int = 0
+    cache_ms: float = 0.0
+    template_ms: float = 0.0
+
+    def as_dict(self) -> dict[str, int | float]:
+        return {
+            name: round(value, 3) if isinstance(value, float) else value
+            for name, value in asdict(self).items()
+        }
+
+
+current: ContextVar[Metrics | None] = ContextVar("metrics", default=None)
+
+
+@contextmanager
+def measure() -> Iterator[Metrics]:
+    """Collect Metrics for the code run inside, including in sync_to_async threads."""
+
+    metrics = Metrics()
+    token = current.set(metrics)
+    started = time.perf_counter()
+    try:
+        yield metrics
+    finally:
+        metrics.total_ms = (time.perf_counter() - started) * 1000
+        current.reset(token)
+
+
+def record_sql(
+    execute: Callable[..., Any], sql: str, params: Any, many: bool, context: Any
+) -> Any:
+    """A connection.execute_wrapper counting and timing measured queries."""
+
+    if (metrics := current.get()) is None:
+        return execute(sql, params, many, context)
+
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        metrics.sql_count += 1
+        metrics.sql_ms += (time.perf_counter() - started) * 1000
+
+
+def record_cache(
+    started: float, *, hits: int = 0, misses: int = 0, round_trips: int = 1
+) -> None:
+    if metrics := current.get():
+        metrics.cache_ms += (time.perf_counter() - started) * 1000
+        metrics.cache_hits += hits
+        metrics.cache_misses += misses
+        metrics.cache_round_trips += round_trips
+
+
+def record_template(started: float) -> None:
+    if metrics := current.get():
+        metrics.template_ms += (time.perf_counter() - started) * 1000
@@ -0,0 +1,45 @@
+from ..redis import connection, namespaced
+from . import Metrics
+
+VIEWS = namespaced("timing", "views")
+
+
+def key(view: str) -> str:
+    return namespaced("timing", "view", view)
+
+
+def add(view: str, metrics: Metrics) -> None:
+    """Fold one sampled request into its view's running totals."""
+
+    pipeline = connection().pipeline(transaction=False)
+    pipeline.sadd(VIEWS, view)
+    pipeline.hincrby(key(view), "requests", 1)
+    for field, value in metrics.as_dict().items():
+        if isinstance(value, int):
+            pipeline.hincrby(key(view), field, value)
+        else:
+            pipeline.hincrbyfloat(key(view), field, value)
+    pipeline.execute()
+
+
+def report() -> dict[str, dict[str, float]]:
+    """Per-view averages over the sampled requests, keyed by view name."""
+
+    views = sorted(view.decode() for view in connection().smembers(VIEWS))
+    pipeline = connection().pipeline(transaction=False)
+    for view in views:
+        pipeline.hgetall(key(view))
+
+    averages: dict[str, dict[str, float]] = {}
+    for view, totals in zip(views, pipeline.execute()):
+        totals = {field.decode(): float(value) for field, value in totals.items()}
+        if requests := totals.pop("requests", 0):
+            averages[view] = {"requests": requests} | {
+                field: value / requests for field, value in totals.items()
+            }
+    return averages
+
+
+def reset() -> None:
+    views = [view.decode() for view in connection().smembers(VIEWS)]
+    connection().delete(VIEWS, *(key(view) for view in views))
@@ -0,0 +1,121 @@
+import time
+from typing import Any
+
+from asgiref.sync import sync_to_async
+from django.core.cache.backends import redis
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+
+from . import record_cache
+
+MISSING = object()
+
+
+class RedisCache(redis.RedisCache):
+    """Django's Redis cache, reporting hits, misses and time to the request.
+
+    The async API goes through these sync methods, so it's counted too.
+    BaseCache's async *_many methods loop over the keys, a round trip each;
+    here they're one MGET, pipeline or DEL like the sync ones.
+    """
+
+    def get(self, key: Any, default: Any = None, version: Any = None) -> Any:
+        started = time.perf_counter()
+        value = super().get(key, MISSING, version)
+        if value is MISSING:
+            record_cache(started, misses=1)
+            return default
+        record_cache(started, hits=1)
+        return value
+
+    def get_many(self, keys: Any, version: Any = None) -> dict[Any, Any]:
+        keys = list(keys)
+        started = time.perf_counter()
+        found = super().get_many(keys, version)
+        record_cache(started, hits=len(found), misses=len(set(keys)) - len(found))
+        return found
+
+    async def aget_many(self, keys: Any, version: Any = None) -> dict[Any, Any]:
+        return await sync_to_async(self.get_many)(keys, version)
+
+    def add(self, *args: Any, **kwargs: Any) -> Any:
+        started = time.perf_counter()
+        try:
+            return super().add(*args, **kwargs)
+        finally:
+            record_cache(started)
+
+    def set(self, *args: Any, **kwargs: Any) -> None:
+        started = time.perf_counter()
+        try:
+            super().set(*args, **kwargs)
+        finally:
+            record_cache(started)
+
+    def set_many(self, *args: Any, **kwargs: Any) -> list[Any]:
+        started = time.perf_counter()
+        try:
+            return super().set_many(*args, **kwargs)
+        finally:
+            record_cache(started)
+
+    async def aset_many(self, *args: Any, **kwargs: Any) -> list[Any]:
+        return await sync_to_async(self.set_many)(*args, **kwargs)
+
+    def fill(
+        self, key: Any, value: Any, timeout: Any = DEFAULT_TIMEOUT, version: Any = None
+    ) -> None:
+        """Store a value just read through from the database.
+
+        A set, here; TwoTierCache doesn't announce it to the other processes.
+        """
+
+        self.set(key, value, timeout, version)
+
+    def fill_many(
+        self, data: Any, timeout: Any = DEFAULT_TIMEOUT, version: Any = None
+    ) -> list[Any]:
+        return self.set_many(data, timeout, version)
+
+    async def afill(self, *args: Any, **kwargs: Any) -> None:
+        await sync_to_async(self.fill)(*args, **kwargs)
+
+    async def afill_many(self, *args: Any, **kwargs: Any) -> list[Any]:
+        return await sync_to_async(self.fill_many)(*args, **kwargs)
+
+    def touch(self, *args: Any, **kwargs: Any) -> Any:
+        started = time.perf_counter()
+        try:
+            return super().touch(*args, **kwargs)
+        finally:
+            record_cache(started)
+
+    def delete(self, *args: Any, **kwargs: Any) -> Any:
+        started = time.perf_counter()
+        try:
+            return super().delete(*args, **kwargs)
+        finally:
+            record_cache(started)
+
+    def delete_many(self, *args: Any, **kwargs: Any) -> None:
+        started = time.perf_counter()
+        try:
+            super().delete_many(*args, **kwargs)
+        finally:
+            record_cache(started)
+
+    async def adelete_many(self, *args: Any, **kwargs: Any) -> None:
+        await sync_to_async(self.delete_many)(*args, **kwargs)
+
+    def has_key(self, *args: Any, **kwargs: Any) -> Any:
+        started = time.perf_counter()
+        try:
+            return super().has_key(*args, **kwargs)
+        finally:
+            record_cache(started)
+
+    def incr(self, *args: Any, **kwargs: Any) -> Any:
+        started = time.perf_counter()
+        try:
+            return super().incr(*args, **kwargs)
+        finally:
+            record_cache(started)
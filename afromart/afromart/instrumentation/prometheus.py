@@ -0,0 +1,113 @@
+"""Prometheus metrics, shared across gunicorn workers.
+
+With PROMETHEUS_MULTIPROC_DIR set (see gunicorn.conf.py) every worker writes
+to its own mmapped files in that directory and the /metrics view merges them,
+so one scrape gives machine-wide numbers. Each update is an mmap write of a
+few microseconds.
+"""
+
+import os
+from functools import cache
+from typing import Any
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+from prometheus_client.multiprocess import MultiProcessCollector
+
+from . import Metrics
+
+LATENCY_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 10.0,
+)  # fmt: skip
+
+REQUEST_SECONDS = Histogram(
+    "afromart_request_seconds",
+    "Request latency by view.",
+    ("view", "method"),
+    buckets=LATENCY_BUCKETS,
+)
+RESPONSES = Counter(
+    "afromart_responses", "Responses by view and status.", ("view", "status")
+)
+IN_FLIGHT = Gauge(
+    "afromart_requests_in_flight",
+    "Requests being handled.",
+    multiprocess_mode="livesum",
+)
+DB_QUERIES = Counter("afromart_db_queries", "SQL queries by view.", ("view",))
+DB_SECONDS = Counter("afromart_db_seconds", "Time in SQL by view.", ("view",))
+CACHE_HITS = Counter("afromart_cache_hits", "Cache hits by view.", ("view",))
+CACHE_MISSES = Counter("afromart_cache_misses", "Cache misses by view.", ("view",))
+CACHE_SECONDS = Counter(
+    "afromart_cache_seconds", "Time in the cache by view.", ("view",)
+)
+PRODUCT_CACHE = Counter(
+    "afromart_product_cache_reads",
+    "product.cache reads by outcome: hit, miss or early (an XFetch refresh).",
+    ("outcome",),
+)
+# Anything else is labelled "other": clients choose the method, and each
+# label value is another series, and another entry in children's cache.
+METHODS = frozenset(("GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"))
+
+
+@cache
+def children(view: str, method: str) -> tuple[Any, ...]:
+    # .labels() costs more than the update itself; views and methods are few.
+    return (
+        REQUEST_SECONDS.labels(view, method),
+        DB_QUERIES.labels(view),
+        DB_SECONDS.labels(view),
+        CACHE_HITS.labels(view),
+        CACHE_MISSES.labels(view),
+        CACHE_SECONDS.labels(view),
+    )
+
+
+@cache
+def responses(view: str, status: int) -> Any:
+    return RESPONSES.labels(view, str(status))
+
+
+def observe(view: str, method: str, status: int, metrics: Metrics) -> None:
+    seconds, db_queries, db_seconds, cache_hits, cache_misses, cache_seconds = children(
+        view, method if method in METHODS else "other"
+    )
+    seconds.observe(metrics.total_ms / 1000)
+    responses(view, status).inc()
+    if metrics.sql_count:
+        db_queries.inc(metrics.sql_count)
+        db_seconds.inc(metrics.sql_ms / 1000)
+    if metrics.cache_hits or metrics.cache_misses:
+        cache_hits.inc(metrics.cache_hits)
+        cache_misses.inc(metrics.cache_misses)
+        cache_seconds.inc(metrics.cache_ms / 1000)
+
+
+@cache
+def product_cache(outcome: str) -> Any:
+    return PRODUCT_CACHE.labels(outcome)
+
+
+def observe_product_cache(*, hits: int, misses: int, early: int) -> None:
+    for outcome, count in (("hit", hits), ("miss", misses), ("early", early)):
+        if count:
+            product_cache(outcome).inc(count)
+
+
+def exposition() -> tuple[bytes, str]:
+    """Every worker's metrics in the text format, and its content type."""
+
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
@@ -0,0 +1,25 @@
+import time
+from typing import Any
+
+from django.template.backends import django
+
+from . import record_template
+
+
+class Template(django.Template):
+    def render(self, context: Any = None, request: Any = None) -> str:
+        started = time.perf_counter()
+        try:
+            return super().render(context, request)
+        finally:
+            record_template(started)
+
+
+class DjangoTemplates(django.DjangoTemplates):
+    """The Django template backend, reporting render time to the request."""
+
+    def from_string(self, template_code: str) -> Template:
+        return Template(super().from_string(template_code).template, self)
+
+    def get_template(self, template_name: str) -> Template:
+        return Template(super().get_template(template_name).template, self)
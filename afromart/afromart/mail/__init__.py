@@ -0,0 +1,3 @@
+from .queue import aenqueue, drain, enqueue, stats
+
+__all__ = ("aenqueue", "drain", "enqueue", "stats")
@@ -0,0 +1,33 @@
+import json
+import os
+from functools import cache
+from typing import Any
+
+from django.core.mail.backends import smtp
+
+
+@cache
+def credentials() -> dict[str, Any]:
+    """EMAIL_CREDENTIALS, the JSON {"host", "username", "password"} the
+    deployment provides, read when the first message goes out."""
+
+    return json.loads(os.getenv("EMAIL_CREDENTIALS", "{}"))
+
+
+class EmailBackend(smtp.EmailBackend):
+    """Django's SMTP backend, taking its server and login from credentials()
+    rather than from settings."""
+
+    def __init__(
+        self,
+        host: str | None = None,
+        username: str | None = None,
+        password: str | None = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(
+            host=host or credentials().get("host"),
+            username=username or credentials().get("username"),
+            password=password or credentials().get("password"),
+            **kwargs,
+        )
@@ -0,0 +1,78 @@
+from argparse import ArgumentParser
+from itertools import cycle
+from typing import Any
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.test import Client, override_settings
+from django.urls import reverse
+
+from product.models import Product
+
+from ... import benchmark
+from ...instrumentation import measure
+
+
+class Command(BaseCommand):
+    help = (
+        "Request hot pages with the 'hot' cache on Redis alone, then with the "
+        "per-process tier in front, and report cache round trips per request."
+    )
+
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        parser.add_argument("--requests", type=int, default=500)
+        parser.add_argument(
+            "--products", type=int, default=50, help="Distinct detail pages to cycle."
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        ids = list(Product.objects.values_list("id", flat=True)[: options["products"]])
+        if not ids:
+            raise CommandError("No products; import or seed some first.")
+
+        paths = {
+            "catalog": [reverse("product:catalog")],
+            "catalog ?tag=kente": [reverse("product:catalog") + "?tag=kente"],
+            "detail": [
+                reverse("product:detail", args=[product_id]) for product_id in ids
+            ],
+        }
+        redis_only = settings.CACHES["hot"] | {
+            "BACKEND": "afromart.instrumentation.cache.RedisCache"
+        }
+        redis_only.pop("LOCAL")
+
+        for label, hot in (
+            ("redis", redis_only),
+            ("two-tier", settings.CACHES["hot"]),
+        ):
+            # TimingMiddleware would measure each request itself, into its
+            # own Metrics.
+            with override_settings(
+                CACHES=settings.CACHES | {"hot": hot},
+                MIDDLEWARE=[
+                    middleware
+                    for middleware in settings.MIDDLEWARE
+                    if middleware != "afromart.middleware.TimingMiddleware"
+                ],
+            ):
+                for page, urls in paths.items():
+                    self.measure(f"{label}: {page}", urls, options["requests"])
+
+    def measure(self, name: str, urls: list[str], requests: int) -> None:
+        client = Client()
+        for url in urls:  # Warm both tiers.
+            client.get(url)
+
+        round_trips = 0
+        pages = cycle(urls)
+
+        def get() -> bool:
+            nonlocal round_trips
+            with measure() as metrics:
+                response = client.get(next(pages))
+            round_trips += metrics.cache_round_trips
+            return response.status_code == 200
+
+        result = benchmark.run(name, get, concurrency=1, requests=requests)
+        self.stdout.write(f"{result}  {round_trips / requests:.2f} round trips/request")
@@ -0,0 +1,177 @@
+import os
+import socket
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from argparse import ArgumentParser
+from pathlib import Path
+from typing import Any
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from ... import benchmark
+
+
+def free_port() -> int:
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+
+def tree(pid: int) -> list[int]:
+    """`pid` and its descendants, from /proc."""
+
+    parents: dict[int, list[int]] = {}
+    for stat in Path("/proc").glob("[0-9]*/stat"):
+        try:
+            # The command name is parenthesised and may hold spaces.
+            fields = stat.read_text().rpartition(")")[2].split()
+        except OSError:
+            continue
+        parents.setdefault(int(fields[1]), []).append(int(stat.parent.name))
+
+    found, pending = [], [pid]
+    while pending:
+        found.append(current := pending.pop())
+        pending += parents.get(current, [])
+    return found
+
+
+def memory_mb(pid: int) -> tuple[float, float]:
+    """RSS and PSS of `pid` and its workers; PSS counts shared pages once."""
+
+    totals = {"Rss:": 0, "Pss:": 0}
+    for process in tree(pid):
+        try:
+            rollup = Path(f"/proc/{process}/smaps_rollup").read_text()
+        except OSError:
+            continue
+        for line in rollup.splitlines():
+            name, _, value = line.partition(" ")
+            if name in totals:
+                totals[name] += int(value.split()[0])
+    return totals["Rss:"] / 1024, totals["Pss:"] / 1024
+
+
+class Command(BaseCommand):
+    help = (
+        "Start gunicorn at each workers × threads shape, load one path over HTTP "
+        "and report throughput, time to the first answer and the machine memory "
+        "it took."
+    )
+
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        parser.add_argument(
+            "--matrix",
+            nargs="+",
+            default=["4x4", "2x8", "1x16", "1x32"],
+            metavar="WORKERSxTHREADS",
+        )
+        parser.add_argument("--path", default="/")
+        parser.add_argument("--requests", type=int, default=2000)
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=32,
+            help="Client threads, the same for every shape.",
+        )
+        parser.add_argument(
+            "--no-preload",
+            action="store_true",
+            help="GUNICORN_PRELOAD=0: each worker imports the app itself.",
+        )
+        parser.add_argument(
+            "--history", type=Path, help="Also append the results to this history."
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        if not Path("/proc/self/smaps_rollup").exists():
+            raise CommandError("Memory is read from /proc; run this on Linux.")
+
+        gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+        self.stdout.write(
+            f"Python {sys.version.split()[0]}, GIL {'on' if gil else 'off'}, "
+            f"{os.process_cpu_count()} cores"
+        )
+
+        results: list[dict[str, Any]] = []
+        for shape in options["matrix"]:
+            workers, _, threads = shape.partition("x")
+            if not (workers.isdigit() and threads.isdigit()):
+                raise CommandError(f"Expected WORKERSxTHREADS, got {shape!r}.")
+            results.append(self.measure(int(workers), int(threads), options))
+
+        if options["history"] and results:
+            benchmark.record(options["history"], results)
+
+    def measure(
+        self, workers: int, threads: int, options: dict[str, Any]
+    ) -> dict[str, Any]:
+        port = free_port()
+        url = f"http://127.0.0.1:{port}{options['path']}"
+        preload = "0" if options["no_preload"] else "1"
+        started = time.perf_counter()
+        server = subprocess.Popen(
+            [
+                sys.executable,
+                "-m",
+                "gunicorn",
+                "afromart.wsgi:application",
+                f"--bind=127.0.0.1:{port}",
+            ],
+            cwd=settings.BASE_DIR,
+            env=os.environ
+            | {
+                "GUNICORN_WORKERS": str(workers),
+                "GUNICORN_THREADS": str(threads),
+                "GUNICORN_PRELOAD": preload,
+            },
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        try:
+            self.wait_until_up(url, server)
+            # Until the first answer: the master's boot, then a worker's.
+            cold_start_ms = (time.perf_counter() - started) * 1000
+            _, idle_pss = memory_mb(server.pid)
+            result = benchmark.run(
+                f"{workers}x{threads} GET {options['path']}",
+                benchmark.http_get(url),
+                concurrency=options["concurrency"],
+                requests=options["requests"],
+            )
+            rss, pss = memory_mb(server.pid)
+        finally:
+            server.terminate()
+            server.wait(timeout=30)
+
+        self.stdout.write(
+            f"{result}  cold start={cold_start_ms:.0f}ms, idle pss={idle_pss:.0f}MB, "
+            f"loaded rss={rss:.0f}MB pss={pss:.0f}MB"
+        )
+        return result.as_dict() | {
+            "workers": workers,
+            "threads": threads,
+            "preload": preload == "1",
+            "cold_start_ms": round(cold_start_ms, 1),
+            "idle_pss_mb": round(idle_pss, 1),
+            "rss_mb": round(rss, 1),
+            "pss_mb": round(pss, 1),
+        }
+
+    def wait_until_up(self, url: str, server: subprocess.Popen[bytes]) -> None:
+        deadline = time.monotonic() + 60
+        while time.monotonic() < deadline:
+            if server.poll() is not None:
+                raise CommandError(f"gunicorn exited with {server.returncode}.")
+            try:
+                with urllib.request.urlopen(url, timeout=5):
+                    return
+            except urllib.error.HTTPError:
+                return  # Up, if unhappy; the run will count the errors.
+            except OSError:
+                time.sleep(0.25)
+        raise CommandError(f"{url} didn't answer within a minute.")
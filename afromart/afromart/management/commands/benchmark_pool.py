@@ -0,0 +1,58 @@
+from argparse import ArgumentParser
+from typing import Any
+
+import psycopg
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from ... import benchmark
+from ...db import pool_stats
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare a fresh connection per request (the handshake CONN_MAX_AGE "
+        "churn paid) with checking one out of the pool; optionally load a URL."
+    )
+
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        parser.add_argument("--requests", type=int, default=2000)
+        parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16])
+        parser.add_argument(
+            "--url", help="Also load this URL, e.g. a page that queries the database."
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        if (pool := connection.pool) is None:  # pyright: ignore[reportAttributeAccessIssue]
+            raise CommandError('DATABASES["default"]["OPTIONS"]["pool"] is not set.')
+        pool.open(wait=True)
+        params = connection.get_connection_params()
+
+        def connect() -> bool:
+            with psycopg.connect(**params) as fresh:
+                fresh.execute("SELECT 1")
+            return True
+
+        def checkout() -> bool:
+            with pool.connection() as pooled:
+                pooled.execute("SELECT 1")
+            return True
+
+        calls = {"connect per request": connect, "pool checkout": checkout}
+        if options["url"]:
+            calls["GET " + options["url"]] = benchmark.http_get(options["url"])
+
+        for concurrency in options["concurrency"]:
+            for name, call in calls.items():
+                self.stdout.write(
+                    str(
+                        benchmark.run(
+                            name,
+                            call,
+                            concurrency=concurrency,
+                            requests=options["requests"],
+                        )
+                    )
+                )
+
+        self.stdout.write(str(pool_stats()))
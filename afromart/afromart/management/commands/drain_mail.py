@@ -0,0 +1,33 @@
+from argparse import ArgumentParser
+from typing import Any
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from afromart import mail
+
+
+class Command(BaseCommand):
+    help = "Send queued outbound email. Run exactly one per deployment."
+
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        parser.add_argument("--batch-size", type=int, default=50)
+        parser.add_argument(
+            "--once", action="store_true", help="Exit once the queue is empty."
+        )
+        parser.add_argument(
+            "--stats", action="store_true", help="Print queue depth and counters."
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        if options["stats"]:
+            for name, value in mail.stats().items():
+                self.stdout.write(f"{name}: {value}")
+            return
+
+        sent = mail.drain(
+            batch_size=options["batch_size"],
+            once=options["once"],
+            report=settings.LOGGER.info,
+        )
+        self.stdout.write(f"Sent {sent} emails.")
@@ -0,0 +1,104 @@
+import os
+import subprocess
+import sys
+from argparse import ArgumentParser
+from collections import defaultdict
+from pathlib import Path
+from typing import Any
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from ... import benchmark
+
+# What a worker does before it can answer: import the WSGI app, which runs
+# django.setup(), then load the URLconf, which the first request would.
+BOOT = """
+import time
+started = time.perf_counter()
+import afromart.wsgi
+{urls}
+print((time.perf_counter() - started) * 1000)
+"""
+URLS = "from django.urls import get_resolver; get_resolver().url_patterns"
+
+
+class Command(BaseCommand):
+    help = (
+        "Boot the app in fresh interpreters, as a gunicorn worker would without "
+        "--preload, and report the boot time and the slowest imports."
+    )
+
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        parser.add_argument("--top", type=int, default=25)
+        parser.add_argument(
+            "--runs", type=int, default=5, help="Boots to time; the fastest counts."
+        )
+        parser.add_argument(
+            "--no-urls",
+            action="store_true",
+            help="Stop after django.setup(), without importing the URLconf.",
+        )
+        parser.add_argument(
+            "--history", type=Path, help="Also append the boot time to this history."
+        )
+
+    def boot(self, *flags: str, urls: bool) -> subprocess.CompletedProcess[str]:
+        booted = subprocess.run(
+            [sys.executable, *flags, "-c", BOOT.format(urls=URLS if urls else "")],
+            cwd=settings.BASE_DIR,
+            env=os.environ | {"DJANGO_SETTINGS_MODULE": "afromart.settings"},
+            capture_output=True,
+            text=True,
+        )
+        if booted.returncode:
+            raise CommandError(f"The app failed to boot:\n{booted.stderr}")
+        return booted
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        urls = not options["no_urls"]
+        boots = [
+            float(self.boot(urls=urls).stdout.split()[-1])
+            for _ in range(options["runs"])
+        ]
+        cold_start_ms = min(boots)
+        self.stdout.write(
+            f"Boot: {cold_start_ms:.0f}ms (best of {len(boots)}, worst "
+            f"{max(boots):.0f}ms)"
+        )
+
+        # -X importtime slows imports down, so it only ranks them.
+        imports: list[tuple[int, int, str]] = []
+        for line in self.boot("-X", "importtime", urls=urls).stderr.splitlines():
+            if not line.startswith("import time:") or "|" not in line:
+                continue
+            own, cumulative, name = line.removeprefix("import time:").split("|")
+            if own.strip().isdigit():
+                imports.append((int(own), int(cumulative), name.rstrip()))
+
+        packages: dict[str, int] = defaultdict(int)
+        for own, _, name in imports:
+            packages[name.strip().partition(".")[0]] += own
+        total = sum(packages.values()) or 1
+
+        self.stdout.write(f"\n{'self ms':>8} {'cumulative':>10}  module")
+        for own, cumulative, name in sorted(imports, reverse=True)[: options["top"]]:
+            self.stdout.write(f"{own / 1000:>8.1f} {cumulative / 1000:>10.1f}  {name}")
+
+        self.stdout.write(f"\n{'self ms':>8} {'share':>10}  package")
+        for package, own in sorted(
+            packages.items(), key=lambda item: item[1], reverse=True
+        )[: options["top"]]:
+            self.stdout.write(f"{own / 1000:>8.1f} {own / total:>10.0%}  {package}")
+
+        if options["history"]:
+            benchmark.record(
+                options["history"],
+                [
+                    {
+                        "name": "boot" if urls else "boot without URLconf",
+                        "concurrency": 1,
+                        "cold_start_ms": round(cold_start_ms, 1),
+                    }
+                ],
+            )
@@ -0,0 +1,40 @@
+from argparse import ArgumentParser
+from typing import Any
+
+from django.core.management.base import BaseCommand
+
+from ...instrumentation import Metrics, aggregates
+
+COLUMNS = ("requests", *Metrics.__dataclass_fields__)
+
+
+class Command(BaseCommand):
+    help = "Show per-view averages of the sampled request timings."
+
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        parser.add_argument(
+            "--sort", choices=COLUMNS, default="total_ms", help="Column to sort by."
+        )
+        parser.add_argument(
+            "--reset", action="store_true", help="Clear the aggregates afterwards."
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        report = aggregates.report()
+        width = max((len(view) for view in report), default=4)
+
+        self.stdout.write(
+            f"{'view':<{width}} " + " ".join(f"{column:>12}" for column in COLUMNS)
+        )
+        for view, averages in sorted(
+            report.items(),
+            key=lambda item: item[1].get(options["sort"], 0),
+            reverse=True,
+        ):
+            self.stdout.write(
+                f"{view:<{width}} "
+                + " ".join(f"{averages.get(column, 0):>12.2f}" for column in COLUMNS)
+            )
+
+        if options["reset"]:
+            aggregates.reset()
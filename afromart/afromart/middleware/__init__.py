@@ -0,0 +1,4 @@
+from .static import StaticFilesMiddleware
+from .timing import TimingMiddleware
+
+__all__ = ("StaticFilesMiddleware", "TimingMiddleware")
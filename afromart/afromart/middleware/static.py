@@ -0,0 +1,138 @@
+import mimetypes
+import os
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.http import FileResponse, HttpRequest, HttpResponse, HttpResponseBase
+from django.utils.http import parse_header_parameters
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "public, max-age=3600"
+# Preferred first.
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+mimetypes.add_type("application/manifest+json", ".webmanifest")
+mimetypes.add_type("font/woff2", ".woff2")
+
+
+@dataclass(frozen=True, slots=True)
+class StaticFile:
+    path: Path
+    content_type: str
+    cache_control: str
+    encodings: tuple[str, ...]  # The ENCODINGS with a sibling on disk
+
+
+def index(root: Path, hashed: set[str]) -> dict[str, StaticFile]:
+    """Every file under `root` by URL path, with its precompressed siblings.
+
+    Only indexed paths are ever served, so there's nothing to traverse.
+    """
+
+    suffixes = tuple(suffix for _, suffix in ENCODINGS)
+    files: dict[str, StaticFile] = {}
+
+    for directory, _, names in os.walk(root):
+        present = set(names)
+        for name in names:
+            if name.endswith(suffixes):
+                continue
+            path = Path(directory, name)
+            relative = path.relative_to(root).as_posix()
+            content_type, _ = mimetypes.guess_type(name)
+            files[relative] = StaticFile(
+                path=path,
+                content_type=content_type or "application/octet-stream",
+                cache_control=IMMUTABLE if relative in hashed else REVALIDATE,
+                encodings=tuple(
+                    encoding
+                    for encoding, suffix in ENCODINGS
+                    if f"{name}{suffix}" in present
+                ),
+            )
+    return files
+
+
+def accepted(request: HttpRequest) -> set[str]:
+    encodings: set[str] = set()
+    for part in request.headers.get("Accept-Encoding", "").split(","):
+        encoding, parameters = parse_header_parameters(part.strip())
+        if encoding and parameters.get("q") not in ("0", "0.0", "0.00", "0.000"):
+            encodings.add(encoding.lower())
+    return encodings
+
+
+class StaticFilesMiddleware:
+    """Serve collectstatic's output from STATIC_ROOT in production.
+
+    Hashed names are immutable for a year; br or gzip siblings made by
+    afromart.storage are picked by Accept-Encoding, never compressed here.
+    """
+
+    async_capable = True
+    sync_capable = True
+
+    def __init__(
+        self,
+        get_response: Callable[[HttpRequest], HttpResponseBase]
+        | Callable[[HttpRequest], Awaitable[HttpResponseBase]],
+    ) -> None:
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+        self.prefix = "/" + settings.STATIC_URL.lstrip("/")
+        # runserver serves static files itself in DEBUG.
+        self.files: dict[str, StaticFile] = {}
+        if not settings.DEBUG and settings.STATIC_ROOT:
+            hashed = set(getattr(staticfiles_storage, "hashed_files", {}).values())
+            self.files = index(Path(settings.STATIC_ROOT), hashed)
+
+    def __call__(self, request: HttpRequest):  # pyright: ignore[reportUnknownParameterType]
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if (response := self.static(request)) is not None:
+            return response
+        return self.get_response(request)
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponseBase:
+        if (response := self.static(request)) is not None:
+            return response
+        return await self.get_response(request)  # pyright: ignore[reportGeneralTypeIssues]
+
+    def static(self, request: HttpRequest) -> HttpResponseBase | None:
+        if (
+            request.path.startswith(self.prefix)
+            and request.method in ("GET", "HEAD")
+            and (file := self.files.get(request.path.removeprefix(self.prefix)))
+        ):
+            return self.serve(request, file)
+        return None
+
+    def serve(self, request: HttpRequest, file: StaticFile) -> HttpResponseBase:
+        path, encoding = file.path, None
+        if file.encodings and (wanted := accepted(request)):
+            for candidate, suffix in ENCODINGS:
+                if candidate in file.encodings and candidate in wanted:
+                    path, encoding = (
+                        file.path.with_name(file.path.name + suffix),
+                        candidate,
+                    )
+                    break
+
+        if request.method == "HEAD":
+            response: HttpResponseBase = HttpResponse(content_type=file.content_type)
+            response.headers["Content-Length"] = str(path.stat().st_size)
+        else:
+            response = FileResponse(path.open("rb"), content_type=file.content_type)
+
+        response.headers["Cache-Control"] = file.cache_control
+        if file.encodings:
+            response.headers["Vary"] = "Accept-Encoding"
+        if encoding:
+            response.headers["Content-Encoding"] = encoding
+        return response
@@ -0,0 +1,95 @@
+import random
+from collections.abc import Awaitable, Callable
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.http import HttpRequest, HttpResponseBase
+
+from ..instrumentation import Metrics, aggregates, measure, prometheus
+from ..instrumentation.prometheus import IN_FLIGHT
+
+
+def view_name(request: HttpRequest) -> str:
+    return request.resolver_match.view_name if request.resolver_match else "unresolved"
+
+
+class TimingMiddleware:
+    """Time each request's SQL, cache and templates.
+
+    Every request updates the Prometheus metrics. In DEBUG the numbers go
+    out as a Server-Timing header. A TIMING_SAMPLE_RATE share of requests
+    is also logged and added to the per-view aggregates that the
+    timing_report command reads.
+    """
+
+    async_capable = True
+    sync_capable = True
+
+    def __init__(
+        self,
+        get_response: Callable[[HttpRequest], HttpResponseBase]
+        | Callable[[HttpRequest], Awaitable[HttpResponseBase]],
+    ) -> None:
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest):  # pyright: ignore[reportUnknownParameterType]
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        with IN_FLIGHT.track_inprogress(), measure() as metrics:
+            response = self.get_response(request)
+        if self.process(request, response, metrics):  # pyright: ignore[reportArgumentType]
+            self.record(request, response, metrics)  # pyright: ignore[reportArgumentType]
+        return response
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponseBase:
+        with IN_FLIGHT.track_inprogress(), measure() as metrics:
+            response = await self.get_response(request)  # pyright: ignore[reportGeneralTypeIssues]
+        if self.process(request, response, metrics):
+            await sync_to_async(self.record, thread_sensitive=False)(
+                request, response, metrics
+            )
+        return response
+
+    def process(
+        self, request: HttpRequest, response: HttpResponseBase, metrics: Metrics
+    ) -> bool:
+        """Update the Prometheus metrics and add the Server-Timing header;
+        returns whether to also log and aggregate the request."""
+
+        prometheus.observe(
+            view_name(request), str(request.method), response.status_code, metrics
+        )
+        if settings.DEBUG:
+            response.headers["Server-Timing"] = ", ".join(
+                (
+                    f"total;dur={metrics.total_ms:.1f}",
+                    f'sql;desc="{metrics.sql_count} queries";dur={metrics.sql_ms:.1f}',
+                    f'cache;desc="{metrics.cache_hits} hits and {metrics.cache_misses} '
+                    f'misses in {metrics.cache_round_trips} round trips";'
+                    f"dur={metrics.cache_ms:.1f}",
+                    f"template;dur={metrics.template_ms:.1f}",
+                )
+            )
+        return random.random() < settings.TIMING_SAMPLE_RATE
+
+    def record(
+        self, request: HttpRequest, response: HttpResponseBase, metrics: Metrics
+    ) -> None:
+        view = view_name(request)
+        fields = {
+            "view": view,
+            "method": request.method,
+            "status": response.status_code,
+        } | metrics.as_dict()
+
+        settings.LOGGER.info(
+            "timing " + " ".join(f"{name}={value}" for name, value in fields.items()),
+            extra={"timing": fields},
+        )
+        try:
+            aggregates.add(view, metrics)
+        except Exception:
+            settings.LOGGER.exception("Couldn't record timing aggregates.")
@@ -0,0 +1,18 @@
+from functools import cache
+
+from django.conf import settings
+from redis import Redis
+
+
+@cache
+def connection() -> Redis:
+    """A raw client on the default cache's Redis, for what the cache API can't do."""
+
+    return Redis.from_url(
+        url=settings.CACHES["default"]["LOCATION"],
+        **settings.CACHES["default"]["OPTIONS"],
+    )
+
+
+def namespaced(*parts: str) -> str:
+    return ":".join((settings.PROJECT_NAME, *parts))
@@ -1,14 +1,14 @@
-import atexit
-import json
 import logging
 import os
-from concurrent.futures import ThreadPoolExecutor
+import threading
 from pathlib import Path
-from socket import gethostbyname_ex, gethostname
 from urllib.parse import urlparse
 
 from django.contrib.messages import constants as messages
 
+from afromart import executors
+from afromart.hosts import MachineHosts
+
 PROJECT_NAME = "afromart"  # Needs to be lowercase
 DOMAIN_NAME = "afromart.trade"
 PROJECT_DESCRIPTION = "Africa's marketplace."
@@ -42,21 +42,12 @@ CSRF_TRUSTED_ORIGINS = (
 
 if not DEBUG:
     SECRET_KEY = os.getenv("SECRET_KEY")  # pyright: ignore[reportConstantRedefinition]
-    ALLOWED_HOSTS = [DOMAIN_NAME]  # pyright: ignore[reportConstantRedefinition]
     USE_X_FORWARDED_HOST = True
     CSRF_COOKIE_DOMAIN = DOMAIN_NAME
     SESSION_COOKIE_DOMAIN = DOMAIN_NAME
     SECURE_PROXY_SSL_HEADER = ("HTTP_X_FORWARDED_PROTO", "https")
-    # Dynamically allows any internal hostnames assigned by the PaaS
-    try:
-        ALLOWED_HOSTS.extend(
-            [
-                gethostname(),
-            ]
-            + list(set(gethostbyname_ex(gethostname())[2]))
-        )
-    except Exception:
-        pass
+    # Plus any internal hostnames assigned by the PaaS, looked up on first use.
+    ALLOWED_HOSTS = MachineHosts(DOMAIN_NAME)  # pyright: ignore[reportConstantRedefinition]
 
 
 INSTALLED_APPS = [
@@ -67,7 +58,9 @@ INSTALLED_APPS = [
     "django.contrib.messages",
     "django.contrib.staticfiles",
     "django.contrib.humanize",
+    "django.contrib.postgres",
     # App
+    "afromart.apps.AfromartConfig",
     "gate.apps.GateConfig",
     "trader.apps.TraderConfig",
     "order.apps.OrderConfig",
@@ -80,11 +73,13 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
+    "afromart.middleware.StaticFilesMiddleware",
+    "afromart.middleware.TimingMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django_htmx.middleware.HtmxMiddleware",
-    "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "gate.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
@@ -95,7 +90,7 @@ ROOT_URLCONF = f"{PROJECT_NAME}.urls"
 
 TEMPLATES = [  # pyright: ignore[reportUnknownVariableType]
     {
-        "BACKEND": "django.template.backends.django.DjangoTemplates",
+        "BACKEND": "afromart.instrumentation.templates.DjangoTemplates",
         "DIRS": (BASE_DIR / "templates",),
         "APP_DIRS": True,
         "OPTIONS": {
@@ -111,6 +106,20 @@ TEMPLATES = [  # pyright: ignore[reportUnknownVariableType]
     },
 ]
 
+if not DEBUG:
+    # Parse each template once per process. DEBUG keeps APP_DIRS, which
+    # Django also caches but reloads when templates change.
+    TEMPLATES[0]["APP_DIRS"] = False
+    TEMPLATES[0]["OPTIONS"]["loaders"] = [  # pyright: ignore[reportIndexIssue]
+        (
+            "django.template.loaders.cached.Loader",
+            [
+                "django.template.loaders.filesystem.Loader",
+                "django.template.loaders.app_directories.Loader",
+            ],
+        )
+    ]
+
 
 # Database
 # dev_db:
@@ -125,10 +134,22 @@ DATABASES = {  # pyright: ignore[reportUnknownVariableType]
         "USER": database_credentials.username,
         "HOST": database_credentials.hostname,
         "PASSWORD": database_credentials.password,
-        "CONN_MAX_AGE": 30,
+        # Pooled: connections outlive requests in the pool instead, so each
+        # thread stops paying the TLS + channel binding handshake.
+        "CONN_MAX_AGE": 0,
         "CONN_HEALTH_CHECKS": True,
         "DISABLE_SERVER_SIDE_CURSORS": True,
         "OPTIONS": {
+            # One pool per process: sized to the gthread worker's threads so
+            # a request never waits, with a couple kept warm between bursts.
+            "pool": {
+                "name": PROJECT_NAME,
+                "min_size": int(os.getenv(key="DATABASE_POOL_MIN_SIZE", default="2")),
+                "max_size": int(os.getenv(key="DATABASE_POOL_MAX_SIZE", default="4")),
+                "timeout": 10,
+                "max_idle": 300,
+                "max_lifetime": 1800,
+            },
             "keepalives": 1,
             "connect_timeout": 10,
             "keepalives_idle": 20,
@@ -147,23 +168,47 @@ if not DEBUG:
     )
 
 
+REDIS_OPTIONS = {
+    "socket_timeout": 5,
+    "max_connections": 10,
+    "socket_keepalive": True,
+    "retry_on_timeout": True,
+    "health_check_interval": 30,
+    "socket_connect_timeout": 5,
+}
 CACHES = {  # pyright: ignore[reportUnknownVariableType]
     "default": {
-        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "BACKEND": "afromart.instrumentation.cache.RedisCache",
         "LOCATION": os.getenv(key="CACHE_URL"),
         "KEY_PREFIX": f"{PROJECT_NAME}_",
-        "OPTIONS": {
-            "socket_timeout": 5,
-            "max_connections": 10,
-            "socket_keepalive": True,
-            "retry_on_timeout": True,
-            "health_check_interval": 30,
-            "socket_connect_timeout": 5,
+        "OPTIONS": REDIS_OPTIONS,
+    },
+    # Product rows, facet counts and shipping quotes: read on most pages,
+    # rarely written. Kept in each process too, and dropped everywhere over
+    # pub/sub when written (afromart.cache). Sessions stay on "default": each
+    # is read by one visitor and written often.
+    "hot": {
+        "BACKEND": "afromart.cache.TwoTierCache",
+        "LOCATION": os.getenv(key="CACHE_URL"),
+        "KEY_PREFIX": f"{PROJECT_NAME}_",
+        "OPTIONS": REDIS_OPTIONS,
+        "LOCAL": {
+            "MAX_ENTRIES": 5000,
+            "MAX_BYTES": 32 * 1024 * 1024,
+            "TIMEOUT": 30,
         },
-    }
+    },
+    # {% cache %} fragments: static chrome, cheaper to keep in process than to
+    # fetch from Redis.
+    "template_fragments": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "template_fragments",
+        "TIMEOUT": None,
+    },
 }
 
-SESSION_ENGINE = "django.contrib.sessions.backends.cache"
+# One MGET per request and no write unless the session changed (gate.sessions).
+SESSION_ENGINE = "gate.sessions"
 SESSION_CACHE_ALIAS = "default"
 
 
@@ -183,6 +228,17 @@ AUTH_PASSWORD_VALIDATORS = [
 ]
 
 
+# Memory-hard scrypt for new passwords; older PBKDF2 hashes still verify and
+# are rehashed with scrypt on the user's next sign in.
+PASSWORD_HASHERS = [
+    "django.contrib.auth.hashers.ScryptPasswordHasher",
+    "django.contrib.auth.hashers.PBKDF2PasswordHasher",
+    "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+]
+
+AUTHENTICATION_BACKENDS = ["gate.backends.ModelBackend"]
+
+
 LOGIN_URL = "/gate/signin/"
 
 
@@ -197,6 +253,15 @@ STATIC_URL = "static/"
 MEDIA_ROOT = BASE_DIR / "media"
 STATIC_ROOT = BASE_DIR / "static"
 STATICFILES_DIRS = (BASE_DIR / "static_global",)
+STORAGES = {
+    "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+    # Hashed names with .gz/.br siblings, served by StaticFilesMiddleware.
+    "staticfiles": {
+        "BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"
+        if DEBUG
+        else "afromart.storage.CompressedManifestStaticFilesStorage"
+    },
+}
 
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
@@ -204,11 +269,9 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 # Email
 EMAIL = f"{PROJECT_NAME}@{DOMAIN_NAME}"
-EMAIL_CREDENTIALS = json.loads(os.getenv("EMAIL_CREDENTIALS", '{"": ""}'))
-EMAIL_HOST = EMAIL_CREDENTIALS.get("host")
+# Host and login come from the EMAIL_CREDENTIALS env var, read by the
+# backend when it first sends.
 EMAIL_PORT = 587
-EMAIL_HOST_USER = EMAIL_CREDENTIALS.get("username")
-EMAIL_HOST_PASSWORD = EMAIL_CREDENTIALS.get("password")
 EMAIL_USE_TLS = True
 DEFAULT_FROM_EMAIL = f"{PROJECT_NAME.capitalize()} <{EMAIL}>"
 SERVER_EMAIL = EMAIL
@@ -217,7 +280,7 @@ ADMINS = [
 ]
 EMAIL_SUBJECT_PREFIX = f"[{PROJECT_NAME.capitalize()}]: "
 EMAIL_BACKEND = (
-    "django.core.mail.backends.smtp.EmailBackend"
+    "afromart.mail.backends.EmailBackend"
     if not DEBUG
     else "django.core.mail.backends.console.EmailBackend"
 )
@@ -226,8 +289,13 @@ EMAIL_BACKEND = (
 # Logging
 # Define PrefixFilter before LOGGING
 class PrefixFilter(logging.Filter):
+    # Runs once per handler, and a record can reach several (console and
+    # mail_admins), so it marks what it has prefixed. Each record belongs to
+    # the thread that logged it, so there's nothing to lock.
     def filter(self, record: logging.LogRecord):
-        record.msg = f"[{PROJECT_NAME.capitalize()}] {record.msg}"
+        if not getattr(record, "prefixed", False):
+            record.msg = f"[{PROJECT_NAME.capitalize()}] {record.msg}"
+            record.prefixed = True
         return True
 
 
@@ -293,9 +361,30 @@ LOGGING = {  # pyright: ignore[reportUnknownVariableType]
 LOGGER = logging.getLogger(name=PROJECT_NAME)
 
 
-# Shared ThreadPool
-THREAD_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix=f"{PROJECT_NAME}_")
-atexit.register(THREAD_POOL.shutdown, wait=True)
+# Password hashing, one thread per core (they scale on free-threaded builds).
+# Past HASHING_QUEUE hashes waiting, gate.hashing turns requests away.
+HASHING_WORKERS = int(
+    os.getenv(key="HASHING_WORKERS", default=str(os.process_cpu_count() or 1))
+)
+HASHING_QUEUE = int(os.getenv(key="HASHING_QUEUE", default=str(HASHING_WORKERS * 4)))
+HASHING_POOL = executors.lazy(
+    max_workers=HASHING_WORKERS, thread_name_prefix=f"{PROJECT_NAME}_hashing_"
+)
+HASHING_SLOTS = threading.BoundedSemaphore(HASHING_WORKERS + HASHING_QUEUE)
+
+
+# Share of requests logged and added to the per-view timing aggregates.
+TIMING_SAMPLE_RATE = float(
+    os.getenv(key="TIMING_SAMPLE_RATE", default="1" if DEBUG else "0.01")
+)
+
+
+# Metrics endpoints answer only requests bearing this token.
+METRICS_TOKEN = os.getenv("METRICS_TOKEN")
+
+
+# Throttle sign in, sign up and password reset requests; see gate.ratelimit.
+RATE_LIMIT = True
 
 
 # Use Bootstrap colors for django.contrib.messages
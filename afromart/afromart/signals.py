@@ -0,0 +1,16 @@
+from typing import Any
+
+from django.db.backends.base.base import BaseDatabaseWrapper
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+from .instrumentation import record_sql
+
+
+@receiver(connection_created)
+def instrument_connection(connection: BaseDatabaseWrapper, **kwargs: Any) -> None:
+    # On every connection rather than inside measure(): under ASGI a request's
+    # queries run on sync_to_async threads, each with its own connection.
+    # record_sql does nothing outside a measured request.
+    if record_sql not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_sql)
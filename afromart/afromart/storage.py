@@ -0,0 +1,70 @@
+import gzip
+from collections.abc import Iterator
+from typing import Any
+
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage
+from django.core.files.base import ContentFile
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+COMPRESSIBLE = (
+    ".css",
+    ".js",
+    ".json",
+    ".map",
+    ".svg",
+    ".txt",
+    ".xml",
+    ".ico",
+    ".webmanifest",
+)
+# Not worth a sibling unless it saves at least this share of the bytes.
+MIN_SAVING = 0.05
+
+
+def compress(content: bytes) -> dict[str, bytes]:
+    """The content's gzip and, if brotli is installed, br encodings."""
+
+    encoded = {".gz": gzip.compress(content, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        encoded[".br"] = brotli.compress(content, quality=11)
+    return {
+        suffix: data
+        for suffix, data in encoded.items()
+        if len(data) <= len(content) * (1 - MIN_SAVING)
+    }
+
+
+class CompressedManifestStaticFilesStorage(ManifestStaticFilesStorage):
+    """Hashed filenames, plus .gz and .br siblings of the hashed text assets.
+
+    Compression happens once, in collectstatic; afromart.middleware.StaticFiles
+    only picks a sibling.
+    """
+
+    def post_process(
+        self, paths: dict[str, Any], dry_run: bool = False, **options: Any
+    ) -> Iterator[tuple[str, str | None, Any]]:
+        hashed_names: set[str] = set()
+        for name, hashed_name, processed in super().post_process(
+            paths, dry_run=dry_run, **options
+        ):
+            if hashed_name and not isinstance(processed, Exception):
+                hashed_names.add(hashed_name)
+            yield name, hashed_name, processed
+
+        if dry_run:
+            return
+
+        for hashed_name in sorted(hashed_names):
+            if not hashed_name.endswith(COMPRESSIBLE):
+                continue
+            with self.open(hashed_name) as file:
+                content = file.read()
+            for suffix, data in compress(content).items():
+                if self.exists(hashed_name + suffix):
+                    self.delete(hashed_name + suffix)
+                self._save(hashed_name + suffix, ContentFile(data))
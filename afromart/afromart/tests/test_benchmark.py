@@ -0,0 +1,63 @@
+import pytest
+from django.db import connection, transaction
+from django.urls import reverse
+
+from afromart import benchmark
+
+
+def run(**metrics: float) -> dict:
+    return {
+        "commit": "abc1234",
+        "results": [
+            {
+                "name": "in-process:signin",
+                "concurrency": 4,
+                "throughput": 100.0,
+                "p50_ms": 10.0,
+                "p95_ms": 20.0,
+                "p99_ms": 40.0,
+                "queries_per_request": 3.0,
+            }
+            | metrics
+        ],
+    }
+
+
+def test_regressions_flag_slower_and_chattier_runs() -> None:
+    found = benchmark.regressions(
+        run(), run(p99_ms=60.0, throughput=80.0, queries_per_request=4.0)
+    )
+
+    assert len(found) == 3
+    assert any("p99_ms 40.00 → 60.00" in regression for regression in found)
+
+
+def test_regressions_ignore_noise() -> None:
+    assert not benchmark.regressions(run(), run(p50_ms=10.5, throughput=95.0))
+    assert not benchmark.regressions(run(), run(p99_ms=30.0, throughput=150.0))
+
+
+@pytest.mark.django_db(transaction=True)
+def test_http_post_sends_a_csrf_token(live_server, settings) -> None:
+    settings.RATE_LIMIT = False
+    call = benchmark.http_post(
+        f"{live_server.url}{reverse('gate:password_reset_request')}",
+        {"email": "benchmark@gmail.com"},
+    )
+
+    assert call()
+    assert call()  # Reusing the first call's token.
+
+
+@pytest.mark.django_db(transaction=True)
+def test_releasing_hands_connections_back_outside_transactions() -> None:
+    def query() -> bool:
+        connection.ensure_connection()
+        return True
+
+    assert benchmark.releasing(query)()
+    assert connection.connection is None
+
+    with transaction.atomic():
+        assert benchmark.releasing(query)()
+        assert connection.connection is not None
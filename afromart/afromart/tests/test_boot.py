@@ -0,0 +1,49 @@
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+from afromart import executors, hosts
+from afromart.mail import backends
+
+
+def test_machine_hosts_are_looked_up_on_first_use() -> None:
+    with patch.object(
+        hosts, "gethostbyname_ex", return_value=("vm", [], ["10.0.0.7"])
+    ) as lookup:
+        allowed = hosts.MachineHosts("afromart.trade")
+        assert not lookup.called
+
+        assert "10.0.0.7" in allowed and "afromart.trade" in allowed
+        assert len(allowed) == 3
+    assert lookup.call_count == 1
+
+
+def test_lazy_pools_start_once_on_first_use() -> None:
+    built: list[ThreadPoolExecutor] = []
+
+    def build() -> ThreadPoolExecutor:
+        built.append(ThreadPoolExecutor(1))
+        return built[-1]
+
+    pool = executors.Once(build)
+    assert not built
+
+    with ThreadPoolExecutor(8) as callers:
+        list(callers.map(lambda _: pool.submit(int).result(), range(8)))
+    assert len(built) == 1
+    built[0].shutdown()
+
+
+def test_email_login_comes_from_the_environment(monkeypatch) -> None:
+    monkeypatch.setenv(
+        "EMAIL_CREDENTIALS",
+        '{"host": "smtp.afromart.trade", "username": "u", "password": "p"}',
+    )
+    backends.credentials.cache_clear()
+
+    backend = backends.EmailBackend()
+    assert (backend.host, backend.username, backend.password) == (
+        "smtp.afromart.trade",
+        "u",
+        "p",
+    )
+    backends.credentials.cache_clear()
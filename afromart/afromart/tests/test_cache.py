@@ -0,0 +1,134 @@
+import json
+import secrets
+import time
+from collections.abc import Callable, Iterator
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.conf import settings
+from django.core.cache import cache
+
+from afromart.cache import CHANNEL, LocalTier, hot
+from afromart.instrumentation import measure
+from afromart.instrumentation.cache import MISSING
+from afromart.redis import connection
+
+
+def eventually(condition: Callable[[], bool]) -> bool:
+    deadline = time.monotonic() + 5
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+def tier(**local: int) -> LocalTier:
+    tier = LocalTier(
+        settings.CACHES["hot"]["LOCATION"], settings.CACHES["hot"]["OPTIONS"], local
+    )
+    assert eventually(lambda: tier.live)
+    return tier
+
+
+def listened() -> None:
+    """Wait until the listener has handled everything published so far."""
+
+    generation = hot.local.generation
+    connection().publish(CHANNEL, json.dumps({"keys": [hot.make_key("elsewhere")]}))
+    assert eventually(lambda: hot.local.generation > generation)
+
+
+@pytest.fixture
+def key() -> Iterator[str]:
+    assert eventually(lambda: hot.local.live)
+    key = f"hot_test_{secrets.token_hex(4)}"
+    yield key
+    hot.delete(key)
+
+
+def test_local_hits_skip_redis(key: str) -> None:
+    hot.set(key, {"zones": ["east"]})
+    hot.get(key)
+
+    with measure() as metrics:
+        value = hot.get(key)
+        value["zones"].append("west")  # A copy: the next read doesn't see it.
+        assert hot.get_many([key]) == {key: {"zones": ["east"]}}
+    assert (metrics.cache_hits, metrics.cache_round_trips) == (2, 0)
+
+
+def test_own_writes_are_not_dropped_again(key: str) -> None:
+    hot.set(key, 1)
+    hot.get(key)
+    listened()  # Including this process's own message about the set.
+
+    with measure() as metrics:
+        assert hot.get(key) == 1
+    assert metrics.cache_round_trips == 0
+
+
+def test_writes_elsewhere_are_dropped_here(key: str) -> None:
+    hot.set(key, 1)
+    hot.get(key)
+    listened()
+
+    # Another process writing: straight to Redis, then announced.
+    connection().set(hot.make_key(key), hot._cache._serializer.dumps(2))  # pyright: ignore[reportPrivateUsage]
+    assert hot.get(key) == 1
+    connection().publish(CHANNEL, json.dumps({"keys": [hot.make_key(key)]}))
+
+    assert eventually(lambda: hot.get(key) == 2)
+
+
+def test_fills_are_not_announced(key: str) -> None:
+    other = tier()  # Another process's copy.
+    generation = other.generation
+    hot.fill_many({key: 1})
+    hot.fill(key, 2)
+    connection().publish(CHANNEL, json.dumps({"keys": [hot.make_key("elsewhere")]}))
+
+    assert eventually(lambda: other.generation > generation)
+    assert other.generation == generation + 1  # Only the message above.
+    assert hot.get(key) == 2
+
+
+def test_least_recently_used_entries_go_first() -> None:
+    local = tier(MAX_ENTRIES=2)
+    for key in ("a", "b"):
+        local.fill(key, key, local.generation)
+    local.get("a")
+    local.fill("c", "c", local.generation)
+
+    assert [local.get(key) for key in ("a", "c")] == ["a", "c"]
+    assert len(local) == 2
+
+
+def test_entries_expire_and_bytes_are_bounded() -> None:
+    local = tier(MAX_BYTES=16 * 1024, TIMEOUT=0)
+    local.fill("big", "x" * 2048, local.generation)
+    local.fill("small", "x", local.generation)
+
+    assert len(local) == 1
+    assert local.get("small") is MISSING  # Expired on arrival.
+    assert len(local) == 0
+
+
+def test_fills_racing_an_invalidation_are_dropped() -> None:
+    local = tier()
+    generation = local.generation
+    local.discard(["key"])
+    local.fill("key", "old", generation)
+
+    assert len(local) == 0
+
+
+def test_async_many_calls_are_one_round_trip() -> None:
+    async def many() -> dict[str, int]:
+        await cache.aset_many({"many_a": 1, "many_b": 2})
+        return await cache.aget_many(["many_a", "many_b", "many_c"])
+
+    with measure() as metrics:
+        assert async_to_sync(many)() == {"many_a": 1, "many_b": 2}
+    assert metrics.cache_round_trips == 2
+    cache.delete_many(["many_a", "many_b"])
@@ -0,0 +1,47 @@
+from collections.abc import Iterator
+from unittest.mock import patch
+
+import pytest
+from django.core.mail import EmailMessage
+
+from afromart import mail
+from afromart.mail import queue
+from afromart.redis import connection
+
+
+@pytest.fixture(autouse=True)
+def empty_queue() -> Iterator[None]:
+    keys = (queue.QUEUE, queue.PROCESSING, queue.RETRY, queue.DEAD, queue.STATS)
+    connection().delete(*keys)
+    yield
+    connection().delete(*keys)
+
+
+def test_drain_sends_queued_mail(mailoutbox: list[EmailMessage]) -> None:
+    for recipient in ("one@gmail.com", "two@gmail.com"):
+        mail.enqueue(subject="Hi", message="Body", recipient_list=[recipient])
+    assert mail.stats()["queued"] == 2
+
+    assert mail.drain(once=True, block=1) == 2
+    assert [message.to for message in mailoutbox] == [
+        ["one@gmail.com"],
+        ["two@gmail.com"],
+    ]
+
+    stats = mail.stats()
+    assert stats["queued"] == stats["processing"] == 0
+    assert stats["sent"] == 2
+
+
+def test_drain_schedules_retry_on_failure() -> None:
+    mail.enqueue(subject="Hi", message="Body", recipient_list=["one@gmail.com"])
+
+    with patch(
+        "django.core.mail.backends.locmem.EmailBackend.send_messages",
+        side_effect=OSError,
+    ):
+        assert mail.drain(once=True, block=1) == 0
+
+    stats = mail.stats()
+    assert stats["retrying"] == 1
+    assert stats["processing"] == stats["dead"] == 0
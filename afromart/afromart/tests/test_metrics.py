@@ -0,0 +1,20 @@
+import pytest
+from django.db import connection
+from django.test import Client
+from django.urls import reverse
+
+
+@pytest.mark.django_db
+def test_pool_metrics_need_the_token(settings) -> None:
+    settings.METRICS_TOKEN = "secret"
+    client = Client()
+    url = reverse("metrics_pool")
+
+    assert client.get(url).status_code == 404
+    assert client.get(url, headers={"Authorization": "Bearer wrong"}).status_code == 404
+
+    connection.ensure_connection()
+    stats = client.get(url, headers={"Authorization": "Bearer secret"}).json()
+    assert {"requests_wait_ms_avg", "connections_opened", "connections_closed"} <= set(
+        stats["default"]
+    )
@@ -0,0 +1,38 @@
+import pytest
+from django.test import Client
+from django.urls import reverse
+
+
+@pytest.mark.django_db
+def test_requests_show_up_in_metrics(settings) -> None:
+    settings.METRICS_TOKEN = "secret"
+    client = Client()
+    client.get(reverse("product:catalog"))
+
+    response = client.get(
+        reverse("metrics"), headers={"Authorization": "Bearer secret"}
+    )
+
+    assert response.status_code == 200
+    body = response.content.decode()
+    assert 'afromart_request_seconds_count{method="GET",view="product:catalog"}' in body
+    assert 'afromart_responses_total{status="200",view="product:catalog"}' in body
+    assert 'afromart_db_queries_total{view="product:catalog"}' in body
+
+
+def test_unknown_methods_share_a_label(settings) -> None:
+    settings.METRICS_TOKEN = "secret"
+    client = Client()
+    client.generic("BREW", reverse("product:catalog"))
+
+    body = client.get(
+        reverse("metrics"), headers={"Authorization": "Bearer secret"}
+    ).content.decode()
+
+    assert 'method="other",view="product:catalog"' in body
+    assert 'method="BREW"' not in body
+
+
+def test_metrics_need_the_token(settings) -> None:
+    settings.METRICS_TOKEN = "secret"
+    assert Client().get(reverse("metrics")).status_code == 404
@@ -0,0 +1,69 @@
+import gzip
+from pathlib import Path
+
+import pytest
+from django.test import RequestFactory
+
+from afromart.middleware import StaticFilesMiddleware
+from afromart.middleware.static import IMMUTABLE, REVALIDATE, index
+from afromart.storage import compress
+
+CSS = b"body { color: black; }\n" * 200
+
+
+@pytest.fixture
+def middleware(settings, tmp_path: Path) -> StaticFilesMiddleware:
+    (tmp_path / "css").mkdir()
+    (tmp_path / "css" / "app.abc123.css").write_bytes(CSS)
+    for suffix, data in compress(CSS).items():
+        (tmp_path / "css" / f"app.abc123.css{suffix}").write_bytes(data)
+    (tmp_path / "robots.txt").write_bytes(b"User-agent: *\n")
+
+    settings.DEBUG = True
+    middleware = StaticFilesMiddleware(lambda request: None)  # pyright: ignore[reportArgumentType]
+    # The manifest only exists after collectstatic.
+    middleware.files = index(tmp_path, {"css/app.abc123.css"})
+    return middleware
+
+
+@pytest.mark.parametrize(
+    ("accept_encoding", "content_encoding"),
+    (
+        ("gzip, deflate, br", "br"),
+        ("gzip", "gzip"),
+        ("br;q=0, gzip", "gzip"),
+        ("", None),
+    ),
+)
+def test_serves_precompressed_siblings(
+    middleware: StaticFilesMiddleware,
+    accept_encoding: str,
+    content_encoding: str | None,
+) -> None:
+    response = middleware(
+        RequestFactory().get(
+            "/static/css/app.abc123.css",
+            headers={"Accept-Encoding": accept_encoding},
+        )
+    )
+
+    assert response.headers.get("Content-Encoding") == content_encoding
+    assert response.headers["Cache-Control"] == IMMUTABLE
+    assert response.headers["Vary"] == "Accept-Encoding"
+    assert response.headers["Content-Type"] == "text/css"
+    body = b"".join(response.streaming_content)
+    if content_encoding == "gzip":
+        assert gzip.decompress(body) == CSS
+    elif content_encoding is None:
+        assert body == CSS
+
+
+def test_only_indexed_files_are_served(middleware: StaticFilesMiddleware) -> None:
+    factory = RequestFactory()
+
+    response = middleware(factory.get("/static/robots.txt"))
+    assert response.headers["Cache-Control"] == REVALIDATE
+    assert "Vary" not in response.headers
+    assert middleware(factory.get("/static/css/app.abc123.css.gz")) is None
+    assert middleware(factory.get("/static/../settings.py")) is None
+    assert middleware(factory.post("/static/robots.txt")) is None
@@ -0,0 +1,64 @@
+from collections.abc import Iterator
+
+import pytest
+from asgiref.sync import async_to_sync, sync_to_async
+from django.db import connection
+from django.test import Client
+from django.urls import reverse
+
+from afromart.instrumentation import Metrics, aggregates, measure
+
+
+@pytest.fixture(autouse=True)
+def empty_aggregates() -> Iterator[None]:
+    aggregates.reset()
+    yield
+    aggregates.reset()
+
+
+@pytest.mark.django_db
+def test_server_timing_header(settings) -> None:
+    settings.DEBUG = True
+    settings.TIMING_SAMPLE_RATE = 0
+
+    timing = Client().get(reverse("product:catalog")).headers["Server-Timing"]
+
+    metrics = dict(part.split(";", 1) for part in timing.split(", "))
+    assert set(metrics) == {"total", "sql", "cache", "template"}
+    assert 'desc="0 queries"' not in metrics["sql"]
+    assert not aggregates.report()
+
+
+@pytest.mark.django_db
+def test_sampled_requests_are_aggregated(settings) -> None:
+    settings.TIMING_SAMPLE_RATE = 1
+
+    client = Client()
+    for _ in range(3):
+        response = client.get(reverse("product:catalog"))
+    assert "Server-Timing" not in response.headers
+
+    report = aggregates.report()["product:catalog"]
+    assert report["requests"] == 3
+    assert report["sql_count"] >= 1
+    assert report["template_ms"] > 0
+
+
+@pytest.mark.django_db(transaction=True)
+def test_queries_on_other_threads_are_counted() -> None:
+    # As under ASGI: the request is measured on the event loop and its queries
+    # run on a sync_to_async thread, with that thread's connection.
+    def query() -> None:
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1")
+        finally:
+            connection.close()
+
+    async def request() -> Metrics:
+        with measure() as metrics:
+            await sync_to_async(query, thread_sensitive=False)()
+        await sync_to_async(query, thread_sensitive=False)()
+        return metrics
+
+    assert async_to_sync(request)().sql_count == 1
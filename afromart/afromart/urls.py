@@ -5,6 +5,8 @@ from django.contrib import admin
 from django.urls import URLPattern, URLResolver, include, path
 from django.views.generic import RedirectView
 
+from .views import pool, prometheus
+
 TITLE = settings.PROJECT_NAME.capitalize()
 admin.site.site_title = TITLE
 admin.site.site_header = TITLE
@@ -19,5 +21,10 @@ urlpatterns: Sequence[URLPattern | URLResolver] = [
         ),
     ),
     path(route="gate/", view=include("gate.urls", namespace="gate")),
+    path(route="products/", view=include("product.urls", namespace="product")),
+    path(route="orders/", view=include("order.urls", namespace="order")),
+    path(route="traders/", view=include("trader.urls", namespace="trader")),
+    path(route="metrics/", view=prometheus, name="metrics"),
+    path(route="metrics/pool/", view=pool, name="metrics_pool"),
     path(route="a/", view=admin.site.urls),
 ]
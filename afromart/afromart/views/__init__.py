@@ -0,0 +1,3 @@
+from .metrics import pool, prometheus
+
+__all__ = ("pool", "prometheus")
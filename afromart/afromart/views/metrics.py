@@ -0,0 +1,36 @@
+import os
+from hmac import compare_digest
+
+from django.conf import settings
+from django.http import Http404, HttpRequest, HttpResponse, JsonResponse
+from django.views.decorators.cache import never_cache
+from django.views.decorators.http import require_GET
+
+from ..db import pool_stats
+from ..instrumentation.prometheus import exposition
+
+
+def authorized(request: HttpRequest) -> bool:
+    token = request.headers.get("Authorization", "").removeprefix("Bearer ")
+    return bool(settings.METRICS_TOKEN) and compare_digest(
+        token.encode(), settings.METRICS_TOKEN.encode()
+    )
+
+
+@never_cache
+@require_GET
+async def pool(request: HttpRequest) -> JsonResponse:
+    if not authorized(request):
+        raise Http404
+
+    return JsonResponse({"pid": os.getpid(), "default": pool_stats()})
+
+
+@never_cache
+@require_GET
+def prometheus(request: HttpRequest) -> HttpResponse:
+    if not authorized(request):
+        raise Http404
+
+    content, content_type = exposition()
+    return HttpResponse(content, content_type=content_type)
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class GateConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "gate"
+
+    def ready(self) -> None:
+        from . import signals  # noqa: F401
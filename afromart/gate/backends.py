@@ -0,0 +1,35 @@
+from django.contrib.auth import backends
+from django.contrib.auth.models import AbstractBaseUser, User
+from django.http import HttpRequest
+
+from . import hashing
+
+
+class ModelBackend(backends.ModelBackend):
+    """Django's, but async sign ins hash on HASHING_POOL, not the event loop.
+
+    May raise hashing.Saturated.
+    """
+
+    async def aauthenticate(
+        self,
+        request: HttpRequest | None,
+        username: str | None = None,
+        password: str | None = None,
+        **kwargs: object,
+    ) -> AbstractBaseUser | None:
+        if username is None:
+            username = kwargs.get(User.USERNAME_FIELD)  # pyright: ignore[reportAssignmentType]
+        if username is None or password is None:
+            return None
+        try:
+            user = await User._default_manager.aget_by_natural_key(username)
+        except User.DoesNotExist:
+            # Hash anyway, so an unknown username takes as long (#20760).
+            await hashing.amake_password(password)
+            return None
+        if await hashing.acheck_password(user, password) and self.user_can_authenticate(
+            user
+        ):
+            return user
+        return None
@@ -0,0 +1,82 @@
+import asyncio
+from collections.abc import Callable
+from typing import Any
+
+from django.conf import settings
+from django.contrib.auth.hashers import make_password, verify_password
+from django.contrib.auth.models import AbstractBaseUser, User
+from django.http import HttpResponse
+
+MESSAGE = "We're busy right now. Please try again in a moment."
+
+
+class Saturated(Exception):
+    """Every hashing thread is busy and HASHING_QUEUE more are waiting."""
+
+
+async def _run(function: Callable[..., Any], *args: object) -> Any:
+    """`function(*args)` on HASHING_POOL, or Saturated at once if it's backed up.
+
+    Hashing is CPU-bound by design; on request threads or the event loop a
+    burst of sign ins would starve every other request.
+    """
+
+    slots = settings.HASHING_SLOTS
+    if not slots.acquire(blocking=False):
+        raise Saturated
+    try:
+        future = settings.HASHING_POOL.submit(function, *args)
+    except BaseException:
+        slots.release()
+        raise
+    # Held until the hash is done, even if the awaiting request is cancelled.
+    future.add_done_callback(lambda _: slots.release())
+    return await asyncio.wrap_future(future)
+
+
+def busy(response: HttpResponse) -> HttpResponse:
+    """Mark a response to a request turned away with Saturated."""
+
+    response.status_code = 503
+    response.headers["Retry-After"] = "1"
+    return response
+
+
+async def amake_password(password: str) -> str:
+    return await _run(make_password, password)
+
+
+async def aset_password(user: AbstractBaseUser, password: str) -> None:
+    """set_password(), hashing on HASHING_POOL; the caller saves."""
+
+    user.password = await amake_password(password)
+    user._password = password  # pyright: ignore[reportAttributeAccessIssue]
+
+
+async def acheck_password(user: AbstractBaseUser, password: str) -> bool:
+    """check_password(), hashing on HASHING_POOL.
+
+    A correct password stored with an older hasher or work factor is rehashed
+    with the first of PASSWORD_HASHERS and saved.
+    """
+
+    correct, outdated = await _run(verify_password, password, user.password)
+    if correct and outdated:
+        await aset_password(user, password)
+        await user.asave(update_fields=["password"])
+    return correct
+
+
+async def acreate_user(
+    *, username: str, email: str, password: str, **fields: object
+) -> User:
+    """User.objects.acreate_user(), hashing on HASHING_POOL."""
+
+    user = User(
+        username=User.normalize_username(username),
+        email=User.objects.normalize_email(email),
+        **fields,
+    )
+    await aset_password(user, password)
+    await user.asave()
+    return user
@@ -0,0 +1,265 @@
+import secrets
+import threading
+from argparse import ArgumentParser
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from afromart import benchmark
+from afromart.mail import queue
+from afromart.redis import connection as redis
+
+from ... import tokens
+
+HISTORY = settings.BASE_DIR.parent / "lab" / "benchmarks" / "gate.json"
+# Passes the signup form's validators and stays under its 21 characters.
+PASSWORD = "Kente-Loom-2025!"
+
+
+class Command(BaseCommand):
+    help = (
+        "Load-test the gate flows, in process against the local Postgres and "
+        "Redis or over HTTP; record runs to a JSON history and flag regressions."
+    )
+
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        parser.add_argument(
+            "--in-process",
+            action="store_true",
+            help="POST sign in, sign up, password reset request and signup "
+            "verification through the Django test client.",
+        )
+        parser.add_argument(
+            "--target",
+            action="append",
+            default=[],
+            help="name=base_url, e.g. asgi=http://127.0.0.1:8001 (repeatable); "
+            "GETs each gate page and POSTs a failed sign in and a password reset "
+            "request over HTTP. Turn the target's RATE_LIMIT off.",
+        )
+        parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16])
+        parser.add_argument("--requests", type=int, default=200)
+        parser.add_argument("--history", type=Path, default=HISTORY)
+        parser.add_argument(
+            "--no-record", action="store_true", help="Don't append to the history."
+        )
+        parser.add_argument(
+            "--compare",
+            nargs="?",
+            const="",
+            metavar="COMMIT",
+            help="Compare the latest run with the one before it, or with the "
+            "latest run of COMMIT; exits non-zero on regressions.",
+        )
+        parser.add_argument(
+            "--threshold",
+            type=float,
+            default=0.1,
+            help="Relative slowdown that counts as a regression.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        if not (
+            options["in_process"] or options["target"] or options["compare"] is not None
+        ):
+            raise CommandError("Pass --in-process, --target or --compare.")
+
+        results: list[dict[str, Any]] = []
+        if options["in_process"]:
+            results += self.in_process(options)
+        for target in options["target"]:
+            results += self.over_http(target, options)
+
+        if results and not options["no_record"]:
+            run = benchmark.record(options["history"], results)
+            self.stdout.write(f"Recorded {run['commit']} to {options['history']}")
+
+        if options["compare"] is not None:
+            self.compare(options)
+
+    def measure(
+        self,
+        scenario: str,
+        call: Callable[[], bool],
+        options: dict[str, Any],
+        *,
+        count_queries: bool,
+    ) -> list[dict[str, Any]]:
+        results: list[dict[str, Any]] = []
+
+        for concurrency in options["concurrency"]:
+            queries = [0]
+            lock = threading.Lock()
+
+            def counted() -> bool:
+                with CaptureQueriesContext(connection) as captured:
+                    ok = call()
+                with lock:
+                    queries[0] += len(captured)
+                return ok
+
+            result = benchmark.run(
+                scenario,
+                benchmark.releasing(counted if count_queries else call),
+                concurrency=concurrency,
+                requests=options["requests"],
+            )
+            row = result.as_dict()
+            if count_queries:
+                row["queries_per_request"] = round(queries[0] / result.requests, 2)
+            results.append(row)
+            self.stdout.write(f"{result}  q/req={row.get('queries_per_request', '-')}")
+
+        return results
+
+    def in_process(self, options: dict[str, Any]) -> list[dict[str, Any]]:
+        # Usernames must be 8-21 letters and digits; signup adds a counter.
+        prefix = f"bm{secrets.token_hex(3)}"
+        total = options["requests"] * len(options["concurrency"])
+        lock = threading.Lock()
+        counter = iter(range(total * 2))
+
+        def next_index() -> int:
+            with lock:
+                return next(counter)
+
+        member = User.objects.create_user(
+            username=f"{prefix}member",
+            email=f"{prefix}member@gmail.com",
+            password=PASSWORD,
+        )
+        pending = User.objects.bulk_create(
+            User(username=f"{prefix}pending{index}", is_active=False)
+            for index in range(total)
+        )
+        verifications = [tokens.make("signup", user) for user in pending]
+
+        def signin() -> bool:
+            response = Client().post(
+                reverse("gate:signin"),
+                {"username": member.username, "password": PASSWORD},
+            )
+            return response.status_code == 302
+
+        def signup() -> bool:
+            index = next_index()
+            response = Client().post(
+                reverse("gate:signup"),
+                {
+                    "username": f"{prefix}{index}",
+                    "email": f"{prefix}{index}@gmail.com",
+                    "password": PASSWORD,
+                },
+            )
+            return response.status_code == 200
+
+        def password_reset_request() -> bool:
+            response = Client().post(
+                reverse("gate:password_reset_request"), {"email": member.email}
+            )
+            return response.status_code == 200
+
+        def signup_verify() -> bool:
+            token = verifications[next_index() % total]
+            response = Client().get(reverse("gate:signup_verify", args=(token,)))
+            return response.status_code == 200
+
+        try:
+            results: list[dict[str, Any]] = []
+            # Every scenario repeats one IP and identity; see benchmark_ratelimit.
+            with override_settings(RATE_LIMIT=False):
+                for scenario, call in (
+                    ("signin", signin),
+                    ("signup", signup),
+                    ("password_reset_request", password_reset_request),
+                    ("signup_verify", signup_verify),
+                ):
+                    results += self.measure(
+                        f"in-process:{scenario}", call, options, count_queries=True
+                    )
+            return results
+        finally:
+            self.clean_up(prefix)
+
+    def clean_up(self, prefix: str) -> None:
+        users = User.objects.filter(username__startswith=prefix)
+        users.delete()
+
+        for payload in redis().lrange(queue.QUEUE, 0, -1):
+            if prefix.encode() in payload:
+                redis().lrem(queue.QUEUE, 0, payload)
+
+    def over_http(self, target: str, options: dict[str, Any]) -> list[dict[str, Any]]:
+        name, _, base_url = target.partition("=")
+        if not base_url:
+            raise CommandError(f"Expected name=base_url, got {target!r}.")
+        base_url = base_url.rstrip("/")
+
+        paths = {
+            "signin": reverse("gate:signin"),
+            "signup": reverse("gate:signup"),
+            "password_reset_request": reverse("gate:password_reset_request"),
+            "signup_verify": reverse("gate:signup_verify", args=("benchmark",)),
+        }
+
+        # Neither needs a user on the target, and both still go through the
+        # async ORM; the sign in hashes the password as for a real user.
+        posts = {
+            "signin_post": (
+                reverse("gate:signin"),
+                {"username": "benchmark", "password": PASSWORD},
+            ),
+            "password_reset_request_post": (
+                reverse("gate:password_reset_request"),
+                {"email": "benchmark@gmail.com"},
+            ),
+        }
+
+        calls = {
+            **{
+                scenario: benchmark.http_get(f"{base_url}{path}")
+                for scenario, path in paths.items()
+            },
+            **{
+                scenario: benchmark.http_post(f"{base_url}{path}", data)
+                for scenario, (path, data) in posts.items()
+            },
+        }
+        results: list[dict[str, Any]] = []
+        for scenario, call in calls.items():
+            results += self.measure(
+                f"{name}:{scenario}", call, options, count_queries=False
+            )
+        return results
+
+    def compare(self, options: dict[str, Any]) -> None:
+        history = benchmark.load_history(options["history"])
+        if len(history) < 2:
+            self.stdout.write("Nothing to compare against yet.")
+            return
+
+        after = history[-1]
+        if commit := options["compare"]:
+            matching = [run for run in history[:-1] if run["commit"].startswith(commit)]
+            if not matching:
+                raise CommandError(f"No recorded run for {commit}.")
+            before = matching[-1]
+        else:
+            before = history[-2]
+
+        self.stdout.write(f"{before['commit']} → {after['commit']}")
+        if found := benchmark.regressions(
+            before, after, threshold=options["threshold"]
+        ):
+            for regression in found:
+                self.stdout.write(self.style.ERROR(f"  {regression}"))
+            raise CommandError(f"{len(found)} regression(s).")
+        self.stdout.write(self.style.SUCCESS("  No regressions."))
@@ -0,0 +1,149 @@
+import os
+import subprocess
+import sys
+import sysconfig
+from argparse import ArgumentParser
+from typing import Any
+
+from asgiref.sync import async_to_sync
+from django.conf import settings
+from django.contrib.auth.hashers import make_password, verify_password
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.test import Client, override_settings
+from django.urls import reverse
+from django.utils.module_loading import import_string
+
+from afromart import benchmark
+
+from ... import hashing
+
+PASSWORD = "Kente-Loom-2025!"
+
+
+class Command(BaseCommand):
+    help = (
+        "Sign-in throughput per core for each password hasher: bare hashes on "
+        "N threads, then sign ins through HASHING_POOL. On a free-threaded "
+        "build, runs once with the GIL and once without."
+    )
+
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        cores = os.process_cpu_count() or 1
+        parser.add_argument("--hashers", nargs="+", default=["scrypt", "pbkdf2_sha256"])
+        parser.add_argument(
+            "--threads",
+            type=int,
+            nargs="+",
+            default=sorted({1, max(1, cores // 2), cores, cores * 2}),
+        )
+        parser.add_argument("--requests", type=int, default=100)
+        parser.add_argument(
+            "--gil",
+            choices=("both", "current"),
+            default="both",
+            help="'both' re-runs this command with PYTHON_GIL=1 and =0 when the "
+            "interpreter is free-threaded.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        if options["gil"] == "both" and sysconfig.get_config_var("Py_GIL_DISABLED"):
+            for gil in ("1", "0"):
+                self.stdout.write(f"PYTHON_GIL={gil}")
+                self.stdout.flush()
+                if subprocess.run(
+                    [
+                        sys.executable,
+                        "-m",
+                        "django",
+                        "benchmark_hashing",
+                        "--gil=current",
+                        f"--requests={options['requests']}",
+                        "--hashers",
+                        *options["hashers"],
+                        "--threads",
+                        *map(str, options["threads"]),
+                    ],
+                    cwd=settings.BASE_DIR,
+                    env=os.environ | {"PYTHON_GIL": gil},
+                ).returncode:
+                    raise CommandError(f"The PYTHON_GIL={gil} run failed.")
+            return
+
+        cores = os.process_cpu_count() or 1
+        gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+        self.stdout.write(
+            f"Python {sys.version.split()[0]}, GIL {'on' if gil else 'off'}, "
+            f"{cores} cores, HASHING_WORKERS={settings.HASHING_WORKERS}"
+        )
+
+        for algorithm in options["hashers"]:
+            # First, so it's what signing in keeps rather than rehashes to.
+            path = next(
+                (
+                    path
+                    for path in settings.PASSWORD_HASHERS
+                    if import_string(path).algorithm == algorithm
+                ),
+                None,
+            )
+            if path is None:
+                raise CommandError(f"{algorithm} isn't in PASSWORD_HASHERS.")
+
+            with override_settings(
+                PASSWORD_HASHERS=[
+                    path,
+                    *(other for other in settings.PASSWORD_HASHERS if other != path),
+                ],
+                RATE_LIMIT=False,
+            ):
+                encoded = make_password(PASSWORD)
+                user = User.objects.create_user(
+                    username=f"bmhash{algorithm[:10]}", password=PASSWORD
+                )
+                try:
+                    self.measure(algorithm, encoded, user, cores, options)
+                finally:
+                    user.delete()
+
+    def measure(
+        self,
+        algorithm: str,
+        encoded: str,
+        user: User,
+        cores: int,
+        options: dict[str, Any],
+    ) -> None:
+        def bare() -> bool:
+            correct, _ = verify_password(PASSWORD, encoded)
+            return correct
+
+        def through_pool() -> bool:
+            return async_to_sync(hashing.acheck_password)(user, PASSWORD)
+
+        def signin() -> bool:
+            response = Client().post(
+                reverse("gate:signin"),
+                {"username": user.username, "password": PASSWORD},
+            )
+            return response.status_code == 302
+
+        for scenario, call in (
+            ("verify", bare),
+            ("verify via pool", through_pool),
+            ("sign in", signin),
+        ):
+            for threads in options["threads"]:
+                result = benchmark.run(
+                    f"{algorithm}: {scenario}",
+                    benchmark.releasing(call),
+                    concurrency=threads,
+                    requests=options["requests"],
+                )
+                hashing_threads = (
+                    threads
+                    if scenario == "verify"
+                    else min(threads, settings.HASHING_WORKERS)
+                )
+                per_core = result.throughput / min(hashing_threads, cores)
+                self.stdout.write(f"{result}  {per_core:.1f}/s per core")
@@ -0,0 +1,130 @@
+import secrets
+import threading
+from argparse import ArgumentParser
+from collections import Counter
+from collections.abc import Callable
+from typing import Any
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test import Client, override_settings
+from django.urls import reverse
+
+from afromart import benchmark
+
+from ... import ratelimit
+
+PASSWORD = "Kente-Loom-2025!"
+
+
+def address(network: int, index: int) -> str:
+    return f"10.{network}.{index // 256 % 256}.{index % 256}"
+
+
+class Command(BaseCommand):
+    help = (
+        "Sign legitimate users in while attacker threads stuff credentials "
+        "from a few IPs, with the rate limiter off and on."
+    )
+
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        parser.add_argument(
+            "--requests", type=int, default=200, help="Legitimate sign ins per run."
+        )
+        parser.add_argument("--concurrency", type=int, default=4)
+        parser.add_argument("--attackers", type=int, default=16, help="Threads.")
+        parser.add_argument("--attacker-ips", type=int, default=4)
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        # Usernames must be 8-21 letters and digits.
+        prefix = f"rl{secrets.token_hex(3)}"
+        total = options["requests"] * 2
+        # Hashed once: create_user would spend minutes in PBKDF2 here.
+        password = make_password(PASSWORD)
+        User.objects.bulk_create(
+            User(username=f"{prefix}{index}", password=password)
+            for index in range(total)
+        )
+        lock = threading.Lock()
+        counter = iter(range(total))
+
+        def legitimate() -> bool:
+            # Every user signs in once, from their own address.
+            with lock:
+                index = next(counter)
+            response = Client(REMOTE_ADDR=address(1, index)).post(
+                reverse("gate:signin"),
+                {"username": f"{prefix}{index}", "password": PASSWORD},
+            )
+            return response.status_code == 302
+
+        try:
+            for enabled in (False, True):
+                with override_settings(RATE_LIMIT=enabled):
+                    ratelimit.reset()
+                    result, statuses = self.under_attack(
+                        f"signin, limiter {'on' if enabled else 'off'}",
+                        legitimate,
+                        options,
+                    )
+                self.stdout.write(str(result))
+                self.stdout.write(
+                    f"  attack: {sum(statuses.values())} attempts, "
+                    + ", ".join(
+                        f"{count} × {status}"
+                        for status, count in sorted(statuses.items())
+                    )
+                )
+        finally:
+            User.objects.filter(username__startswith=prefix).delete()
+            ratelimit.reset()
+
+    def under_attack(
+        self, name: str, legitimate: Callable[[], bool], options: dict[str, Any]
+    ) -> tuple[benchmark.Result, Counter[int]]:
+        stop = threading.Event()
+        statuses: Counter[int] = Counter()
+        lock = threading.Lock()
+
+        def attack(attacker: int) -> None:
+            client = Client(REMOTE_ADDR=address(2, attacker % options["attacker_ips"]))
+            local: Counter[int] = Counter()
+            try:
+                while not stop.is_set():
+                    try:
+                        response = client.post(
+                            reverse("gate:signin"),
+                            {
+                                "username": f"victim{secrets.token_hex(4)}",
+                                "password": secrets.token_urlsafe(12),
+                            },
+                        )
+                    finally:
+                        # Back to the pool after each attempt: the attackers
+                        # outnumber its connections.
+                        connection.close()
+                    local[response.status_code] += 1
+            finally:
+                with lock:
+                    statuses.update(local)
+
+        threads = [
+            threading.Thread(target=attack, args=(attacker,))
+            for attacker in range(options["attackers"])
+        ]
+        for thread in threads:
+            thread.start()
+        try:
+            result = benchmark.run(
+                name,
+                benchmark.releasing(legitimate),
+                concurrency=options["concurrency"],
+                requests=options["requests"],
+            )
+        finally:
+            stop.set()
+            for thread in threads:
+                thread.join()
+        return result, statuses
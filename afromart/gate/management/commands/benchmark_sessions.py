@@ -0,0 +1,83 @@
+from argparse import ArgumentParser
+from typing import Any
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test import Client, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from afromart import benchmark
+from afromart.instrumentation import measure
+
+PASSWORD = "Kente-Loom-2025!"
+
+
+class Command(BaseCommand):
+    help = (
+        "Queries and cache round trips per signed-in request, with Django's "
+        "cache sessions and auth middleware, then with gate's."
+    )
+
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        parser.add_argument("--requests", type=int, default=500)
+        parser.add_argument(
+            "--path",
+            nargs="+",
+            default=[reverse("gate:signin"), reverse("order:cart")],
+            help="Signed-in pages to GET.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        user = User.objects.create_user(username="bmsessions", password=PASSWORD)
+        try:
+            for label, engine, middleware in (
+                (
+                    "django",
+                    "django.contrib.sessions.backends.cache",
+                    "django.contrib.auth.middleware.AuthenticationMiddleware",
+                ),
+                ("gate", "gate.sessions", "gate.middleware.AuthenticationMiddleware"),
+            ):
+                # TimingMiddleware would measure each request into its own
+                # Metrics.
+                with override_settings(
+                    SESSION_ENGINE=engine,
+                    MIDDLEWARE=[
+                        middleware
+                        if name == "gate.middleware.AuthenticationMiddleware"
+                        else name
+                        for name in settings.MIDDLEWARE
+                        if name != "afromart.middleware.TimingMiddleware"
+                    ],
+                    RATE_LIMIT=False,
+                ):
+                    for path in options["path"]:
+                        self.measure(f"{label}: GET {path}", user, path, options)
+        finally:
+            user.delete()
+
+    def measure(
+        self, name: str, user: User, path: str, options: dict[str, Any]
+    ) -> None:
+        client = Client()
+        client.force_login(user)
+        client.get(path)  # The first request takes the snapshot.
+
+        queries = round_trips = 0
+
+        def get() -> bool:
+            nonlocal queries, round_trips
+            with CaptureQueriesContext(connection) as captured, measure() as metrics:
+                response = client.get(path)
+            queries += len(captured)
+            round_trips += metrics.cache_round_trips
+            return response.status_code < 400
+
+        result = benchmark.run(name, get, concurrency=1, requests=options["requests"])
+        self.stdout.write(
+            f"{result}  {queries / options['requests']:.2f} queries, "
+            f"{round_trips / options['requests']:.2f} cache round trips per request"
+        )
@@ -0,0 +1,76 @@
+import time
+from argparse import ArgumentParser
+from typing import Any
+
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import caches
+from django.core.management.base import BaseCommand
+from django.template import Engine, RequestContext
+from django.template.backends.django import get_installed_libraries
+from django.test import RequestFactory
+
+from ...forms import SignIn, SignUp
+
+LOADERS = [
+    "django.template.loaders.filesystem.Loader",
+    "django.template.loaders.app_directories.Loader",
+]
+TEMPLATES = {"gate/signin.html": SignIn, "gate/signup.html": SignUp}
+
+
+class Command(BaseCommand):
+    help = (
+        "Time rendering the sign in and sign up pages: uncached loaders, the "
+        "cached loader, and the cached loader with warm fragment caches."
+    )
+
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        parser.add_argument("--renders", type=int, default=2000)
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        fragments = caches["template_fragments"]
+        configurations = (
+            ("uncached loaders", LOADERS, True),
+            (
+                "cached loader",
+                [("django.template.loaders.cached.Loader", LOADERS)],
+                True,
+            ),
+            (
+                "cached loader + fragments",
+                [("django.template.loaders.cached.Loader", LOADERS)],
+                False,
+            ),
+        )
+
+        for template_name, form in TEMPLATES.items():
+            for label, loaders, cold_fragments in configurations:
+                engine = Engine(
+                    dirs=[str(path) for path in settings.TEMPLATES[0]["DIRS"]],
+                    context_processors=settings.TEMPLATES[0]["OPTIONS"][
+                        "context_processors"
+                    ],
+                    loaders=loaders,
+                    libraries=get_installed_libraries(),
+                )
+                request = RequestFactory().get("/")
+                request.user = AnonymousUser()
+                fragments.clear()
+
+                wall = cpu = 0.0
+                for _ in range(options["renders"]):
+                    if cold_fragments:
+                        fragments.clear()
+                    wall_started, cpu_started = time.perf_counter(), time.process_time()
+                    engine.get_template(template_name).render(
+                        RequestContext(request, {"form": form()})
+                    )
+                    wall += time.perf_counter() - wall_started
+                    cpu += time.process_time() - cpu_started
+
+                self.stdout.write(
+                    f"{template_name:<20} {label:<28} "
+                    f"{wall / options['renders'] * 1e6:>8.1f}µs wall "
+                    f"{cpu / options['renders'] * 1e6:>8.1f}µs CPU per render"
+                )
@@ -0,0 +1,84 @@
+from functools import partial
+from typing import Any
+
+from django.contrib import auth
+from django.contrib.auth import middleware
+from django.contrib.auth.models import AnonymousUser, User
+from django.contrib.sessions.backends.base import SessionBase
+from django.http import HttpRequest
+from django.utils.functional import SimpleLazyObject
+
+from . import sessions
+
+SNAPSHOT_KEY = "_auth_user_snapshot"
+# What the pages and the admin's gate read, in the model's field order
+# (from_db needs it); any other field loads on access.
+FIELDS = ("username", "is_staff", "is_active")
+
+
+def _from_snapshot(session: SessionBase) -> User | None:
+    """The signed-in user as of the session's snapshot, if it's still current."""
+
+    if not isinstance(session, sessions.SessionStore):
+        return None
+    match session.get(SNAPSHOT_KEY):
+        case [session_key, epoch, user_id, *values] if (
+            session_key == session.session_key
+            and epoch == session.epoch
+            and user_id == session.get(auth.SESSION_KEY)
+        ):
+            return User.from_db(
+                "default", ("id", *FIELDS), (User._meta.pk.to_python(user_id), *values)
+            )
+    return None
+
+
+def _snapshot(session: SessionBase, user: Any) -> None:
+    if isinstance(session, sessions.SessionStore) and user.is_authenticated:
+        session[SNAPSHOT_KEY] = [
+            session.session_key,
+            session.epoch,
+            session[auth.SESSION_KEY],
+            *(getattr(user, field) for field in FIELDS),
+        ]
+
+
+def get_user(request: HttpRequest) -> Any:
+    if not hasattr(request, "_cached_user"):
+        session = request.session
+        if (user := _from_snapshot(session)) is None:
+            if user_id := session.get(auth.SESSION_KEY):
+                # Before reading the user, so that a change from here on
+                # bumps the epoch this snapshot is taken at.
+                sessions.register(user_id, session.session_key)  # pyright: ignore[reportArgumentType]
+            user = auth.get_user(request)
+            _snapshot(session, user)
+        request._cached_user = user  # pyright: ignore[reportAttributeAccessIssue]
+    return request._cached_user  # pyright: ignore[reportAttributeAccessIssue]
+
+
+async def auser(request: HttpRequest) -> Any:
+    if not hasattr(request, "_acached_user"):
+        session = request.session
+        # Loads the session, so the sync reads below stay in memory.
+        if (user_id := await session.aget(auth.SESSION_KEY)) is None:
+            user = AnonymousUser()
+        elif (user := _from_snapshot(session)) is None:
+            await sessions.aregister(user_id, session.session_key)
+            user = await auth.aget_user(request)
+            _snapshot(session, user)
+        request._acached_user = user  # pyright: ignore[reportAttributeAccessIssue]
+    return request._acached_user  # pyright: ignore[reportAttributeAccessIssue]
+
+
+class AuthenticationMiddleware(middleware.AuthenticationMiddleware):
+    """Django's, but request.user comes from a snapshot in the session while
+    the account is unchanged (sessions.invalidate), saving the auth_user query.
+
+    The snapshot is a User with FIELDS loaded and the rest deferred.
+    """
+
+    def process_request(self, request: HttpRequest) -> None:
+        super().process_request(request)  # Checks for the session middleware.
+        request.user = SimpleLazyObject(lambda: get_user(request))  # pyright: ignore[reportAttributeAccessIssue]
+        request.auser = partial(auser, request)  # pyright: ignore[reportAttributeAccessIssue]
@@ -0,0 +1,67 @@
+# Generated by Django 5.2.7 on 2026-10-18 12:20
+
+from django.db import migrations
+from django.db.models import Count
+from django.db.models.functions import Upper
+
+INDEX = "auth_user_email_upper_uniq"
+
+
+def prepare(apps, schema_editor):
+    # Sign up only ever compared emails exactly, so some may differ by case
+    # alone; building the index would fail on them, so say which.
+    User = apps.get_model("auth", "User")
+    duplicates = (
+        User.objects.exclude(email="")
+        .values(upper=Upper("email"))
+        .annotate(accounts=Count("id"))
+        .filter(accounts__gt=1)
+        .values_list("upper", flat=True)
+    )
+    if duplicates := list(duplicates):
+        accounts = User.objects.annotate(upper=Upper("email")).filter(
+            upper__in=duplicates
+        )
+        raise RuntimeError(
+            "Emails shared by more than one account, ignoring case; change or "
+            "merge them, then migrate again:\n"
+            + "\n".join(
+                f"  {user.email} ({user.username}, id {user.pk})"
+                for user in accounts.order_by("upper", "pk")
+            )
+        )
+
+    # A build that failed part way leaves an invalid index behind, which
+    # enforces nothing but keeps the name taken.
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT 1 FROM pg_index JOIN pg_class ON pg_class.oid = indexrelid
+            WHERE relname = %s AND NOT indisvalid
+            """,
+            [INDEX],
+        )
+        if cursor.fetchone():
+            schema_editor.execute(f"DROP INDEX CONCURRENTLY {INDEX}")
+
+
+class Migration(migrations.Migration):
+    # Built concurrently so signups keep working meanwhile.
+    atomic = False
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+    ]
+
+    # auth.User can't declare this, so it's plain SQL. Blank emails (users
+    # made outside sign up) may repeat; `email__iexact` lookups use it.
+    operations = [
+        migrations.RunPython(prepare, migrations.RunPython.noop),
+        migrations.RunSQL(
+            sql=f"""
+                CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS {INDEX}
+                ON auth_user (UPPER(email)) WHERE email <> '';
+            """,
+            reverse_sql=f"DROP INDEX CONCURRENTLY {INDEX};",
+        ),
+    ]
@@ -0,0 +1,131 @@
+import math
+import time
+from dataclasses import dataclass
+from functools import cache
+from itertools import batched
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse
+from redis.commands.core import Script
+
+from afromart.redis import connection, namespaced
+
+
+@dataclass(frozen=True, slots=True)
+class Limit:
+    requests: int
+    seconds: int
+
+
+# Per client IP, then per submitted username or email address. The IP limit
+# leaves room for a household or office behind one NAT; the identity limit is
+# what stops a botnet working through one account's password.
+LIMITS: dict[str, tuple[Limit, Limit]] = {
+    "signin": (Limit(requests=30, seconds=60), Limit(requests=10, seconds=5 * 60)),
+    "signup": (Limit(requests=10, seconds=10 * 60), Limit(requests=5, seconds=60 * 60)),
+    "password_reset_request": (
+        Limit(requests=10, seconds=10 * 60),
+        Limit(requests=5, seconds=60 * 60),
+    ),
+}
+
+# A sliding window approximated from two fixed ones: the previous window's
+# count, weighted by how much of it still overlaps, plus the current one's.
+# Every limit is checked before any is counted, so rejected attempts aren't
+# counted and a limit lifts within one window of an attack stopping.
+# KEYS: the current and previous window's counter for each limit, in pairs.
+# ARGV: now in ms, then each limit's requests and window in ms.
+# Returns 0 if allowed, else the ms until the attempt would be.
+HIT = """
+local now = tonumber(ARGV[1])
+local wait = 0
+for i = 1, #KEYS, 2 do
+    local limit = tonumber(ARGV[i + 1])
+    local window = tonumber(ARGV[i + 2])
+    local elapsed = now % window
+    local current = tonumber(redis.call('GET', KEYS[i]) or 0)
+    local previous = tonumber(redis.call('GET', KEYS[i + 1]) or 0)
+    if current + previous * (1 - elapsed / window) >= limit then
+        local retry = window - elapsed
+        if current < limit and previous > 0 then
+            retry = math.ceil(window * (1 - (limit - current) / previous)) - elapsed
+        end
+        wait = math.max(wait, retry, 1)
+    end
+end
+if wait > 0 then
+    return wait
+end
+for i = 1, #KEYS, 2 do
+    redis.call('INCR', KEYS[i])
+    redis.call('PEXPIRE', KEYS[i], 2 * tonumber(ARGV[i + 2]))
+end
+return 0
+"""
+
+
+@cache
+def _script() -> Script:
+    return connection().register_script(HIT)
+
+
+def client_ip(request: HttpRequest) -> str:
+    # Fly's proxy sets this and overwrites whatever the client sent.
+    return request.headers.get("Fly-Client-IP") or request.META.get("REMOTE_ADDR", "")
+
+
+def hit(scope: str, request: HttpRequest, identity: str = "") -> int:
+    """Count an attempt at `scope`; 0, or the seconds to wait if over a limit.
+
+    One round trip, before any hashing or database work.
+    """
+
+    if not settings.RATE_LIMIT:
+        return 0
+
+    now = int(time.time() * 1000)
+    keys: list[str] = []
+    args: list[int] = [now]
+    for limit, (kind, value) in zip(
+        LIMITS[scope], (("ip", client_ip(request)), ("identity", identity))
+    ):
+        if not (value := value.strip().lower()):
+            continue
+        window = limit.seconds * 1000
+        bucket = now // window
+        keys += (
+            namespaced("ratelimit", scope, kind, value, str(bucket)),
+            namespaced("ratelimit", scope, kind, value, str(bucket - 1)),
+        )
+        args += (limit.requests, window)
+
+    if not keys:
+        return 0
+    return math.ceil(int(_script()(keys=keys, args=args)) / 1000)
+
+
+ahit = sync_to_async(hit, thread_sensitive=False)
+
+
+def message(retry_after: int) -> str:
+    minutes = math.ceil(retry_after / 60)
+    return (
+        "Too many attempts. Please try again in "
+        f"{'a minute' if minutes == 1 else f'{minutes} minutes'}."
+    )
+
+
+def limited(response: HttpResponse, retry_after: int) -> HttpResponse:
+    response.status_code = 429
+    response.headers["Retry-After"] = str(retry_after)
+    return response
+
+
+def reset() -> None:
+    """Forget every attempt."""
+
+    redis = connection()
+    pattern = namespaced("ratelimit", "*")
+    for keys in batched(redis.scan_iter(match=pattern, count=1000), 500):
+        redis.unlink(*keys)
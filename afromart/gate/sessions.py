@@ -0,0 +1,128 @@
+"""Cache sessions that take one round trip to read and none to leave alone.
+
+A load fetches the session with its epoch, a counter that invalidate()
+bumps when the user's account changes, in one MGET. A save is skipped when
+the data is what was loaded, however often it was assigned to, and is
+otherwise one SET XX instead of Django's GET then SET.
+"""
+
+import pickle
+import time
+from typing import Any
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.sessions.backends import cache
+from django.contrib.sessions.backends.base import UpdateError
+from django.core.cache import caches
+
+from afromart.instrumentation import record_cache
+from afromart.redis import connection, namespaced
+
+
+def _dump(data: dict[str, Any]) -> bytes:
+    return pickle.dumps(data, pickle.HIGHEST_PROTOCOL)
+
+
+class SessionStore(cache.SessionStore):
+    def __init__(self, session_key: str | None = None) -> None:
+        super().__init__(session_key)
+        self.epoch = 0
+        self._loaded: bytes | None = None
+
+    @classmethod
+    def epoch_key(cls, session_key: str) -> str:
+        return f"{cls.cache_key_prefix}{session_key}:epoch"
+
+    def _found(
+        self, cache_key: str, epoch_key: str, found: dict[str, Any]
+    ) -> dict[str, Any]:
+        self.epoch = found.get(epoch_key, 0)
+        if (data := found.get(cache_key)) is None:
+            self._session_key = None
+            return {}
+        self._loaded = _dump(data)
+        return data
+
+    def load(self) -> dict[str, Any]:
+        cache_key, epoch_key = self.cache_key, self.epoch_key(self.session_key)  # pyright: ignore[reportArgumentType]
+        try:
+            found = self._cache.get_many([cache_key, epoch_key])
+        except Exception:
+            found = {}  # An invalid key; as Django's, start over.
+        return self._found(cache_key, epoch_key, found)
+
+    async def aload(self) -> dict[str, Any]:
+        cache_key = await self.acache_key()
+        epoch_key = self.epoch_key(self.session_key)  # pyright: ignore[reportArgumentType]
+        try:
+            found = await self._cache.aget_many([cache_key, epoch_key])
+        except Exception:
+            found = {}
+        return self._found(cache_key, epoch_key, found)
+
+    def _replace(self, data: dict[str, Any], dumped: bytes) -> None:
+        """Overwrite the session, unless it has been deleted since it was loaded."""
+
+        started = time.perf_counter()
+        try:
+            backend = self._cache._cache  # pyright: ignore[reportAttributeAccessIssue]
+            replaced = backend.get_client(write=True).set(
+                self._cache.make_and_validate_key(self.cache_key),
+                backend._serializer.dumps(data),
+                ex=self.get_expiry_age(),
+                xx=True,
+            )
+        finally:
+            record_cache(started)
+        if not replaced:
+            raise UpdateError
+        self._loaded = dumped
+
+    def save(self, must_create: bool = False) -> None:
+        if must_create or self.session_key is None or self._loaded is None:
+            super().save(must_create)
+            self._loaded = _dump(self._get_session(no_load=True))
+            return
+        data = self._get_session()
+        if (dumped := _dump(data)) != self._loaded:
+            self._replace(data, dumped)
+
+    async def asave(self, must_create: bool = False) -> None:
+        if must_create or self.session_key is None or self._loaded is None:
+            await super().asave(must_create)
+            self._loaded = _dump(await self._aget_session(no_load=True))
+            return
+        data = await self._aget_session()
+        if (dumped := _dump(data)) != self._loaded:
+            await sync_to_async(self._replace)(data, dumped)
+
+
+def _sessions_key(user_id: Any) -> str:
+    return namespaced("sessions", "user", str(user_id))
+
+
+def register(user_id: Any, session_key: str) -> None:
+    """Note a session holding the user's snapshot, for invalidate() to find."""
+
+    pipeline = connection().pipeline(transaction=False)
+    pipeline.sadd(_sessions_key(user_id), session_key)
+    pipeline.expire(_sessions_key(user_id), settings.SESSION_COOKIE_AGE)
+    pipeline.execute()
+
+
+aregister = sync_to_async(register, thread_sensitive=False)
+
+
+def invalidate(user_id: Any) -> None:
+    """Bump the epoch of each of the user's sessions: each re-reads the user
+    once, and Django's session hash check signs it out if the password changed."""
+
+    redis = connection()
+    make_key = caches[settings.SESSION_CACHE_ALIAS].make_key
+    pipeline = redis.pipeline(transaction=False)
+    for session_key in redis.smembers(_sessions_key(user_id)):
+        epoch = make_key(SessionStore.epoch_key(session_key.decode()))
+        pipeline.incr(epoch)
+        pipeline.expire(epoch, settings.SESSION_COOKIE_AGE)
+    pipeline.execute()
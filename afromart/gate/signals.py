@@ -0,0 +1,30 @@
+from functools import partial
+from typing import Any
+
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from . import sessions
+from .middleware import FIELDS
+
+
+@receiver(post_save, sender=User)
+def invalidate_sessions(
+    instance: User, created: bool, update_fields: Any, **kwargs: Any
+) -> None:
+    # A password change (PasswordReset, a rehash on sign in, the admin) or
+    # a change to a snapshotted field; not last_login on every sign in.
+    if created or (
+        update_fields is not None and not {"password", *FIELDS} & update_fields
+    ):
+        return
+    transaction.on_commit(partial(sessions.invalidate, instance.pk))
+
+
+@receiver(post_delete, sender=User)
+def sign_out_deleted_user(instance: User, **kwargs: Any) -> None:
+    # The snapshot would otherwise keep them signed in until the session
+    # expires; re-reading finds no user.
+    transaction.on_commit(partial(sessions.invalidate, instance.pk))
@@ -0,0 +1,38 @@
+import asyncio
+import threading
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+
+from gate import hashing
+
+
+@pytest.mark.django_db
+def test_outdated_hashes_are_upgraded_on_sign_in() -> None:
+    user = User.objects.create(
+        username="customer1", password=make_password("secret", hasher="pbkdf2_sha256")
+    )
+
+    assert async_to_sync(hashing.acheck_password)(user, "secret")
+
+    user.refresh_from_db()
+    assert user.password.startswith("scrypt$")
+    assert not async_to_sync(hashing.acheck_password)(user, "wrong")
+
+
+def test_saturated_pool_turns_requests_away(settings) -> None:
+    settings.HASHING_SLOTS = threading.BoundedSemaphore(1)
+    release = threading.Event()
+
+    async def two_at_once() -> None:
+        first = asyncio.ensure_future(hashing._run(release.wait))  # pyright: ignore[reportPrivateUsage]
+        await asyncio.sleep(0)
+        with pytest.raises(hashing.Saturated):
+            await hashing.amake_password("secret")
+        release.set()
+        await first
+        assert await hashing.amake_password("secret")
+
+    async_to_sync(two_at_once)()
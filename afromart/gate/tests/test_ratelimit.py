@@ -0,0 +1,52 @@
+from collections.abc import Iterator
+from unittest.mock import patch
+
+import pytest
+from django.test import Client, RequestFactory
+from django.urls import reverse
+
+from gate import ratelimit
+
+
+@pytest.fixture(autouse=True)
+def fresh_limits() -> Iterator[None]:
+    ratelimit.reset()
+    yield
+    ratelimit.reset()
+
+
+def test_identity_limit_is_per_identity() -> None:
+    request = RequestFactory().post("/")
+    limit = ratelimit.LIMITS["signin"][1].requests
+
+    assert not any(ratelimit.hit("signin", request, "customer") for _ in range(limit))
+    assert ratelimit.hit("signin", request, "Customer") > 0
+    assert ratelimit.hit("signin", request, "someone") == 0
+
+
+def test_ip_limit_is_per_ip() -> None:
+    request = RequestFactory().post("/", REMOTE_ADDR="10.0.0.1")
+    limit = ratelimit.LIMITS["signup"][0].requests
+
+    for index in range(limit):
+        assert not ratelimit.hit("signup", request, f"{index}@gmail.com")
+
+    assert ratelimit.hit("signup", request, "new@gmail.com")
+    assert not ratelimit.hit(
+        "signup", RequestFactory().post("/", REMOTE_ADDR="10.0.0.2"), "new@gmail.com"
+    )
+
+
+@pytest.mark.django_db
+def test_signin_rejects_before_authenticating() -> None:
+    client = Client()
+    data = {"username": "customer", "password": "wrong"}
+    for _ in range(ratelimit.LIMITS["signin"][1].requests):
+        client.post(reverse("gate:signin"), data)
+
+    with patch("gate.views.signin.aauthenticate") as authenticate:
+        response = client.post(reverse("gate:signin"), data)
+
+    assert response.status_code == 429
+    assert int(response.headers["Retry-After"]) > 0
+    authenticate.assert_not_called()
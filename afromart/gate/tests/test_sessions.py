@@ -0,0 +1,86 @@
+import pytest
+from django.contrib.auth.models import User
+from django.contrib.sessions.backends.base import UpdateError
+from django.test import Client
+from django.urls import reverse
+
+from afromart.instrumentation import measure
+from gate.sessions import SessionStore
+
+
+@pytest.fixture
+def session() -> SessionStore:
+    session = SessionStore()
+    session["cart"] = {"a": 1}
+    session.save()
+    return SessionStore(session.session_key)
+
+
+def test_unchanged_sessions_are_not_written(session: SessionStore) -> None:
+    with measure() as metrics:
+        cart = session["cart"]
+        session["cart"] = cart
+        session.save()
+    assert metrics.cache_round_trips == 1  # The load.
+
+    with measure() as metrics:
+        cart["a"] = 2
+        session["cart"] = cart
+        session.save()
+    assert metrics.cache_round_trips == 1  # One SET XX.
+    assert SessionStore(session.session_key)["cart"] == {"a": 2}
+
+
+def test_deleted_sessions_are_not_brought_back(session: SessionStore) -> None:
+    session["cart"] = {}
+    SessionStore(session.session_key).delete()
+
+    with pytest.raises(UpdateError):
+        session.save()
+
+
+@pytest.fixture
+def user() -> User:
+    return User.objects.create_user(username="customer", password="secret")
+
+
+@pytest.mark.django_db
+def test_signed_in_requests_skip_the_user_query(
+    user: User, django_assert_num_queries
+) -> None:
+    client = Client()
+    client.force_login(user)
+
+    with django_assert_num_queries(1):
+        assert client.get(reverse("gate:signin")).status_code == 302
+    with django_assert_num_queries(0):
+        assert client.get(reverse("gate:signin")).status_code == 302
+
+
+@pytest.mark.django_db
+def test_password_changes_sign_other_sessions_out(
+    user: User, django_capture_on_commit_callbacks
+) -> None:
+    elsewhere = Client()
+    elsewhere.force_login(user)
+    elsewhere.get(reverse("gate:signin"))
+
+    with django_capture_on_commit_callbacks(execute=True):
+        user.set_password("new secret")
+        user.save(update_fields=["password"])
+
+    assert elsewhere.get(reverse("gate:signin")).status_code == 200
+
+
+@pytest.mark.django_db
+def test_deleted_users_are_signed_out(
+    user: User, django_capture_on_commit_callbacks
+) -> None:
+    client = Client()
+    client.force_login(user)
+    client.get(reverse("gate:signin"))
+
+    with django_capture_on_commit_callbacks(execute=True):
+        user.delete()
+
+    assert client.get(reverse("gate:signin")).status_code == 200
@@ -0,0 +1,38 @@
+import pytest
+from asgiref.sync import async_to_sync
+from django.contrib.auth.models import User
+from django.core import signing
+
+from gate import tokens
+
+
+def test_tokens_only_work_for_their_purpose() -> None:
+    user = User(pk=7, password="hash")
+    token = tokens.make("signup", user)
+
+    assert tokens.unsign("signup", token) == (7, tokens.fingerprint(user))
+    assert tokens.unsign("password_reset", token) is None
+    assert tokens.unsign("signup", token[:-1]) is None
+    assert (
+        tokens.unsign("signup", signing.dumps("7", salt="gate.tokens.signup")) is None
+    )
+
+
+def test_tokens_expire(monkeypatch) -> None:
+    token = tokens.make("password_reset", User(pk=7))
+    monkeypatch.setitem(tokens.MAX_AGE, "password_reset", -1)
+
+    assert tokens.unsign("password_reset", token) is None
+
+
+@pytest.mark.django_db
+def test_changing_the_password_spends_the_link() -> None:
+    user = User.objects.create_user(username="customer", password="secret")
+    token = tokens.make("password_reset", user)
+    check = async_to_sync(tokens.auser)
+
+    assert check("password_reset", token) == user
+
+    user.set_password("new secret")
+    user.save(update_fields=["password"])
+    assert check("password_reset", token) is None
@@ -0,0 +1,48 @@
+import pytest
+from asgiref.sync import async_to_sync
+from django.contrib.auth.models import User
+from django.db import IntegrityError, transaction
+
+from gate import users
+
+
+@pytest.fixture
+def customer() -> User:
+    return User.objects.create_user(
+        username="customer1", password="secret", email="Customer@gmail.com"
+    )
+
+
+@pytest.mark.django_db
+def test_taken_reports_each_clash(customer: User) -> None:
+    taken = async_to_sync(users.ataken)
+
+    assert taken(username="customer1", email="new@gmail.com") == {"username"}
+    assert taken(username="customer2", email="customer@GMAIL.com") == {"email"}
+    assert taken(username="customer1", email="customer@gmail.com") == {
+        "username",
+        "email",
+    }
+    assert not taken(username="customer2", email="new@gmail.com")
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    ("username", "email", "field"),
+    (
+        ("customer1", "new@gmail.com", "username"),
+        ("customer2", "CUSTOMER@gmail.com", "email"),
+    ),
+)
+def test_indexes_catch_what_the_check_missed(
+    customer: User, username: str, email: str, field: str
+) -> None:
+    with pytest.raises(IntegrityError) as error, transaction.atomic():
+        User.objects.create_user(username=username, password="secret", email=email)
+
+    assert users.clashing(error.value) == field
+
+
+@pytest.mark.django_db
+def test_blank_emails_may_repeat() -> None:
+    User.objects.bulk_create(User(username=f"pending{index}") for index in range(2))
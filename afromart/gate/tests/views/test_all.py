@@ -1,16 +1,17 @@
-import hashlib
 from collections.abc import Callable
 from concurrent.futures import ThreadPoolExecutor
 from functools import partial
 from unittest.mock import patch
 
 import pytest
+from asgiref.sync import async_to_sync
 from django.contrib.auth.models import User
-from django.core.cache import cache
-from django.test import Client
+from django.test import AsyncClient, Client
 from django.urls import reverse_lazy
 from django.utils.functional import Promise
 
+from gate import tokens
+
 
 @pytest.fixture
 def user() -> User:
@@ -33,9 +34,8 @@ def password_reset_request_url() -> Promise:
 
 @pytest.fixture
 def password_reset_url(user: User) -> Promise:
-    user_pk_hash: str = hashlib.sha256(f"{user.pk}".encode("utf-8")).hexdigest()
-    cache.set(key=f"passwordreset_{user_pk_hash}", value=user.pk, timeout=300)
-    return reverse_lazy("gate:password_reset", kwargs={"user_pk_hash": user_pk_hash})
+    token = tokens.make("password_reset", user)
+    return reverse_lazy("gate:password_reset", kwargs={"token": token})
 
 
 @pytest.fixture
@@ -55,11 +55,8 @@ def signup_url() -> Promise:
 
 @pytest.fixture
 def signup_verify_url(inactive_user: User) -> Callable[[], Promise]:
-    user_pk_hash: str = hashlib.sha256(
-        f"{inactive_user.pk}".encode("utf-8")
-    ).hexdigest()
-    cache.set(key=f"signup_{user_pk_hash}", value=inactive_user.pk)
-    return partial(reverse_lazy, "gate:signup_verify", args=(user_pk_hash,))
+    token = tokens.make("signup", inactive_user)
+    return partial(reverse_lazy, "gate:signup_verify", args=(token,))
 
 
 @pytest.mark.skip(reason="Stable")
@@ -102,16 +99,6 @@ def test_password_reset_request_nonexistent_email(
     assert response.status_code == 200
 
 
-@pytest.mark.skip(reason="Stable")
-@pytest.mark.django_db
-def test_password_reset_request_link_already_sent(
-    client: Client, password_reset_request_url: str, user: User
-) -> None:
-    cache.set(f"password_reset_{user.pk}", "1", timeout=300)
-    response = client.post(password_reset_request_url, {"email": "customer@gmail.com"})
-    assert response.status_code == 200
-
-
 @pytest.mark.skip(reason="Stable")
 @pytest.mark.django_db
 def test_password_reset_loads(client: Client, password_reset_url: str) -> None:
@@ -156,8 +143,8 @@ def test_password_reset_loggedin(
 def test_password_reset_no_token(
     client: Client, password_reset_url: str, user: User
 ) -> None:
-    user_pk_hash: str = hashlib.sha256(f"{user.pk}".encode("utf-8")).hexdigest()
-    cache.delete(f"passwordreset_{user_pk_hash}")
+    user.set_password("secret123#$")
+    user.save(update_fields=["password"])  # Spends the link.
     assert client.get(password_reset_url).status_code == 200
     assert client.post(password_reset_url).status_code == 200
 
@@ -295,3 +282,22 @@ def test_signup_email_in_use(client: Client, signup_url: str, user: User) -> Non
         "password": "secret123",
     }
     assert client.post(signup_url, data).status_code == 200
+
+
+@pytest.mark.django_db
+def test_views_serve_asgi_requests(
+    user: User,
+    signin_url: str,
+    signup_url: str,
+    password_reset_request_url: str,
+    password_reset_url: str,
+) -> None:
+    # Through the ASGI handler, as afromart.asgi serves them.
+    client = AsyncClient()
+    get, post = async_to_sync(client.get), async_to_sync(client.post)
+
+    for url in (signin_url, signup_url, password_reset_request_url, password_reset_url):
+        assert get(url).status_code == 200
+    response = post(signin_url, {"username": "customer", "password": "secret"})
+    assert response.status_code == 302
+    assert get(signin_url).status_code == 302  # Signed in now.
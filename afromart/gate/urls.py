@@ -20,13 +20,13 @@ urlpatterns = [
         name="password_reset_request",
     ),
     path(
-        route="password_reset/<str:user_pk_hash>",
+        route="password_reset/<str:token>",
         view=PasswordReset.as_view(),
         name="password_reset",
     ),
     path(route="signup/", view=SignUp.as_view(), name="signup"),
     path(
-        route="signup_verify/<str:user_pk_hash>",
+        route="signup_verify/<str:token>",
         view=signup_verify,
         name="signup_verify",
     ),
@@ -0,0 +1,29 @@
+from django.contrib.auth.models import User
+from django.db import IntegrityError
+from django.db.models import Count, Q
+
+EMAIL_INDEX = "auth_user_email_upper_uniq"  # gate/migrations/0001_unique_email.py
+# Unique constraint or index name: the sign up field it guards.
+UNIQUE = {"auth_user_username_key": "username", EMAIL_INDEX: "email"}
+
+
+async def ataken(*, username: str, email: str) -> set[str]:
+    """Which of `username` and `email` someone already has, in one query.
+
+    Only a head start on the form errors: the unique indexes have the final say.
+    """
+
+    counts = await User.objects.filter(
+        Q(username=username) | (Q(email__iexact=email) & ~Q(email=""))
+    ).aaggregate(
+        username=Count("pk", filter=Q(username=username)),
+        email=Count("pk", filter=Q(email__iexact=email)),
+    )
+    return {field for field, count in counts.items() if count}
+
+
+def clashing(error: IntegrityError) -> str | None:
+    """The sign up field a failed User insert collided on, if that's why."""
+
+    diag = getattr(error.__cause__, "diag", None)
+    return UNIQUE.get(getattr(diag, "constraint_name", None) or "")
@@ -1,64 +1,73 @@
-from django.contrib.auth import logout
-from django.contrib.auth.models import User
-from django.core.cache import cache
-from django.db import transaction
+from django.contrib.auth import alogout
 from django.http import HttpRequest, HttpResponse
 from django.shortcuts import redirect, render
 from django.urls import reverse_lazy
 from django.views.generic import View
 
+from .. import hashing, tokens
 from ..forms import PasswordResetActionForm
 
 
 class PasswordReset(View):
-    def dispatch(
-        self, request: HttpRequest, user_pk_hash: str, *args: ..., **kwargs: ...
+    async def dispatch(
+        self, request: HttpRequest, token: str, *args: ..., **kwargs: ...
     ):
+        request.user = await request.auser()  # pyright: ignore[reportAttributeAccessIssue]
+
+        # Whose password this is: the signed in user's, or the one the link
+        # was emailed to. Changing it spends the link (tokens.fingerprint).
+        self.user = request.user
         if request.user.is_anonymous:
-            if not cache.get(key=f"passwordreset_{user_pk_hash}"):
+            if (user := await tokens.auser("password_reset", token)) is None:
                 return render(
                     request=request,
                     template_name="gate/password_reset.html",
                     context={"password_reset_expired": True},
                 )
+            self.user = user
 
-        return super().dispatch(request, user_pk_hash, *args, **kwargs)
+        return await super().dispatch(request, token, *args, **kwargs)
 
-    def get(self, request: HttpRequest, user_pk_hash: str) -> HttpResponse:
+    async def get(self, request: HttpRequest, token: str) -> HttpResponse:
         password_reset_form = PasswordResetActionForm()
         return render(
             request=request,
             template_name="gate/password_reset.html",
             context={
                 "form": password_reset_form,
-                "user_pk_hash": user_pk_hash,
+                "token": token,
                 "password_reset_live": True,
             },
         )
 
-    def post(self, request: HttpRequest, user_pk_hash: str) -> HttpResponse:
+    async def post(self, request: HttpRequest, token: str) -> HttpResponse:
         password_reset_form = PasswordResetActionForm(data=request.POST)
 
         if password_reset_form.is_valid():
             password = password_reset_form.cleaned_data["password2"]
             authenticated = request.user.is_authenticated
-            cache_key = f"passwordreset_{user_pk_hash}"
-
-            user = (
-                request.user
-                if authenticated
-                else User.objects.get(pk=int(cache.get(key=cache_key)))
-            )
+            user = self.user
 
-            with transaction.atomic():
-                user.set_password(raw_password=password)
-                user.save()
-
-                if authenticated:
-                    logout(request=request)
-                    return redirect(to=reverse_lazy("gate:signin"))  # pyright: ignore[reportArgumentType]
+            try:
+                await hashing.aset_password(user, password)  # pyright: ignore[reportArgumentType]
+            except hashing.Saturated:
+                password_reset_form.add_error(field="password2", error=hashing.MESSAGE)
+                return hashing.busy(
+                    render(
+                        request=request,
+                        template_name="gate/password_reset.html",
+                        context={
+                            "form": password_reset_form,
+                            "token": token,
+                            "password_reset_live": True,
+                        },
+                    )
+                )
+            await user.asave(update_fields=["password"])  # pyright: ignore[reportAttributeAccessIssue,reportUnknownMemberType]
 
-                cache.delete(key=cache_key)
+            if authenticated:
+                await alogout(request=request)
+                return redirect(to=reverse_lazy("gate:signin"))  # pyright: ignore[reportArgumentType]
 
             return render(
                 request=request,
@@ -71,7 +80,7 @@ class PasswordReset(View):
             template_name="gate/password_reset.html",
             context={
                 "form": password_reset_form,
-                "user_pk_hash": user_pk_hash,
+                "token": token,
                 "password_reset_live": True,
             },
         )
@@ -1,9 +1,4 @@
-import hashlib
-
-from django.conf import settings
 from django.contrib.auth.models import User
-from django.core.cache import cache
-from django.core.mail import send_mail
 from django.http import HttpRequest, HttpResponse
 from django.shortcuts import render
 from django.template.loader import render_to_string
@@ -11,28 +6,44 @@ from django.urls import reverse_lazy
 from django.utils.safestring import mark_safe
 from django.views.generic import View
 
+from afromart import mail
+
+from .. import ratelimit, tokens
 from ..forms import Email
 
 
 class PasswordResetRequest(View):
-    def get(self, request: HttpRequest) -> HttpResponse:
+    async def dispatch(self, request: HttpRequest, *args: ..., **kwargs: ...):
+        request.user = await request.auser()  # pyright: ignore[reportAttributeAccessIssue]
+        return await super().dispatch(request, *args, **kwargs)
+
+    async def get(self, request: HttpRequest) -> HttpResponse:
         return render(
             request=request,
             template_name="gate/password_reset_request.html",
             context={"form": Email()},
         )
 
-    def post(self, request: HttpRequest) -> HttpResponse:
+    async def post(self, request: HttpRequest) -> HttpResponse:
         email_form = Email(data=request.POST)
 
+        if retry_after := await ratelimit.ahit(
+            "password_reset_request", request, request.POST.get("email", "")
+        ):
+            email_form.add_error(field="email", error=ratelimit.message(retry_after))
+            return ratelimit.limited(
+                render(
+                    request=request,
+                    template_name="gate/password_reset_request.html",
+                    context={"form": email_form},
+                ),
+                retry_after,
+            )
+
         if email_form.is_valid():
             email = email_form.cleaned_data["email"]
 
-            if user := User.objects.filter(email=email, is_active=True).first():
-                user_pk_hash = hashlib.sha256(
-                    data=f"{user.pk}".encode(encoding="utf-8")
-                ).hexdigest()
-
+            if user := await User.objects.filter(email=email, is_active=True).afirst():
                 message = render_to_string(
                     request=request,
                     template_name="gate/email/password_reset_request.tmpl",
@@ -41,45 +52,23 @@ class PasswordResetRequest(View):
                         "password_reset_request_link": request.build_absolute_uri(
                             reverse_lazy(
                                 viewname="gate:password_reset",
-                                kwargs={"user_pk_hash": user_pk_hash},
+                                kwargs={"token": tokens.make("password_reset", user)},
                             ),  # pyright: ignore[reportArgumentType]
                         ),
                     },
                 )
 
-                cache_details = {  # pyright: ignore[reportUnknownVariableType]
-                    "key": f"passwordreset_{user_pk_hash}",
-                    "value": user.pk,
-                    "timeout": 5 * 60,  # 5 minutes
-                }
-
-                if not cache.get(key=str(cache_details["key"])):  # pyright: ignore[reportUnknownArgumentType]
-                    settings.THREAD_POOL.submit(
-                        send_mail,
-                        from_email=settings.DEFAULT_FROM_EMAIL,
-                        recipient_list=[email],
-                        subject="Password Reset Link",
-                        message=message,
-                        fail_silently=False,
-                    )
-
-                    cache.set(**cache_details)  # pyright: ignore[reportUnknownArgumentType]
+                await mail.aenqueue(
+                    recipient_list=[email],
+                    subject="Password Reset Link",
+                    message=message,
+                )
 
-                    return render(
-                        request=request,
-                        template_name="gate/password_reset_request.html",
-                        context={"email_sent": True},
-                    )
-                else:
-                    email_form.add_error(
-                        field="email",
-                        error="The password reset link we emailed you is still valid.",
-                    )
-                    return render(
-                        request=request,
-                        template_name="gate/password_reset_request.html",
-                        context={"form": email_form},
-                    )
+                return render(
+                    request=request,
+                    template_name="gate/password_reset_request.html",
+                    context={"email_sent": True},
+                )
             else:
                 email_form.add_error(
                     field="email",
@@ -1,10 +1,11 @@
-from django.contrib.auth import authenticate, login
+from django.contrib.auth import aauthenticate, alogin
 from django.http import HttpRequest, HttpResponse
 from django.shortcuts import redirect, render
 from django.urls import reverse_lazy
 from django.utils.safestring import mark_safe
 from django.views.generic import View
 
+from .. import hashing, ratelimit
 from ..forms.signin import SignIn as SignInForm
 
 
@@ -12,21 +13,23 @@ class SignIn(View):
     redirect_path = "/"
     signin_template = "gate/signin.html"
 
-    def dispatch(self, request: HttpRequest, *args: ..., **kwargs: ...):
+    async def dispatch(self, request: HttpRequest, *args: ..., **kwargs: ...):
+        request.user = await request.auser()  # pyright: ignore[reportAttributeAccessIssue]
+
         if request.user.is_authenticated:
             if request.user.is_staff:  # pyright: ignore[reportAttributeAccessIssue,reportUnknownMemberType]
                 return redirect(to="/sa/")
             return redirect(to=self.redirect_path)
-        return super().dispatch(request, *args, **kwargs)
+        return await super().dispatch(request, *args, **kwargs)
 
-    def get(self, request: HttpRequest) -> HttpResponse:
+    async def get(self, request: HttpRequest) -> HttpResponse:
         return render(
             request=request,
             template_name=self.signin_template,
             context={"form": SignInForm()},
         )
 
-    def post(self, request: HttpRequest) -> HttpResponse:
+    async def post(self, request: HttpRequest) -> HttpResponse:
         def template_renderer(*, form: SignInForm) -> HttpResponse:
             return render(
                 request=request,
@@ -36,22 +39,36 @@ class SignIn(View):
 
         signin_form = SignInForm(request.POST)
 
+        if retry_after := await ratelimit.ahit(
+            "signin", request, request.POST.get("username", "")
+        ):
+            signin_form.add_error(
+                field="username", error=ratelimit.message(retry_after)
+            )
+            return ratelimit.limited(template_renderer(form=signin_form), retry_after)
+
         if signin_form.is_valid():
             username = signin_form.cleaned_data["username"]
             password = signin_form.cleaned_data["password"]
 
-            if user := authenticate(
-                request=request,
-                username=username,
-                password=password,
-            ):
+            try:
+                user = await aauthenticate(
+                    request=request,
+                    username=username,
+                    password=password,
+                )
+            except hashing.Saturated:
+                signin_form.add_error(field="username", error=hashing.MESSAGE)
+                return hashing.busy(template_renderer(form=signin_form))
+
+            if user:
                 if not user.is_active:
                     signin_form.add_error(
                         field="username", error="Please verify your email address."
                     )
                     return template_renderer(form=signin_form)
 
-                login(request=request, user=user)
+                await alogin(request=request, user=user)
 
                 return redirect(to=self.redirect_path)
 
@@ -1,10 +1,4 @@
-import hashlib
-
-from django.conf import settings
-from django.contrib.auth.models import User
-from django.core.cache import cache
-from django.core.mail import send_mail
-from django.db import transaction
+from django.db import IntegrityError
 from django.http import HttpRequest, HttpResponse, HttpResponseRedirect
 from django.shortcuts import render
 from django.template.loader import render_to_string
@@ -12,13 +6,20 @@ from django.urls import reverse_lazy
 from django.utils.safestring import mark_safe
 from django.views.generic import View
 
+from afromart import mail
+
+from .. import hashing, ratelimit, tokens, users
 from ..forms import SignUp as SignUpForm
 
 
 class SignUp(View):
     redirect_path = "/"
 
-    def get(self, request: HttpRequest) -> HttpResponse:
+    async def dispatch(self, request: HttpRequest, *args: ..., **kwargs: ...):
+        request.user = await request.auser()  # pyright: ignore[reportAttributeAccessIssue]
+        return await super().dispatch(request, *args, **kwargs)
+
+    async def get(self, request: HttpRequest) -> HttpResponse:
         if request.user.is_authenticated:
             return HttpResponseRedirect(redirect_to=self.redirect_path)
 
@@ -28,11 +29,27 @@ class SignUp(View):
             context={"form": SignUpForm()},
         )
 
-    def post(self, request: HttpRequest) -> HttpResponse:
+    async def post(self, request: HttpRequest) -> HttpResponse:
         if request.user.is_authenticated:
             return HttpResponseRedirect(redirect_to=self.redirect_path)
 
         registration_form = SignUpForm(request.POST)
+
+        if retry_after := await ratelimit.ahit(
+            "signup", request, request.POST.get("email", "")
+        ):
+            registration_form.add_error(
+                field="email", error=ratelimit.message(retry_after)
+            )
+            return ratelimit.limited(
+                render(
+                    request=request,
+                    template_name="gate/signup.html",
+                    context={"form": registration_form},
+                ),
+                retry_after,
+            )
+
         if not registration_form.is_valid():
             return render(
                 request=request,
@@ -44,66 +61,67 @@ class SignUp(View):
         username = registration_form.cleaned_data["username"]
         password = registration_form.cleaned_data["password"]
 
-        if User.objects.filter(username=username).exists():
-            registration_form.add_error(
-                field="username",
-                error="This username is already taken. Please choose a different one.",
-            )
-            return render(
-                request=request,
-                template_name="gate/signup.html",
-                context={"form": registration_form},
-            )
+        if taken := await users.ataken(username=username, email=email):
+            return self.taken(request, registration_form, taken)
 
-        if User.objects.filter(email=email).exists():
-            registration_form.add_error(
-                field="email",
-                error=mark_safe(
-                    f"A customer with this email address already exists. Would you like to <a href={reverse_lazy('gate:signin')}>log in</a> instead?"
-                ),
+        try:
+            user = await hashing.acreate_user(
+                username=username, password=password, email=email, is_active=False
             )
-            return render(
-                request=request,
-                template_name="gate/signup.html",
-                context={"form": registration_form},
+        except hashing.Saturated:
+            registration_form.add_error(field="username", error=hashing.MESSAGE)
+            return hashing.busy(
+                render(
+                    request=request,
+                    template_name="gate/signup.html",
+                    context={"form": registration_form},
+                )
             )
+        except IntegrityError as error:
+            # Someone else signed up with it since the check above.
+            if (field := users.clashing(error)) is None:
+                raise
+            return self.taken(request, registration_form, {field})
 
-        with transaction.atomic():
-            user = User.objects.create_user(
-                username=username, password=password, email=email, is_active=False
-            )
+        message = render_to_string(
+            request=request,
+            template_name="gate/email/signup_verify.tmpl",
+            context={
+                "email": email,
+                "verification_link": request.build_absolute_uri(
+                    reverse_lazy(
+                        viewname="gate:signup_verify",
+                        kwargs={"token": tokens.make("signup", user)},
+                    ),  # pyright: ignore[reportArgumentType]
+                ),
+            },
+        )
 
-            user_pk_hash = hashlib.sha256(
-                data=f"{user.pk}".encode(encoding="utf-8")
-            ).hexdigest()
+        await mail.aenqueue(
+            recipient_list=[email],
+            subject="Welcome! 🎉",
+            message=message,
+        )
 
-            cache.set(
-                key=f"signup_{user_pk_hash}",
-                value=user.pk,
-                timeout=60 * 60 * 24 * 3,  # 3 days
-            )
+        return render(request=request, template_name="gate/signup_verify.html")
 
-            message = render_to_string(
-                request=request,
-                template_name="gate/email/signup_verify.tmpl",
-                context={
-                    "email": email,
-                    "verification_link": request.build_absolute_uri(
-                        reverse_lazy(
-                            viewname="gate:signup_verify",
-                            kwargs={"user_pk_hash": user_pk_hash},
-                        ),  # pyright: ignore[reportArgumentType]
-                    ),
-                },
+    def taken(
+        self, request: HttpRequest, form: SignUpForm, fields: set[str]
+    ) -> HttpResponse:
+        if "username" in fields:
+            form.add_error(
+                field="username",
+                error="This username is already taken. Please choose a different one.",
             )
-
-            settings.THREAD_POOL.submit(
-                send_mail,
-                from_email=settings.DEFAULT_FROM_EMAIL,
-                recipient_list=[email],
-                subject="Welcome! 🎉",
-                message=message,
-                fail_silently=False,
+        if "email" in fields:
+            form.add_error(
+                field="email",
+                error=mark_safe(
+                    f"A customer with this email address already exists. Would you like to <a href={reverse_lazy('gate:signin')}>log in</a> instead?"
+                ),
             )
-
-        return render(request=request, template_name="gate/signup_verify.html")
+        return render(
+            request=request,
+            template_name="gate/signup.html",
+            context={"form": form},
+        )
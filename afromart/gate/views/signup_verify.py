@@ -1,20 +1,20 @@
-from django.contrib.auth.models import User
-from django.core.cache import cache
-from django.db import transaction
 from django.http import HttpRequest, HttpResponse
 from django.shortcuts import render
 from django.views.decorators.http import require_GET
 
+from .. import tokens
+
 
 @require_GET
-def signup_verify(request: HttpRequest, user_pk_hash: str) -> HttpResponse:
-    if user := User.objects.filter(pk=cache.get(key=f"signup_{user_pk_hash}")).first():
+async def signup_verify(request: HttpRequest, token: str) -> HttpResponse:
+    request.user = await request.auser()  # pyright: ignore[reportAttributeAccessIssue]
+
+    if user := await tokens.auser("signup", token):
         if user.is_active:
             return HttpResponse(status=200, content="Customer already verified.")
 
-        with transaction.atomic():
-            user.is_active = True
-            user.save()
+        user.is_active = True
+        await user.asave(update_fields=["is_active"])
 
         return render(
             request=request,
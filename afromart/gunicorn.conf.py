@@ -0,0 +1,77 @@
+# Loaded by gunicorn from the working directory.
+import gc
+import os
+import shutil
+import sys
+from pathlib import Path
+from typing import Any
+
+PROMETHEUS_MULTIPROC_DIR = Path(
+    os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", "/tmp/afromart_prometheus")
+)
+# Workers write their metrics here; a previous run's files would be merged into
+# this one's. Done here, not in on_starting: a preloaded app is imported before
+# that hook runs, and its metrics open their files on import. Only once per
+# master, as a reload (SIGHUP) reads this file again while workers still write.
+if os.environ.get("AFROMART_PROMETHEUS_MASTER") != str(os.getpid()):
+    os.environ["AFROMART_PROMETHEUS_MASTER"] = str(os.getpid())
+    shutil.rmtree(PROMETHEUS_MULTIPROC_DIR, ignore_errors=True)
+    PROMETHEUS_MULTIPROC_DIR.mkdir(parents=True)
+
+# GUNICORN_PROFILE picks how a machine's requests are spread:
+# "processes": several gthread workers with a few threads each, for a GIL build.
+# "threads": one worker with many threads, for the free-threaded build; the
+#   threads share one copy of the app, its caches and its connection pool.
+# GUNICORN_WORKERS and GUNICORN_THREADS override either; benchmark_deployment
+# compares them.
+PROFILES = {"processes": (4, 4), "threads": (1, 16)}
+profile = os.getenv("GUNICORN_PROFILE", "processes")
+workers = int(os.getenv("GUNICORN_WORKERS", str(PROFILES[profile][0])))
+threads = int(os.getenv("GUNICORN_THREADS", str(PROFILES[profile][1])))
+# gthread serves afromart.wsgi, where the async gate views each run through
+# async_to_sync: a thread hop per request and no concurrency in return. They
+# pay off under afromart.asgi with an ASGI worker class (e.g. uvicorn's), which
+# isn't a dependency yet; benchmark_gate compares the two with one --target each.
+worker_class = "gthread"
+
+# Import the app once, in the master, and fork workers from it: a worker
+# recycled by --max-requests starts in milliseconds instead of re-importing
+# Django, and the workers share the imported modules' pages. GUNICORN_PRELOAD=0
+# turns it off, e.g. to measure cold starts.
+preload_app = os.getenv("GUNICORN_PRELOAD", "1") == "1"
+
+# Read by settings in each worker: a pooled connection per thread, and the
+# machine's cores split between the workers' hashing threads.
+os.environ.setdefault("DATABASE_POOL_MAX_SIZE", str(threads))
+os.environ.setdefault(
+    "HASHING_WORKERS", str(max(1, (os.process_cpu_count() or 1) // workers))
+)
+
+
+def when_ready(server: Any) -> None:
+    if preload_app:
+        # The URLconf imports every view, form and template tag module; do it
+        # here so workers inherit it instead of paying on their first request.
+        from django.urls import get_resolver
+
+        get_resolver().url_patterns
+
+
+def pre_fork(server: Any, worker: Any) -> None:
+    # Move what the master has allocated out of the collector's reach: a
+    # collection in a worker would otherwise write to (and so copy) every
+    # page holding a preloaded object.
+    gc.freeze()
+
+
+def post_worker_init(worker: Any) -> None:
+    # Importing an extension that isn't marked free-threading safe turns the
+    # GIL back on, quietly undoing the "threads" profile.
+    if profile == "threads" and getattr(sys, "_is_gil_enabled", lambda: True)():
+        worker.log.warning("The GIL is enabled; the threads profile won't scale.")
+
+
+def child_exit(server: Any, worker: Any) -> None:
+    from prometheus_client import multiprocess
+
+    multiprocess.mark_process_dead(worker.pid)
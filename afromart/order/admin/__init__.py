@@ -0,0 +1,3 @@
+from .order import OrderAdmin
+
+__all__ = ("OrderAdmin",)
@@ -0,0 +1,38 @@
+from django.contrib import admin, messages
+from django.db.models import QuerySet
+from django.http import HttpRequest
+
+from .. import reservations
+from ..models import Order, OrderLine
+
+
+class OrderLineInline(admin.TabularInline):  # pyright: ignore[reportMissingTypeArgument]
+    model = OrderLine
+    fields = ("product", "title", "unit_price", "quantity")
+    readonly_fields = fields
+    extra = 0
+    can_delete = False
+
+
+@admin.register(Order)
+class OrderAdmin(admin.ModelAdmin):  # pyright: ignore[reportMissingTypeArgument]
+    list_display = ("id", "customer", "status", "total", "created_at")
+    list_filter = ("status",)
+    list_select_related = ("customer",)
+    # Status changes go through actions, which move the stock with them.
+    readonly_fields = ("customer", "status", "total", "created_at")
+    inlines = (OrderLineInline,)
+    actions = ("mark_paid",)
+
+    @admin.action(description="Mark selected orders paid")
+    def mark_paid(self, request: HttpRequest, queryset: QuerySet[Order]) -> None:
+        paid = sum(reservations.consume(order) for order in queryset)
+        if paid:
+            self.message_user(request, f"Marked {paid} order(s) paid.")
+        if skipped := len(queryset) - paid:
+            self.message_user(
+                request,
+                f"Skipped {skipped} order(s) that weren't pending; expired holds "
+                "cancel their order.",
+                level=messages.WARNING,
+            )
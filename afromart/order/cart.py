@@ -0,0 +1,28 @@
+from uuid import UUID
+
+from django.contrib.sessions.backends.base import SessionBase
+
+SESSION_KEY = "cart"
+MAX_QUANTITY = 99
+
+
+async def aget(session: SessionBase) -> dict[UUID, int]:
+    return {
+        UUID(product_id): quantity
+        for product_id, quantity in (await session.aget(SESSION_KEY, {})).items()
+    }
+
+
+async def aset(session: SessionBase, product_id: UUID, quantity: int) -> None:
+    """Set a line's quantity; zero removes it."""
+
+    cart: dict[str, int] = await session.aget(SESSION_KEY, {})
+    if quantity > 0:
+        cart[str(product_id)] = min(quantity, MAX_QUANTITY)
+    else:
+        cart.pop(str(product_id), None)
+    await session.aset(SESSION_KEY, cart)
+
+
+async def aclear(session: SessionBase) -> None:
+    await session.apop(SESSION_KEY, None)
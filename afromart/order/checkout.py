@@ -0,0 +1,51 @@
+from collections.abc import Mapping
+from uuid import UUID
+
+from django.contrib.auth.models import AbstractBaseUser
+from django.db import transaction
+
+from product.models import Product
+
+from . import reservations
+from .models import Order, OrderLine
+
+
+class Unavailable(Exception):
+    def __init__(self, product_ids: set[UUID]) -> None:
+        self.product_ids = frozenset(product_ids)
+        super().__init__(f"{len(self.product_ids)} product(s) are no longer available.")
+
+
+def checkout(customer: AbstractBaseUser, cart: Mapping[UUID, int]) -> Order:
+    """Price, hold stock for and record a whole cart.
+
+    The query count doesn't depend on the cart size: one read prices every
+    line, then one transaction inserts the order, takes the stock, inserts the
+    holds and inserts the lines. Raises Unavailable or reservations.OutOfStock.
+    """
+
+    if not cart:
+        raise ValueError("The cart is empty.")
+
+    products = Product.objects.only("id", "title", "price").in_bulk(list(cart))
+    if missing := set(cart) - set(products):
+        raise Unavailable(missing)
+
+    with transaction.atomic():
+        order = Order.objects.create(
+            customer=customer,
+            total=sum(products[pk].price * quantity for pk, quantity in cart.items()),
+        )
+        reservations.reserve_many(cart, order=order)
+        OrderLine.objects.bulk_create(
+            OrderLine(
+                order=order,
+                product_id=pk,
+                title=products[pk].title,
+                unit_price=products[pk].price,
+                quantity=quantity,
+            )
+            for pk, quantity in cart.items()
+        )
+
+    return order
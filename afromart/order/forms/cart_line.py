@@ -0,0 +1,8 @@
+from django import forms
+
+from ..cart import MAX_QUANTITY
+
+
+class CartLine(forms.Form):
+    product_id = forms.UUIDField(widget=forms.HiddenInput)
+    quantity = forms.IntegerField(min_value=0, max_value=MAX_QUANTITY, initial=1)
@@ -0,0 +1,66 @@
+from argparse import ArgumentParser
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from afromart import benchmark
+from product.models import Product
+
+from ... import reservations
+from ...models import Reservation
+
+
+class Command(BaseCommand):
+    help = (
+        "Hammer one hot SKU with concurrent reservations and check nothing oversells."
+    )
+
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        parser.add_argument("--stock", type=int, default=5000)
+        parser.add_argument("--requests", type=int, default=10000)
+        parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32])
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        for concurrency in options["concurrency"]:
+            product = Product.objects.create(
+                title="Benchmark hot SKU",
+                description="",
+                in_stock=options["stock"],
+                price=1,
+            )
+
+            def attempt() -> bool:
+                try:
+                    reservations.reserve(product.pk, 1)
+                except reservations.OutOfStock:
+                    pass
+                return True
+
+            try:
+                result = benchmark.run(
+                    "reserve hot SKU",
+                    benchmark.releasing(attempt),
+                    concurrency=concurrency,
+                    requests=options["requests"],
+                )
+                self.stdout.write(str(result))
+
+                product.refresh_from_db()
+                reserved = sum(
+                    Reservation.objects.filter(product=product).values_list(
+                        "quantity", flat=True
+                    )
+                )
+                if product.in_stock + reserved != options["stock"]:
+                    raise CommandError(
+                        f"Oversold: {reserved} reserved, {product.in_stock} left."
+                    )
+                self.stdout.write(
+                    f"{reserved} reserved, {product.in_stock} left, no oversell"
+                )
+            finally:
+                with transaction.atomic():
+                    Reservation.objects.filter(product=product).delete()
+                    product.delete()
+                connection.close()
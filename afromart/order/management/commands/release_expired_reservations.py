@@ -0,0 +1,30 @@
+import time
+from argparse import ArgumentParser
+from typing import Any
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from ... import reservations
+
+
+class Command(BaseCommand):
+    help = "Return the stock of expired reservations."
+
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        parser.add_argument(
+            "--every",
+            type=int,
+            default=0,
+            help="Keep running, sweeping every this many seconds.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        while True:
+            close_old_connections()
+            if released := reservations.release_expired():
+                self.stdout.write(f"Released {released} expired reservations.")
+
+            if not options["every"]:
+                return
+            time.sleep(options["every"])
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.7 on 2026-10-18 11:51
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('product', '0003_facets'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Reservation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('quantity', models.PositiveIntegerField(verbose_name='Quantity')),
+                ('expires_at', models.DateTimeField(db_index=True, verbose_name='Expires At')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created At')),
+                ('product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='reservations', to='product.product', verbose_name='Product')),
+            ],
+        ),
+    ]
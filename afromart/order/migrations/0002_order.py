@@ -0,0 +1,47 @@
+# Generated by Django 5.2.7 on 2026-10-18 11:54
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('order', '0001_initial'),
+        ('product', '0003_facets'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Order',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid7, editable=False, primary_key=True, serialize=False)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('paid', 'Paid'), ('cancelled', 'Cancelled')], default='pending', verbose_name='Status')),
+                ('total', models.PositiveBigIntegerField(verbose_name='Total')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created At')),
+                ('customer', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='orders', to=settings.AUTH_USER_MODEL, verbose_name='Customer')),
+            ],
+        ),
+        migrations.AddField(
+            model_name='reservation',
+            name='order',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='reservations', to='order.order', verbose_name='Order'),
+        ),
+        migrations.CreateModel(
+            name='OrderLine',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('title', models.CharField(verbose_name='Title')),
+                ('unit_price', models.PositiveBigIntegerField(verbose_name='Unit Price')),
+                ('quantity', models.PositiveIntegerField(verbose_name='Quantity')),
+                ('order', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='lines', to='order.order', verbose_name='Order')),
+                ('product', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='order_lines', to='product.product', verbose_name='Product')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('order', 'product'), name='order_line_unique_product')],
+            },
+        ),
+    ]
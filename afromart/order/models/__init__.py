@@ -0,0 +1,4 @@
+from .order import Order, OrderLine
+from .reservation import Reservation
+
+__all__ = ("Order", "OrderLine", "Reservation")
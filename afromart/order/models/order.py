@@ -0,0 +1,57 @@
+from uuid import uuid7
+
+from django.conf import settings
+from django.db import models
+
+
+class Order(models.Model):
+    class Status(models.TextChoices):
+        PENDING = "pending", "Pending"
+        PAID = "paid", "Paid"
+        CANCELLED = "cancelled", "Cancelled"
+
+    id = models.UUIDField(default=uuid7, primary_key=True, editable=False)
+    customer = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.PROTECT,
+        related_name="orders",
+        verbose_name="Customer",
+    )
+    status = models.CharField(
+        verbose_name="Status", choices=Status.choices, default=Status.PENDING
+    )
+    total = models.PositiveBigIntegerField(verbose_name="Total")
+    created_at = models.DateTimeField(verbose_name="Created At", auto_now_add=True)
+
+    def __str__(self) -> str:
+        return f"{self.id}"
+
+
+class OrderLine(models.Model):
+    order = models.ForeignKey(
+        Order, on_delete=models.CASCADE, related_name="lines", verbose_name="Order"
+    )
+    product = models.ForeignKey(
+        "product.Product",
+        on_delete=models.PROTECT,
+        related_name="order_lines",
+        verbose_name="Product",
+    )
+    # Snapshots, so later catalog edits don't rewrite order history.
+    title = models.CharField(verbose_name="Title")
+    unit_price = models.PositiveBigIntegerField(verbose_name="Unit Price")
+    quantity = models.PositiveIntegerField(verbose_name="Quantity")
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["order", "product"], name="order_line_unique_product"
+            )
+        ]
+
+    @property
+    def subtotal(self) -> int:
+        return self.unit_price * self.quantity
+
+    def __str__(self) -> str:
+        return f"{self.quantity} × {self.title}"
@@ -0,0 +1,24 @@
+from django.db import models
+
+
+class Reservation(models.Model):
+    product = models.ForeignKey(
+        "product.Product",
+        on_delete=models.CASCADE,
+        related_name="reservations",
+        verbose_name="Product",
+    )
+    order = models.ForeignKey(
+        "order.Order",
+        on_delete=models.CASCADE,
+        related_name="reservations",
+        verbose_name="Order",
+        blank=True,
+        null=True,
+    )
+    quantity = models.PositiveIntegerField(verbose_name="Quantity")
+    expires_at = models.DateTimeField(verbose_name="Expires At", db_index=True)
+    created_at = models.DateTimeField(verbose_name="Created At", auto_now_add=True)
+
+    def __str__(self) -> str:
+        return f"{self.quantity} × {self.product_id}"  # pyright: ignore[reportAttributeAccessIssue]
@@ -0,0 +1,169 @@
+from collections.abc import Iterable, Mapping
+from datetime import timedelta
+from functools import partial
+from uuid import UUID
+
+from django.db import connection, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from product import cache as product_cache
+from product.models import Product
+
+from .models import Order, Reservation
+
+RESERVATION_TTL = timedelta(minutes=15)
+RELEASE_BATCH = 1000
+
+# Takes stock for every line or none: rows are locked in id order so
+# overlapping carts can't deadlock, and the in_stock >= wanted guard means a
+# sold out line simply doesn't come back in RETURNING.
+RESERVE = """
+WITH wanted AS (
+    SELECT * FROM unnest(%s::uuid[], %s::bigint[]) AS wanted (id, quantity)
+), locked AS (
+    SELECT id FROM product_product WHERE id = ANY(%s::uuid[]) ORDER BY id FOR UPDATE
+)
+UPDATE product_product AS product
+SET in_stock = product.in_stock - wanted.quantity
+FROM wanted JOIN locked USING (id)
+WHERE product.id = wanted.id AND product.in_stock >= wanted.quantity
+RETURNING product.id
+"""
+
+RELEASE_EXPIRED = """
+WITH expired AS (
+    DELETE FROM order_reservation WHERE id IN (
+        SELECT id FROM order_reservation
+        WHERE expires_at < now()
+        ORDER BY expires_at
+        LIMIT %s
+        FOR UPDATE SKIP LOCKED
+    )
+    RETURNING order_id, product_id, quantity
+), restocked AS (
+    UPDATE product_product AS product
+    SET in_stock = product.in_stock + released.quantity
+    FROM (
+        SELECT product_id, sum(quantity) AS quantity FROM expired GROUP BY product_id
+    ) AS released
+    WHERE product.id = released.product_id
+), cancelled AS (
+    UPDATE order_order SET status = 'cancelled'
+    WHERE id IN (SELECT order_id FROM expired) AND status = 'pending'
+)
+SELECT count(*), coalesce(array_agg(DISTINCT product_id), '{}') FROM expired
+"""
+
+
+class OutOfStock(Exception):
+    def __init__(self, product_ids: Iterable[UUID]) -> None:
+        self.product_ids = frozenset(product_ids)
+        super().__init__(f"Not enough stock for {len(self.product_ids)} product(s).")
+
+
+def reserve(
+    product_id: UUID, quantity: int, *, ttl: timedelta = RESERVATION_TTL
+) -> Reservation:
+    """Hold `quantity` of one product, or raise OutOfStock."""
+
+    if quantity < 1:
+        raise ValueError("Quantity must be positive.")
+
+    with transaction.atomic():
+        if not Product.objects.filter(pk=product_id, in_stock__gte=quantity).update(
+            in_stock=F("in_stock") - quantity
+        ):
+            raise OutOfStock([product_id])
+
+        transaction.on_commit(partial(product_cache.invalidate, [product_id]))
+        return Reservation.objects.create(
+            product_id=product_id,
+            quantity=quantity,
+            expires_at=timezone.now() + ttl,
+        )
+
+
+def reserve_many(
+    items: Mapping[UUID, int], *, ttl: timedelta = RESERVATION_TTL, **fields: object
+) -> list[Reservation]:
+    """Hold stock for a whole cart in one UPDATE; all or nothing.
+
+    Extra `fields` are set on every Reservation row.
+    """
+
+    if any(quantity < 1 for quantity in items.values()):
+        raise ValueError("Quantities must be positive.")
+
+    product_ids = list(items)
+
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            cursor.execute(RESERVE, (product_ids, list(items.values()), product_ids))
+            reserved = {product_id for (product_id,) in cursor.fetchall()}
+
+        if missing := set(items) - reserved:
+            raise OutOfStock(missing)
+
+        transaction.on_commit(partial(product_cache.invalidate, reserved))
+
+        expires_at = timezone.now() + ttl
+        return Reservation.objects.bulk_create(
+            Reservation(
+                product_id=product_id,
+                quantity=quantity,
+                expires_at=expires_at,
+                **fields,
+            )
+            for product_id, quantity in items.items()
+        )
+
+
+def release(reservation: Reservation) -> None:
+    """Give a hold's stock back before it expires."""
+
+    with transaction.atomic():
+        if Reservation.objects.filter(pk=reservation.pk).delete()[0]:
+            Product.objects.filter(pk=reservation.product_id).update(  # pyright: ignore[reportAttributeAccessIssue]
+                in_stock=F("in_stock") + reservation.quantity
+            )
+            transaction.on_commit(
+                partial(product_cache.invalidate, [reservation.product_id])  # pyright: ignore[reportAttributeAccessIssue]
+            )
+
+
+def consume(order: Order) -> bool:
+    """Mark a pending order paid. Its stock is sold, so its holds are dropped
+    and never expire back.
+
+    False, and nothing changes, if the holds expired first and release_expired
+    cancelled the order.
+    """
+
+    with transaction.atomic():
+        # The holds first, as release_expired takes them, so a release racing
+        # this either finishes first or skips them.
+        Reservation.objects.filter(order=order).delete()
+        if Order.objects.filter(pk=order.pk, status=Order.Status.PENDING).update(
+            status=Order.Status.PAID
+        ):
+            return True
+        transaction.set_rollback(True)
+        return False
+
+
+def release_expired(*, batch_size: int = RELEASE_BATCH) -> int:
+    """Return expired holds' stock, a batch at a time; returns holds released.
+
+    Pending orders whose holds expired are cancelled in the same statement.
+    """
+
+    released = 0
+    while True:
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(RELEASE_EXPIRED, (batch_size,))
+            count, restocked = cursor.fetchone()
+            transaction.on_commit(partial(product_cache.invalidate, restocked))
+        released += count
+        if count < batch_size:
+            return released
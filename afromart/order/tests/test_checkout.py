@@ -0,0 +1,92 @@
+import pytest
+from django.contrib.auth.models import User
+from django.test import Client
+from django.urls import reverse
+
+from order import reservations
+from order.checkout import Unavailable, checkout
+from order.models import Order, OrderLine, Reservation
+from product.models import Product
+
+
+@pytest.fixture
+def user() -> User:
+    return User.objects.create_user(username="customer", password="secret")
+
+
+@pytest.fixture
+def products() -> list[Product]:
+    return Product.objects.bulk_create(
+        Product(title=f"Kente {i}", description="", in_stock=10, price=1_000 + i)
+        for i in range(50)
+    )
+
+
+@pytest.mark.django_db
+def test_checkout_query_count_is_constant(
+    user: User, products: list[Product], django_assert_max_num_queries
+) -> None:
+    cart = {product.pk: 2 for product in products}
+
+    # Price, order, stock, holds and lines, plus two savepoint pairs.
+    with django_assert_max_num_queries(9):
+        order = checkout(user, cart)
+
+    assert order.total == sum(product.price * 2 for product in products)
+    assert OrderLine.objects.filter(order=order).count() == 50
+    assert Reservation.objects.filter(order=order).count() == 50
+    assert set(Product.objects.values_list("in_stock", flat=True)) == {8}
+
+
+@pytest.mark.django_db
+def test_checkout_is_all_or_nothing(user: User, products: list[Product]) -> None:
+    cart = {product.pk: 1 for product in products}
+    cart[products[0].pk] = 11
+
+    with pytest.raises(reservations.OutOfStock):
+        checkout(user, cart)
+
+    assert not Order.objects.exists()
+    assert set(Product.objects.values_list("in_stock", flat=True)) == {10}
+
+
+@pytest.mark.django_db
+def test_checkout_rejects_unknown_products(user: User, products: list[Product]) -> None:
+    product = products[0]
+    cart = {product.pk: 1}
+    product.delete()
+
+    with pytest.raises(Unavailable):
+        checkout(user, cart)
+
+
+@pytest.mark.django_db
+def test_cart_checkout_view(user: User, products: list[Product]) -> None:
+    client = Client()
+    client.force_login(user)
+
+    for product in products[:3]:
+        client.post(
+            reverse("order:cart_update"), {"product_id": product.pk, "quantity": 2}
+        )
+    assert len(client.get(reverse("order:cart")).context["lines"]) == 3
+
+    response = client.post(reverse("order:checkout"))
+    order = Order.objects.get(customer=user)
+    assert response.url == reverse("order:detail", kwargs={"order_id": order.pk})  # pyright: ignore[reportAttributeAccessIssue]
+    assert not client.get(reverse("order:cart")).context["lines"]
+
+
+@pytest.mark.django_db
+def test_release_expired_cancels_pending_orders(
+    user: User, products: list[Product]
+) -> None:
+    order = checkout(user, {products[0].pk: 3})
+    Reservation.objects.filter(order=order).update(expires_at="2000-01-01T00:00Z")
+
+    assert reservations.release_expired() == 1
+
+    order.refresh_from_db()
+    products[0].refresh_from_db()
+    assert order.status == Order.Status.CANCELLED
+    assert products[0].in_stock == 10
@@ -0,0 +1,92 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+import pytest
+from django.contrib.auth.models import User
+from django.db import connection
+from django.utils import timezone
+
+from order import reservations
+from order.checkout import checkout
+from order.models import Order, Reservation
+from product.models import Product
+
+
+@pytest.fixture
+def product() -> Product:
+    return Product.objects.create(
+        title="Kente", description="", in_stock=50, price=4_500
+    )
+
+
+@pytest.mark.django_db(transaction=True)
+def test_hot_sku_never_oversells(product: Product) -> None:
+    def attempt(_: int) -> bool:
+        try:
+            reservations.reserve(product.pk, 1)
+            return True
+        except reservations.OutOfStock:
+            return False
+        finally:
+            connection.close()
+
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        succeeded = sum(pool.map(attempt, range(160)))
+
+    product.refresh_from_db()
+    assert succeeded == 50
+    assert product.in_stock == 0
+    assert Reservation.objects.count() == 50
+
+
+@pytest.mark.django_db
+def test_reserve_many_is_all_or_nothing(product: Product) -> None:
+    other = Product.objects.create(title="Kikoy", description="", in_stock=1, price=1)
+
+    with pytest.raises(reservations.OutOfStock) as raised:
+        reservations.reserve_many({product.pk: 5, other.pk: 2})
+    assert raised.value.product_ids == {other.pk}
+
+    product.refresh_from_db()
+    assert product.in_stock == 50
+    assert not Reservation.objects.exists()
+
+    reservations.reserve_many({product.pk: 5, other.pk: 1})
+    product.refresh_from_db()
+    assert product.in_stock == 45
+    assert Reservation.objects.count() == 2
+
+
+@pytest.mark.django_db
+def test_release_expired_restocks(product: Product) -> None:
+    reservations.reserve(product.pk, 4, ttl=timedelta(seconds=-1))
+    kept = reservations.reserve(product.pk, 1)
+
+    assert reservations.release_expired() == 1
+
+    product.refresh_from_db()
+    assert product.in_stock == 49
+    assert list(Reservation.objects.all()) == [kept]
+
+
+@pytest.mark.django_db
+def test_paid_orders_keep_their_stock(product: Product) -> None:
+    customer = User.objects.create_user(username="customer", password="secret")
+    paid = checkout(customer, {product.pk: 3})
+    expired = checkout(customer, {product.pk: 2})
+    Reservation.objects.filter(order=expired).update(
+        expires_at=timezone.now() - timedelta(seconds=1)
+    )
+
+    assert reservations.consume(paid)
+    assert reservations.release_expired() == 1
+    assert not reservations.consume(expired)
+
+    product.refresh_from_db()
+    assert product.in_stock == 47
+    assert list(
+        Order.objects.order_by("created_at").values_list("status", flat=True)
+    ) == [
+        Order.Status.PAID,
+        Order.Status.CANCELLED,
+    ]
@@ -1,3 +1,12 @@
+from django.urls import path
+
+from .views import cart, cart_update, checkout, detail
+
 app_name = "order"
 
-urlpatterns = []
+urlpatterns = [
+    path(route="cart/", view=cart, name="cart"),
+    path(route="cart/update/", view=cart_update, name="cart_update"),
+    path(route="checkout/", view=checkout, name="checkout"),
+    path(route="<uuid:order_id>/", view=detail, name="detail"),
+]
@@ -0,0 +1,4 @@
+from .cart import cart, cart_update
+from .checkout import checkout, detail
+
+__all__ = ("cart", "cart_update", "checkout", "detail")
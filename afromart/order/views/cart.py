@@ -0,0 +1,46 @@
+from django.http import HttpRequest, HttpResponse
+from django.shortcuts import redirect, render
+from django.views.decorators.http import require_GET, require_POST
+
+from product import cache as product_cache
+
+from .. import cart as session_cart
+from ..forms import CartLine
+
+
+@require_GET
+async def cart(request: HttpRequest) -> HttpResponse:
+    request.user = await request.auser()  # pyright: ignore[reportAttributeAccessIssue]
+
+    quantities = await session_cart.aget(request.session)
+    products = await product_cache.aget_many(quantities)
+    lines = [
+        {
+            "product": product,
+            "quantity": quantities[product.pk],
+            "subtotal": product.price * quantities[product.pk],
+        }
+        for product in sorted(products.values(), key=lambda product: product.title)
+    ]
+
+    return render(
+        request=request,
+        template_name="order/cart.html",
+        context={"lines": lines, "total": sum(line["subtotal"] for line in lines)},
+    )
+
+
+@require_POST
+async def cart_update(request: HttpRequest) -> HttpResponse:
+    form = CartLine(request.POST)
+    if (
+        form.is_valid()
+        and await product_cache.aget(form.cleaned_data["product_id"]) is not None
+    ):
+        await session_cart.aset(
+            request.session,
+            form.cleaned_data["product_id"],
+            form.cleaned_data["quantity"],
+        )
+
+    return redirect(to="order:cart")
@@ -0,0 +1,52 @@
+from uuid import UUID
+
+from asgiref.sync import sync_to_async
+from django.contrib import messages
+from django.contrib.auth.decorators import login_required
+from django.http import HttpRequest, HttpResponse
+from django.shortcuts import aget_object_or_404, redirect, render
+from django.views.decorators.http import require_GET, require_POST
+
+from .. import cart as session_cart
+from ..checkout import Unavailable, checkout as place_order
+from ..models import Order
+from ..reservations import OutOfStock
+
+
+@require_POST
+@login_required
+async def checkout(request: HttpRequest) -> HttpResponse:
+    request.user = await request.auser()  # pyright: ignore[reportAttributeAccessIssue]
+
+    if not (cart := await session_cart.aget(request.session)):
+        return redirect(to="order:cart")
+
+    try:
+        order = await sync_to_async(place_order)(request.user, cart)  # pyright: ignore[reportArgumentType]
+    except (OutOfStock, Unavailable) as error:
+        messages.error(
+            request=request,
+            message="Some items are no longer available; please review your cart.",
+        )
+        for product_id in error.product_ids:
+            await session_cart.aset(request.session, product_id, 0)
+        return redirect(to="order:cart")
+
+    await session_cart.aclear(request.session)
+
+    return redirect(to="order:detail", order_id=order.pk)
+
+
+@require_GET
+@login_required
+async def detail(request: HttpRequest, order_id: UUID) -> HttpResponse:
+    request.user = await request.auser()  # pyright: ignore[reportAttributeAccessIssue]
+
+    order = await aget_object_or_404(Order, pk=order_id, customer=request.user)
+    lines = [line async for line in order.lines.order_by("title")]  # pyright: ignore[reportAttributeAccessIssue]
+
+    return render(
+        request=request,
+        template_name="order/detail.html",
+        context={"order": order, "lines": lines},
+    )
@@ -0,0 +1,159 @@
+"""Read-through cache of product rows, for the detail page and the cart.
+
+Entries are tuples of plain column values, never pickled models, and are
+dropped on commit whenever a product changes (see signals); a read racing a
+write can put the old row back, which TTL bounds. Hot entries are
+refreshed early by probabilistic early expiration (XFetch): each read rolls
+for a refresh, more likely as expiry nears and the slower the row is to load,
+so one request rebuilds it while the rest keep hitting.
+"""
+
+import math
+import random
+import time
+from collections.abc import Iterable
+from itertools import batched
+from typing import Any
+from uuid import UUID
+
+from afromart.cache import hot
+from afromart.instrumentation import prometheus
+
+from .models import Product
+
+KEY = "product"
+TTL = 10 * 60
+# Unknown ids are cached too, briefly, so probing them doesn't reach Postgres.
+MISSING_TTL = 60
+BETA = 1.0  # > 1 refreshes earlier
+
+# Everything the pages render, in the model's field order (from_db needs it);
+# search_vector stays deferred.
+FIELDS = (
+    "trader_id",
+    "title",
+    "description",
+    "in_stock",
+    "price",
+    "image",
+    "video",
+    "tags",
+    "metadata",
+)
+
+# (expires_at, load_seconds, (values in FIELDS order)), or () if not found.
+Entry = tuple[Any, ...]
+
+
+def key(product_id: UUID) -> str:
+    return f"{KEY}:{product_id.hex}"
+
+
+def _build(product_id: UUID, values: tuple[Any, ...]) -> Product:
+    trader, *values = values
+    return Product.from_db(
+        "default",
+        ("id", *FIELDS),
+        (product_id, trader and UUID(hex=trader), *values),
+    )
+
+
+def _split(
+    product_ids: list[UUID], cached: dict[str, Entry]
+) -> tuple[dict[UUID, Product], list[UUID]]:
+    """Products served from `cached`, and the ids to load."""
+
+    found: dict[UUID, Product] = {}
+    load: list[UUID] = []
+    hits = misses = early = 0
+    now = time.time()
+
+    for product_id in product_ids:
+        if (entry := cached.get(key(product_id))) is None:
+            misses += 1
+            load.append(product_id)
+        elif not entry:
+            hits += 1
+        elif now - entry[1] * BETA * math.log(1 - random.random()) >= entry[0]:
+            early += 1
+            load.append(product_id)
+        else:
+            hits += 1
+            found[product_id] = _build(product_id, entry[2])
+
+    prometheus.observe_product_cache(hits=hits, misses=misses, early=early)
+    return found, load
+
+
+def _rows(product_ids: list[UUID]) -> Any:
+    return Product.objects.filter(pk__in=product_ids).values_list("id", *FIELDS)
+
+
+def _store(
+    product_ids: list[UUID], rows: list[tuple[Any, ...]], seconds: float
+) -> tuple[dict[UUID, Product], dict[str, Entry], dict[str, Entry]]:
+    """Products from freshly loaded rows, their entries and not-found markers."""
+
+    expires_at = time.time() + TTL
+    products: dict[UUID, Product] = {}
+    entries: dict[str, Entry] = {}
+    for product_id, trader_id, *values in rows:
+        # A hex string pickles in half the bytes of a UUID.
+        values = (trader_id and trader_id.hex, *values)
+        entries[key(product_id)] = (expires_at, seconds, values)
+        products[product_id] = _build(product_id, values)
+    missing: dict[str, Entry] = {
+        key(product_id): () for product_id in product_ids if product_id not in products
+    }
+    return products, entries, missing
+
+
+def get_many(product_ids: Iterable[UUID]) -> dict[UUID, Product]:
+    """The products with these ids, in one MGET and at most one query."""
+
+    product_ids = list(dict.fromkeys(product_ids))
+    found, load = _split(product_ids, hot.get_many([key(i) for i in product_ids]))
+    if load:
+        started = time.perf_counter()
+        rows = list(_rows(load))
+        loaded, entries, missing = _store(load, rows, time.perf_counter() - started)
+        found |= loaded
+        hot.fill_many(entries, timeout=TTL)
+        if missing:
+            hot.fill_many(missing, timeout=MISSING_TTL)
+    return found
+
+
+async def aget_many(product_ids: Iterable[UUID]) -> dict[UUID, Product]:
+    product_ids = list(dict.fromkeys(product_ids))
+    found, load = _split(
+        product_ids, await hot.aget_many([key(i) for i in product_ids])
+    )
+    if load:
+        started = time.perf_counter()
+        rows = [row async for row in _rows(load)]
+        loaded, entries, missing = _store(load, rows, time.perf_counter() - started)
+        found |= loaded
+        await hot.afill_many(entries, timeout=TTL)
+        if missing:
+            await hot.afill_many(missing, timeout=MISSING_TTL)
+    return found
+
+
+def get(product_id: UUID) -> Product | None:
+    return get_many([product_id]).get(product_id)
+
+
+async def aget(product_id: UUID) -> Product | None:
+    return (await aget_many([product_id])).get(product_id)
+
+
+def invalidate(product_ids: Iterable[UUID]) -> None:
+    for chunk in batched((key(i) for i in product_ids), 1000):
+        hot.delete_many(chunk)
+
+
+def clear() -> None:
+    """Drop every cached product, after a bulk change such as an import."""
+
+    hot.delete_matching(f"{KEY}:*")
@@ -0,0 +1,44 @@
+from uuid import UUID
+
+from django.db.models import QuerySet
+
+from .models import Product
+
+PAGE_SIZE = 24
+
+# Columns the listing renders; description and metadata stay on the detail page.
+LIST_FIELDS = ("id", "title", "price", "image", "in_stock")
+
+
+def listing() -> QuerySet[Product]:
+    return Product.objects.only(*LIST_FIELDS).order_by("-id")
+
+
+def _seek(
+    queryset: QuerySet[Product], after: UUID | None, size: int
+) -> QuerySet[Product]:
+    # uuid7 ids are time ordered, so "older than the last row seen" is an index
+    # range scan on the primary key no matter how deep the page is.
+    if after is not None:
+        queryset = queryset.filter(id__lt=after)
+    return queryset[: size + 1]
+
+
+def _split(products: list[Product], size: int) -> tuple[list[Product], UUID | None]:
+    if len(products) > size:
+        return products[:size], products[size - 1].id
+    return products, None
+
+
+def page(
+    queryset: QuerySet[Product], *, after: UUID | None = None, size: int = PAGE_SIZE
+) -> tuple[list[Product], UUID | None]:
+    """One keyset page of `queryset` plus the cursor for the next one."""
+
+    return _split(list(_seek(queryset, after, size)), size)
+
+
+async def apage(
+    queryset: QuerySet[Product], *, after: UUID | None = None, size: int = PAGE_SIZE
+) -> tuple[list[Product], UUID | None]:
+    return _split([product async for product in _seek(queryset, after, size)], size)
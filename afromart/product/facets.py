@@ -0,0 +1,144 @@
+import hashlib
+import json
+from dataclasses import dataclass, field
+
+from asgiref.sync import sync_to_async
+from django.db import connection
+from django.db.models import QuerySet
+from django.http import QueryDict
+
+from afromart.cache import hot
+
+from .models import Product
+
+# Product.metadata keys shoppers can filter on.
+ATTRIBUTES = ("origin", "material")
+FACET_SIZE = 20
+FACET_TTL = 5 * 60  # seconds
+
+Counts = dict[str, list[tuple[str, int]]]
+
+
+@dataclass(frozen=True, slots=True)
+class Filters:
+    tags: tuple[str, ...] = ()
+    attributes: dict[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def from_query(cls, query: QueryDict) -> Filters:
+        return cls(
+            tags=tuple(sorted(set(query.getlist("tag")))),
+            attributes={
+                name: value for name in ATTRIBUTES if (value := query.get(name))
+            },
+        )
+
+    def __bool__(self) -> bool:
+        return bool(self.tags or self.attributes)
+
+    def apply(self, queryset: QuerySet[Product]) -> QuerySet[Product]:
+        # Containment (@>) is what the GIN array_ops and jsonb_path_ops indexes
+        # serve; metadata__origin="KE" would compare extracted values and scan.
+        if self.tags:
+            queryset = queryset.filter(tags__contains=list(self.tags))
+        if self.attributes:
+            queryset = queryset.filter(metadata__contains=self.attributes)
+        return queryset
+
+    @property
+    def cache_key(self) -> str:
+        canonical = json.dumps(
+            [self.tags, sorted(self.attributes.items())], separators=(",", ":")
+        )
+        return f"facets_{hashlib.sha256(canonical.encode()).hexdigest()[:32]}"
+
+
+def _count(filters: Filters) -> Counts:
+    matching, params = (
+        filters.apply(Product.objects.all())
+        .values("tags", "metadata")
+        .query.sql_with_params()
+    )
+
+    # Every facet in one statement, over one scan of the matching rows.
+    branches = [
+        "(SELECT 'tag', tag, count(*) FROM matching, unnest(tags) AS tag"
+        " GROUP BY tag ORDER BY count(*) DESC, tag LIMIT %s)"
+    ]
+    branch_params: list[object] = [FACET_SIZE]
+    for name in ATTRIBUTES:
+        branches.append(
+            "(SELECT %s, metadata ->> %s AS value, count(*) FROM matching"
+            " WHERE metadata ? %s GROUP BY value ORDER BY count(*) DESC, value LIMIT %s)"
+        )
+        branch_params.extend((name, name, name, FACET_SIZE))
+
+    counts: Counts = {"tag": [], **{name: [] for name in ATTRIBUTES}}
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"WITH matching AS ({matching}) {' UNION ALL '.join(branches)}",
+            (*params, *branch_params),
+        )
+        for name, value, count in cursor.fetchall():
+            counts[name].append((value, count))
+    return counts
+
+
+def counts(filters: Filters) -> Counts:
+    """Per-facet value counts within `filters`, cached per filter combination.
+
+    A miss is a query of its own, after the page's, that counts every facet.
+    It stays out of the page's statement: the page is a keyset range on the
+    primary key that stops after PAGE_SIZE rows, the counts aggregate every
+    matching row, and the two return rows of different shapes. Folded
+    together, every page would pay for the aggregate, where this result is
+    shared by every page and worker for FACET_TTL, so a hit costs the page
+    query alone.
+    """
+
+    if (cached := hot.get(key=filters.cache_key)) is None:
+        cached = _count(filters)
+        hot.fill(key=filters.cache_key, value=cached, timeout=FACET_TTL)
+    return cached
+
+
+async def acounts(filters: Filters) -> Counts:
+    if (cached := await hot.aget(key=filters.cache_key)) is None:
+        cached = await sync_to_async(_count)(filters)
+        await hot.afill(key=filters.cache_key, value=cached, timeout=FACET_TTL)
+    return cached
+
+
+def links(query: QueryDict, counts: Counts) -> dict[str, list[dict[str, object]]]:
+    """Facet values with the query string that toggles each one."""
+
+    facets: dict[str, list[dict[str, object]]] = {}
+    for name, values in counts.items():
+        facets[name] = []
+        for value, count in values:
+            toggled = query.copy()
+            toggled.pop("after", None)
+            if name == "tag":
+                tags = toggled.getlist("tag")
+                selected = value in tags
+                toggled.setlist(
+                    "tag",
+                    [tag for tag in tags if tag != value]
+                    if selected
+                    else [*tags, value],
+                )
+            else:
+                selected = toggled.get(name) == value
+                if selected:
+                    toggled.pop(name)
+                else:
+                    toggled[name] = value
+            facets[name].append(
+                {
+                    "value": value,
+                    "count": count,
+                    "selected": selected,
+                    "query": toggled.urlencode(),
+                }
+            )
+    return facets
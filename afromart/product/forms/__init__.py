@@ -0,0 +1,3 @@
+from .product_import import ProductImport
+
+__all__ = ("ProductImport",)
@@ -0,0 +1,8 @@
+from django import forms
+
+from ..importer import FORMATS
+
+
+class ProductImport(forms.Form):
+    file = forms.FileField(label="CSV or JSONL file")
+    format = forms.ChoiceField(choices=[(format, format.upper()) for format in FORMATS])
@@ -0,0 +1,227 @@
+import csv
+import json
+import time
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Any, TextIO
+from uuid import UUID, uuid7
+
+from django.core.exceptions import ValidationError
+from django.core.validators import URLValidator
+from django.db import connection, transaction
+from psycopg.types.json import Jsonb
+
+from . import cache as product_cache
+from .models import Product
+
+FORMATS = ("csv", "jsonl")
+CHUNK_SIZE = 5000
+MAX_ERRORS = 20
+
+COLUMNS = (
+    "id",
+    "trader_id",
+    "title",
+    "description",
+    "in_stock",
+    "price",
+    "image",
+    "video",
+    "tags",
+    "metadata",
+)
+
+STAGING = """
+CREATE TEMPORARY TABLE product_import (
+    line bigint NOT NULL,
+    LIKE product_product INCLUDING DEFAULTS
+) ON COMMIT DROP
+"""
+
+# A file may list the same product twice; the last occurrence wins.
+UPSERT = """
+INSERT INTO product_product ({columns})
+SELECT DISTINCT ON (id) {columns} FROM product_import ORDER BY id, line DESC
+ON CONFLICT (id) DO UPDATE SET {updates}
+""".format(
+    columns=", ".join(COLUMNS),
+    updates=", ".join(f"{column} = EXCLUDED.{column}" for column in COLUMNS[1:]),
+)
+
+# A trader that doesn't exist would fail the whole upsert on the foreign key,
+# so those rows are rejected first.
+UNKNOWN_TRADERS = """
+DELETE FROM product_import AS staged
+WHERE trader_id IS NOT NULL
+AND NOT EXISTS (SELECT FROM trader_trader WHERE trader_trader.id = staged.trader_id)
+RETURNING line, trader_id
+"""
+
+validate_url = URLValidator()
+
+
+@dataclass(slots=True)
+class Report:
+    imported: int = 0
+    rejected: int = 0
+    seconds: float = 0.0
+    errors: list[str] = field(default_factory=list)
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.imported / self.seconds if self.seconds else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"Imported {self.imported} products in {self.seconds:.1f}s "
+            f"({self.rows_per_second:.0f} rows/s), rejected {self.rejected}."
+        )
+
+
+def read(stream: TextIO, format: str) -> Iterator[dict[str, Any] | str]:
+    """Records from a CSV (tags `|`-separated, metadata as JSON) or JSONL stream.
+
+    A record's `trader` is the id of the trader selling it.
+
+    JSONL lines are left for `validate` to parse, so one bad line is a rejected
+    record rather than a failed import.
+    """
+
+    if format == "csv":
+        yield from csv.DictReader(stream)
+    elif format == "jsonl":
+        yield from (line for line in stream if line.strip())
+    else:
+        raise ValueError(f"Unsupported format {format!r}, expected one of {FORMATS}.")
+
+
+def _optional(value: Any) -> Any:
+    return None if value in (None, "") else value
+
+
+def _uuid(record: dict[str, Any], name: str) -> UUID | None:
+    if (value := _optional(record.get(name))) is None:
+        return None
+    try:
+        return UUID(str(value))
+    except ValueError:
+        raise ValueError(f"{name} must be a UUID.") from None
+
+
+def _quantity(record: dict[str, Any], name: str) -> int:
+    try:
+        value = int(record[name])
+    except (KeyError, TypeError, ValueError):
+        raise ValueError(f"{name} must be a whole number.") from None
+    if value < 0:
+        raise ValueError(f"{name} can't be negative.")
+    # Past the column's range COPY would fail, and take the whole import with it.
+    _, maximum = connection.ops.integer_field_range(
+        Product._meta.get_field(name).get_internal_type()
+    )
+    if value > maximum:
+        raise ValueError(f"{name} can't be more than {maximum}.")
+    return value
+
+
+def validate(record: dict[str, Any] | str) -> tuple[Any, ...]:
+    """A COPY-ready row for `record`; raises ValueError if it can't be imported."""
+
+    if isinstance(record, str):
+        record = json.loads(record)
+    if not isinstance(record, dict):
+        raise ValueError("Expected an object.")
+
+    if not isinstance(title := record.get("title"), str) or not title.strip():
+        raise ValueError("title is required.")
+
+    if not isinstance(description := record.get("description") or "", str):
+        raise ValueError("description must be text.")
+
+    for name in ("image", "video"):
+        if url := _optional(record.get(name)):
+            try:
+                validate_url(url)
+            except ValidationError:
+                raise ValueError(f"{name} must be a URL.") from None
+            # URLValidator allows 2048 characters, more than the column holds.
+            if len(url) > (max_length := Product._meta.get_field(name).max_length):
+                raise ValueError(
+                    f"{name} can't be longer than {max_length} characters."
+                )
+
+    tags = _optional(record.get("tags"))
+    if isinstance(tags, str):
+        tags = [tag.strip() for tag in tags.split("|") if tag.strip()]
+    if tags is not None and not (
+        isinstance(tags, list) and all(isinstance(tag, str) for tag in tags)
+    ):
+        raise ValueError("tags must be a list of strings.")
+
+    metadata = _optional(record.get("metadata"))
+    if isinstance(metadata, str):
+        metadata = json.loads(metadata)
+    if metadata is not None and not isinstance(metadata, dict):
+        raise ValueError("metadata must be an object.")
+
+    return (
+        _uuid(record, "id") or uuid7(),
+        _uuid(record, "trader"),
+        title.strip(),
+        description,
+        _quantity(record, "in_stock"),
+        _quantity(record, "price"),
+        _optional(record.get("image")),
+        _optional(record.get("video")),
+        tags,
+        Jsonb(metadata) if metadata is not None else None,
+    )
+
+
+def chunked(iterable: Iterable[Any], size: int) -> Iterator[list[Any]]:
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def load(stream: TextIO, format: str, *, chunk_size: int = CHUNK_SIZE) -> Report:
+    """Stream `stream` into product_product: COPY into staging, then one upsert.
+
+    Memory is bounded by `chunk_size`, whatever the size of the file.
+    """
+
+    report = Report()
+    started = time.perf_counter()
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(STAGING)
+
+        with cursor.copy(
+            f"COPY product_import ({', '.join(COLUMNS)}, line) FROM STDIN"
+        ) as copy:
+            for chunk in chunked(enumerate(read(stream, format), start=1), chunk_size):
+                for line, record in chunk:
+                    try:
+                        copy.write_row((*validate(record), line))
+                    except ValueError as error:
+                        report.rejected += 1
+                        if len(report.errors) < MAX_ERRORS:
+                            report.errors.append(f"Record {line}: {error}")
+
+        cursor.execute(UNKNOWN_TRADERS)
+        for line, trader_id in sorted(cursor.fetchall()):
+            report.rejected += 1
+            if len(report.errors) < MAX_ERRORS:
+                report.errors.append(
+                    f"Record {line}: trader {trader_id} doesn't exist."
+                )
+
+        cursor.execute(UPSERT)
+        report.imported = cursor.rowcount
+
+        # Cheaper than listing what changed, and rare.
+        transaction.on_commit(product_cache.clear)
+
+    report.seconds = time.perf_counter() - started
+    return report
@@ -0,0 +1,60 @@
+import time
+from argparse import ArgumentParser
+from typing import Any
+from uuid import UUID
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+# One short transaction per batch, walking the primary key so each batch is an
+# index range scan and no long-lived lock is held on the table.
+BACKFILL_BATCH = """
+WITH batch AS (
+    SELECT id FROM product_product WHERE id > %(after)s ORDER BY id LIMIT %(size)s
+), updated AS (
+    UPDATE product_product AS product
+    SET search_vector = product_search_vector(product.title, product.description, product.tags)
+    FROM batch
+    WHERE product.id = batch.id AND (%(everything)s OR product.search_vector IS NULL)
+    RETURNING 1
+)
+SELECT (SELECT id FROM batch ORDER BY id DESC LIMIT 1), (SELECT count(*) FROM updated)
+"""
+
+
+class Command(BaseCommand):
+    help = "Fill product search vectors in batches, e.g. after migrating an existing catalog."
+
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        parser.add_argument("--batch-size", type=int, default=5000)
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Recompute every vector, not just missing ones.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        after, updated = UUID(int=0), 0
+        started = time.perf_counter()
+
+        while True:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    BACKFILL_BATCH,
+                    {
+                        "after": after,
+                        "size": options["batch_size"],
+                        "everything": options["all"],
+                    },
+                )
+                last_id, batch_updated = cursor.fetchone()
+
+            if last_id is None:
+                break
+
+            after, updated = last_id, updated + batch_updated
+            self.stdout.write(
+                f"{updated} updated, {updated / (time.perf_counter() - started):.0f} rows/s"
+            )
+
+        self.stdout.write(self.style.SUCCESS(f"Backfilled {updated} products."))
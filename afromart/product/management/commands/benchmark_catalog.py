@@ -0,0 +1,59 @@
+from argparse import ArgumentParser
+from typing import Any
+
+from django.core.management.base import BaseCommand
+
+from afromart import benchmark
+
+from ... import catalog
+from ...models import Product
+from ...seed import seed
+
+
+class Command(BaseCommand):
+    help = "Compare keyset and OFFSET catalog pagination latency across page depths."
+
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        parser.add_argument(
+            "--seed", type=int, default=0, help="COPY this many products first."
+        )
+        parser.add_argument(
+            "--pages", type=int, nargs="+", default=[1, 10, 100, 1000, 10000]
+        )
+        parser.add_argument("--requests", type=int, default=200)
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        if options["seed"]:
+            seed(options["seed"])
+
+        total = Product.objects.count()
+        self.stdout.write(f"{total} products, {catalog.PAGE_SIZE} per page")
+
+        for number in options["pages"]:
+            offset = (number - 1) * catalog.PAGE_SIZE
+            if offset >= total:
+                break
+
+            after = (
+                catalog.listing().values_list("id", flat=True)[offset - 1]
+                if offset
+                else None
+            )
+
+            for result in (
+                benchmark.run(
+                    f"keyset page {number}",
+                    lambda: bool(catalog.page(catalog.listing(), after=after)),
+                    concurrency=1,
+                    requests=options["requests"],
+                ),
+                benchmark.run(
+                    f"offset page {number}",
+                    lambda: bool(
+                        list(catalog.listing()[offset : offset + catalog.PAGE_SIZE])
+                    ),
+                    concurrency=1,
+                    requests=options["requests"],
+                ),
+            ):
+                self.stdout.write(str(result))
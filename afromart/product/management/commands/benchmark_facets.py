@@ -0,0 +1,60 @@
+from argparse import ArgumentParser
+from typing import Any
+
+from django.core.management.base import BaseCommand
+
+from afromart import benchmark
+from afromart.cache import hot
+
+from ... import catalog, facets
+from ...models import Product
+from ...seed import seed
+
+
+class Command(BaseCommand):
+    help = "Time filtered catalog pages and facet counts, cold and cached."
+
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        parser.add_argument(
+            "--seed", type=int, default=0, help="COPY this many products first."
+        )
+        parser.add_argument("--requests", type=int, default=100)
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        if options["seed"]:
+            seed(options["seed"])
+
+        self.stdout.write(f"{Product.objects.count()} products")
+
+        for filters in (
+            facets.Filters(tags=("kente",)),
+            facets.Filters(attributes={"origin": "KE"}),
+            facets.Filters(tags=("kente", "leather"), attributes={"origin": "GH"}),
+        ):
+            label = f"{list(filters.tags)} {filters.attributes}"
+
+            def cold_counts() -> bool:
+                hot.delete(key=filters.cache_key)
+                return bool(facets.counts(filters))
+
+            for result in (
+                benchmark.run(
+                    f"page {label}",
+                    lambda: bool(catalog.page(filters.apply(catalog.listing()))),
+                    concurrency=1,
+                    requests=options["requests"],
+                ),
+                benchmark.run(
+                    f"counts cold {label}",
+                    cold_counts,
+                    concurrency=1,
+                    requests=options["requests"],
+                ),
+                benchmark.run(
+                    f"counts cached {label}",
+                    lambda: bool(facets.counts(filters)),
+                    concurrency=1,
+                    requests=options["requests"],
+                ),
+            ):
+                self.stdout.write(str(result))
@@ -0,0 +1,65 @@
+from argparse import ArgumentParser
+from typing import Any
+
+from django.core.management.base import BaseCommand
+
+from afromart import benchmark
+
+from ... import search
+from ...models import Product
+from ...seed import seed
+
+
+class Command(BaseCommand):
+    help = "Time ranked product search, including typo'd terms and a second page."
+
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        parser.add_argument(
+            "--seed", type=int, default=0, help="COPY this many products first."
+        )
+        parser.add_argument(
+            "--terms",
+            nargs="+",
+            default=[
+                "kente",
+                "leather sandals",
+                "shea butter soap",
+                "kitnge",
+                "djembe -drum",
+            ],
+        )
+        parser.add_argument("--requests", type=int, default=200)
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        if options["seed"]:
+            seed(options["seed"])
+
+        self.stdout.write(f"{Product.objects.count()} products")
+
+        for terms in options["terms"]:
+            _, cursor = search.page(search.search(terms))
+            self.stdout.write(
+                str(
+                    benchmark.run(
+                        f"{terms!r} page 1",
+                        lambda: bool(search.page(search.search(terms))),
+                        concurrency=1,
+                        requests=options["requests"],
+                    )
+                )
+            )
+
+            if cursor:
+                after = search.decode_cursor(cursor)
+                self.stdout.write(
+                    str(
+                        benchmark.run(
+                            f"{terms!r} page 2",
+                            lambda: bool(
+                                search.page(search.search(terms), after=after)
+                            ),
+                            concurrency=1,
+                            requests=options["requests"],
+                        )
+                    )
+                )
@@ -0,0 +1,36 @@
+from argparse import ArgumentParser
+from pathlib import Path
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError
+
+from ... import importer
+
+
+class Command(BaseCommand):
+    help = "Bulk import products from a CSV or JSONL file."
+
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        parser.add_argument("path", type=Path)
+        parser.add_argument(
+            "--format",
+            choices=importer.FORMATS,
+            help="Defaults to the file extension.",
+        )
+        parser.add_argument("--chunk-size", type=int, default=importer.CHUNK_SIZE)
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        path: Path = options["path"]
+        format = options["format"] or path.suffix.lstrip(".").lower()
+        if format not in importer.FORMATS:
+            raise CommandError(f"Can't tell the format of {path}, pass --format.")
+
+        try:
+            with path.open(encoding="utf-8-sig", newline="") as stream:
+                report = importer.load(stream, format, chunk_size=options["chunk_size"])
+        except UnicodeDecodeError as error:
+            raise CommandError(f"{path} isn't UTF-8: {error.reason}.") from None
+
+        for error in report.errors:
+            self.stderr.write(error)
+        self.stdout.write(self.style.SUCCESS(str(report)))
@@ -0,0 +1,60 @@
+# Generated by Django 5.2.7 on 2026-10-18 11:47
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.operations import AddIndexConcurrently, TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    # Indexes are built concurrently so a big catalog stays writable meanwhile.
+    atomic = False
+
+    dependencies = [
+        ('product', '0001_initial'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddField(
+            model_name='product',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        # Existing rows are filled in batches by `manage.py backfill_search_vector`.
+        migrations.RunSQL(
+            sql="""
+                CREATE FUNCTION product_search_vector(title text, description text, tags text[])
+                RETURNS tsvector LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+                    SELECT setweight(to_tsvector('english', coalesce(title, '')), 'A')
+                        || setweight(to_tsvector('english', coalesce(array_to_string(tags, ' '), '')), 'B')
+                        || setweight(to_tsvector('english', coalesce(description, '')), 'C')
+                $$;
+
+                CREATE FUNCTION product_search_vector_trigger() RETURNS trigger
+                LANGUAGE plpgsql AS $$
+                BEGIN
+                    NEW.search_vector := product_search_vector(NEW.title, NEW.description, NEW.tags);
+                    RETURN NEW;
+                END
+                $$;
+
+                CREATE TRIGGER product_search_vector_update
+                BEFORE INSERT OR UPDATE OF title, description, tags ON product_product
+                FOR EACH ROW EXECUTE FUNCTION product_search_vector_trigger();
+            """,
+            reverse_sql="""
+                DROP TRIGGER product_search_vector_update ON product_product;
+                DROP FUNCTION product_search_vector_trigger();
+                DROP FUNCTION product_search_vector(text, text, text[]);
+            """,
+        ),
+        AddIndexConcurrently(
+            model_name='product',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='product_search_vector_gin'),
+        ),
+        AddIndexConcurrently(
+            model_name='product',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['title'], name='product_title_trgm', opclasses=['gin_trgm_ops']),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.7 on 2026-10-18 11:49
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ('product', '0002_search'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='product',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['tags'], name='product_tags_gin'),
+        ),
+        AddIndexConcurrently(
+            model_name='product',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['metadata'], name='product_metadata_gin', opclasses=['jsonb_path_ops']),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.7 on 2026-10-18 11:58
+
+import django.db.models.deletion
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ('product', '0003_facets'),
+        ('trader', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='product',
+            name='trader',
+            field=models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='products', to='trader.trader', verbose_name='Trader'),
+        ),
+        AddIndexConcurrently(
+            model_name='product',
+            index=models.Index(fields=['trader', 'in_stock'], name='product_trader_in_stock'),
+        ),
+    ]
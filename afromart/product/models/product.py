@@ -1,11 +1,22 @@
 from uuid import uuid7
 
 from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 
 
 class Product(models.Model):
     id = models.UUIDField(default=uuid7, primary_key=True, editable=False)
+    trader = models.ForeignKey(
+        "trader.Trader",
+        on_delete=models.PROTECT,
+        related_name="products",
+        verbose_name="Trader",
+        blank=True,
+        null=True,
+        db_index=False,  # Covered by product_trader_in_stock.
+    )
     title = models.CharField(verbose_name="Title")
     description = models.TextField(verbose_name="Description")
     in_stock = models.PositiveIntegerField(verbose_name="In Stock")
@@ -16,6 +27,23 @@ class Product(models.Model):
         base_field=models.CharField(), blank=True, null=True, verbose_name="Tags"
     )
     metadata = models.JSONField(verbose_name="Metadata", blank=True, null=True)
+    # Maintained by the product_search_vector_update trigger, see migration 0002.
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["trader", "in_stock"], name="product_trader_in_stock"),
+            GinIndex(fields=["search_vector"], name="product_search_vector_gin"),
+            GinIndex(
+                fields=["title"], name="product_title_trgm", opclasses=["gin_trgm_ops"]
+            ),
+            GinIndex(fields=["tags"], name="product_tags_gin"),
+            GinIndex(
+                fields=["metadata"],
+                name="product_metadata_gin",
+                opclasses=["jsonb_path_ops"],
+            ),
+        ]
 
     def __str__(self) -> str:
         return self.title
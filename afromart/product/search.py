@@ -0,0 +1,77 @@
+from uuid import UUID
+
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    TrigramWordSimilarity,
+)
+from django.db.models import F, FloatField, Q, QuerySet
+from django.db.models.functions import Cast
+
+from .catalog import LIST_FIELDS, PAGE_SIZE
+from .models import Product
+
+Cursor = tuple[float, UUID]
+
+
+def search(terms: str) -> QuerySet[Product]:
+    """Products matching `terms`, best first.
+
+    Full-text matches come from the GIN-indexed search_vector; the trigram
+    index on title catches misspellings the stemmer can't.
+    """
+
+    query = SearchQuery(terms, config="english", search_type="websearch")
+
+    return (
+        Product.objects.only(*LIST_FIELDS)
+        .filter(Q(search_vector=query) | Q(title__trigram_word_similar=terms))
+        .annotate(
+            rank=Cast(
+                SearchRank(F("search_vector"), query)
+                + TrigramWordSimilarity(terms, "title"),
+                output_field=FloatField(),
+            )
+        )
+        .order_by("-rank", "-id")
+    )
+
+
+def encode_cursor(product: Product) -> str:
+    return f"{product.rank!r}~{product.id}"  # pyright: ignore[reportAttributeAccessIssue]
+
+
+def decode_cursor(cursor: str) -> Cursor:
+    """Raises ValueError on a malformed cursor."""
+
+    rank, _, product_id = cursor.partition("~")
+    return float(rank), UUID(product_id)
+
+
+def _seek(
+    queryset: QuerySet[Product], after: Cursor | None, size: int
+) -> QuerySet[Product]:
+    if after is not None:
+        rank, product_id = after
+        queryset = queryset.filter(Q(rank__lt=rank) | Q(rank=rank, id__lt=product_id))
+    return queryset[: size + 1]
+
+
+def _split(products: list[Product], size: int) -> tuple[list[Product], str | None]:
+    if len(products) > size:
+        return products[:size], encode_cursor(products[size - 1])
+    return products, None
+
+
+def page(
+    queryset: QuerySet[Product], *, after: Cursor | None = None, size: int = PAGE_SIZE
+) -> tuple[list[Product], str | None]:
+    """One keyset page of ranked results, seeking on (rank, id)."""
+
+    return _split(list(_seek(queryset, after, size)), size)
+
+
+async def apage(
+    queryset: QuerySet[Product], *, after: Cursor | None = None, size: int = PAGE_SIZE
+) -> tuple[list[Product], str | None]:
+    return _split([product async for product in _seek(queryset, after, size)], size)
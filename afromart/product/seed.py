@@ -0,0 +1,47 @@
+import random
+from uuid import uuid7
+
+from django.db import connection, transaction
+from psycopg.types.json import Jsonb
+
+WORDS = (
+    "kente", "kikoy", "shuka", "ankara", "mudcloth", "kitenge", "basket", "sisal",
+    "beaded", "necklace", "bracelet", "sandals", "leather", "bag", "coffee", "tea",
+    "shea", "butter", "soap", "carving", "ebony", "soapstone", "mask", "drum",
+    "djembe", "mbira", "rug", "pottery", "bowl", "spice", "pilipili", "honey",
+    "cashew", "macadamia", "baobab", "hibiscus", "rooibos", "vanilla", "cocoa", "print",
+)
+ORIGINS = ("KE", "TZ", "UG", "RW", "ET", "GH", "NG", "SN", "ZA", "MA", "EG", "CI")
+MATERIALS = ("cotton", "leather", "wood", "stone", "clay", "sisal", "beads", "metal")
+
+
+def seed(count: int) -> None:
+    """COPY `count` synthetic products into product_product."""
+
+    rng = random.Random(count)
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        with cursor.copy(
+            "COPY product_product (id, title, description, in_stock, price, tags, metadata) FROM STDIN"
+        ) as copy:
+            for _ in range(count):
+                words = rng.sample(WORDS, k=6)
+                copy.write_row(
+                    (
+                        uuid7(),
+                        " ".join(words[:3]).title(),
+                        " ".join(rng.choices(WORDS, k=40)).capitalize() + ".",
+                        rng.randrange(0, 500),
+                        rng.randrange(100, 1_000_000),
+                        words[3 : 3 + rng.randrange(1, 4)],
+                        Jsonb(
+                            {
+                                "origin": rng.choice(ORIGINS),
+                                "material": rng.choice(MATERIALS),
+                            }
+                        ),
+                    )
+                )
+
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE product_product")
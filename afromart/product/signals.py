@@ -0,0 +1,15 @@
+from functools import partial
+from typing import Any
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from . import cache
+from .models import Product
+
+
+@receiver(post_save, sender=Product)
+@receiver(post_delete, sender=Product)
+def invalidate_product(instance: Product, **kwargs: Any) -> None:
+    transaction.on_commit(partial(cache.invalidate, [instance.pk]))
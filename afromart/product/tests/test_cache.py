@@ -0,0 +1,70 @@
+from uuid import uuid7
+
+import pytest
+
+from afromart.cache import hot
+
+from product import cache as product_cache
+from product.models import Product
+
+
+@pytest.fixture
+def products() -> list[Product]:
+    return Product.objects.bulk_create(
+        Product(title=f"Kikoy {n}", description="", in_stock=n, price=1_000 + n)
+        for n in range(5)
+    )
+
+
+@pytest.mark.django_db
+def test_get_many_reads_through(
+    products: list[Product], django_assert_num_queries
+) -> None:
+    ids = [product.pk for product in products]
+    missing = uuid7()
+
+    with django_assert_num_queries(1):
+        first = product_cache.get_many([*ids, missing])
+    with django_assert_num_queries(0):
+        second = product_cache.get_many([*ids, missing])
+
+    assert set(first) == set(second) == set(ids)
+    assert [second[i].title for i in ids] == [p.title for p in products]
+    assert not second[ids[0]]._state.adding
+
+
+@pytest.mark.django_db
+def test_entries_hold_no_models(products: list[Product]) -> None:
+    product_cache.get(products[0].pk)
+
+    expires_at, seconds, values = hot.get(product_cache.key(products[0].pk))
+    assert isinstance(expires_at, float) and isinstance(seconds, float)
+    assert all(isinstance(value, (str, int, type(None))) for value in values)
+
+
+@pytest.mark.django_db
+def test_saving_invalidates(
+    products: list[Product], django_capture_on_commit_callbacks
+) -> None:
+    product = product_cache.get(products[0].pk)
+    assert product is not None
+
+    with django_capture_on_commit_callbacks(execute=True):
+        product.in_stock = 99
+        product.save()
+
+    assert product_cache.get(products[0].pk).in_stock == 99  # pyright: ignore[reportOptionalMemberAccess]
+
+
+@pytest.mark.django_db
+def test_entries_near_expiry_refresh_early(
+    products: list[Product], django_assert_num_queries
+) -> None:
+    key = product_cache.key(products[0].pk)
+    product_cache.get(products[0].pk)
+    _, seconds, values = hot.get(key)
+    hot.set(key, (0.0, seconds, values))
+
+    with django_assert_num_queries(1):
+        product_cache.get(products[0].pk)
+    assert hot.get(key)[0] > 0
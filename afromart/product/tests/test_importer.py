@@ -0,0 +1,138 @@
+import io
+import json
+from typing import Any
+from uuid import uuid7
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import Client
+from django.urls import reverse
+
+from product import importer
+from product.models import Product
+from trader.models import Trader
+
+
+@pytest.mark.django_db
+def test_load_jsonl_upserts_and_rejects() -> None:
+    existing = Product.objects.create(
+        title="Old title", description="", in_stock=1, price=100
+    )
+    lines = [
+        {"id": str(existing.id), "title": "Kente", "in_stock": 5, "price": 4500},
+        {"title": "Kikoy", "in_stock": 2, "price": 900, "tags": ["cloth"]},
+        {"title": "", "in_stock": 1, "price": 1},
+        {"title": "Mask", "in_stock": -1, "price": 1},
+    ]
+    stream = io.StringIO(
+        "\n".join([*(json.dumps(line) for line in lines), "{not json"]) + "\n"
+    )
+
+    report = importer.load(stream, "jsonl", chunk_size=2)
+
+    assert (report.imported, report.rejected) == (2, 3)
+    existing.refresh_from_db()
+    assert (existing.title, existing.in_stock) == ("Kente", 5)
+    assert Product.objects.get(title="Kikoy").tags == ["cloth"]
+
+
+@pytest.mark.django_db
+def test_load_csv_last_duplicate_wins() -> None:
+    product_id = uuid7()
+    stream = io.StringIO(
+        "id,title,in_stock,price,tags,metadata\n"
+        f'{product_id},Kikoy,1,100,cloth|cotton,"{{""origin"": ""KE""}}"\n'
+        f"{product_id},Kikoy Beach,2,120,,\n"
+    )
+
+    report = importer.load(stream, "csv")
+
+    assert (report.imported, report.rejected) == (1, 0)
+    product = Product.objects.get(pk=product_id)
+    assert (product.title, product.in_stock, product.metadata) == (
+        "Kikoy Beach",
+        2,
+        None,
+    )
+
+
+@pytest.mark.django_db
+def test_load_sets_traders_and_rejects_unknown_ones() -> None:
+    trader = Trader.objects.create(
+        user=User.objects.create_user(username="trader", password="secret"),
+        name="Kente House",
+    )
+    unknown = uuid7()
+    stream = io.StringIO(
+        "title,trader,in_stock,price\n"
+        f"Kente,{trader.pk},1,100\n"
+        f"Kikoy,{unknown},1,100\n"
+        "Mask,not-a-uuid,1,100\n"
+        "Drum,,1,100\n"
+    )
+
+    report = importer.load(stream, "csv")
+
+    assert (report.imported, report.rejected) == (2, 2)
+    assert report.errors == [
+        "Record 3: trader must be a UUID.",
+        f"Record 2: trader {unknown} doesn't exist.",
+    ]
+    assert dict(Product.objects.values_list("title", "trader")) == {
+        "Kente": trader.pk,
+        "Drum": None,
+    }
+
+
+@pytest.mark.django_db
+def test_load_rejects_values_past_their_column() -> None:
+    long_url = "https://example.com/" + "a" * 181
+    stream = io.StringIO(
+        "title,in_stock,price,image\n"
+        f"Kente,{2**31},100,\n"
+        f"Kikoy,1,{2**63},\n"
+        f"Drum,1,1,{long_url}\n"
+        f"Mask,{2**31 - 1},{2**63 - 1},{long_url[:200]}\n"
+    )
+
+    report = importer.load(stream, "csv")
+
+    assert (report.imported, report.rejected) == (1, 3)
+    assert Product.objects.get().title == "Mask"
+
+
+@pytest.mark.django_db
+def test_load_rejects_descriptions_that_arent_text() -> None:
+    lines = [
+        {"title": "Kente", "in_stock": 1, "price": 1, "description": {"a": 1}},
+        {"title": "Kikoy", "in_stock": 1, "price": 1, "description": ["a"]},
+    ]
+    stream = io.StringIO("".join(f"{json.dumps(line)}\n" for line in lines))
+
+    report = importer.load(stream, "jsonl")
+
+    assert (report.imported, report.rejected) == (0, 2)
+    assert report.errors[0] == "Record 1: description must be text."
+
+
+# Each import drops its staging table on commit, so commit.
+@pytest.mark.django_db(transaction=True)
+def test_admin_upload_reads_a_bom_and_reports_bad_encodings(
+    admin_client: Client,
+) -> None:
+    url = reverse("admin:product_product_import")
+
+    def upload(content: bytes) -> Any:
+        file = SimpleUploadedFile("products.csv", content, "text/csv")
+        return admin_client.post(url, {"file": file, "format": "csv"})
+
+    assert upload(b"\xef\xbb\xbftitle,in_stock,price\nKente,1,100\n").status_code == 302
+    assert Product.objects.get().title == "Kente"
+
+    response = upload(b"title,in_stock,price\nK\xe9nte,1,100\n")
+    assert response.status_code == 200
+    assert response.context["form"].errors["file"] == [
+        "The file isn't UTF-8: invalid continuation byte."
+    ]
+    assert Product.objects.count() == 1
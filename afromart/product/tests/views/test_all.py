@@ -0,0 +1,122 @@
+from uuid import uuid7
+
+import pytest
+from django.test import Client
+from django.urls import reverse
+
+from afromart.cache import hot
+from product.facets import Filters
+from product.models import Product
+
+
+@pytest.fixture
+def products() -> list[Product]:
+    return Product.objects.bulk_create(
+        Product(
+            title=f"Kikoy {n}",
+            description="Handwoven.",
+            in_stock=n,
+            price=1_000 + n,
+        )
+        for n in range(30)
+    )
+
+
+@pytest.mark.django_db
+def test_catalog_keyset_pages(client: Client, products: list[Product]) -> None:
+    first = client.get(reverse("product:catalog"))
+    assert first.status_code == 200
+    assert len(first.context["products"]) == 24
+    assert (cursor := first.context["next_cursor"])
+
+    second = client.get(reverse("product:catalog"), {"after": cursor})
+    assert len(second.context["products"]) == 6
+    assert second.context["next_cursor"] is None
+
+    seen = [p.id for p in first.context["products"] + second.context["products"]]
+    assert seen == sorted((p.id for p in products), reverse=True)
+
+
+@pytest.mark.django_db
+def test_catalog_invalid_cursor(client: Client) -> None:
+    assert client.get(reverse("product:catalog"), {"after": "x"}).status_code == 400
+
+
+@pytest.mark.django_db
+def test_detail(client: Client, products: list[Product]) -> None:
+    assert client.get(reverse("product:detail", args=(products[0].id,))).status_code == 200
+    assert client.get(reverse("product:detail", args=(uuid7(),))).status_code == 404
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("terms", ("kente", "kente scarf", "kentte"))
+def test_search(client: Client, products: list[Product], terms: str) -> None:
+    kente = Product.objects.create(
+        title="Kente Scarf", description="Woven in Bonwire.", in_stock=3, price=4_500
+    )
+
+    response = client.get(reverse("product:search"), {"q": terms})
+    assert response.status_code == 200
+    assert [p.id for p in response.context["products"]] == [kente.id]
+
+
+@pytest.mark.django_db
+def test_search_keyset_pages(client: Client, products: list[Product]) -> None:
+    first = client.get(reverse("product:search"), {"q": "kikoy"})
+    assert len(first.context["products"]) == 24
+
+    second = client.get(
+        reverse("product:search"), {"q": "kikoy", "after": first.context["next_cursor"]}
+    )
+    assert len(second.context["products"]) == 6
+    assert not {p.id for p in first.context["products"]} & {
+        p.id for p in second.context["products"]
+    }
+
+
+@pytest.mark.django_db
+def test_catalog_facets(client: Client) -> None:
+    # Counts from an earlier run would outlive its rolled-back products.
+    hot.delete_many(
+        [
+            Filters(attributes={"origin": "KE"}).cache_key,
+            Filters(tags=("cloth", "woven")).cache_key,
+        ]
+    )
+    Product.objects.bulk_create(
+        [
+            Product(
+                title="Kente",
+                description="",
+                in_stock=1,
+                price=1,
+                tags=["cloth", "woven"],
+                metadata={"origin": "GH"},
+            ),
+            Product(
+                title="Kikoy",
+                description="",
+                in_stock=1,
+                price=1,
+                tags=["cloth"],
+                metadata={"origin": "KE"},
+            ),
+            Product(
+                title="Sandals",
+                description="",
+                in_stock=1,
+                price=1,
+                tags=["leather"],
+                metadata={"origin": "KE"},
+            ),
+        ]
+    )
+
+    response = client.get(reverse("product:catalog"), {"origin": "KE"})
+    assert {p.title for p in response.context["products"]} == {"Kikoy", "Sandals"}
+    facets = response.context["facets"]
+    assert {f["value"]: f["count"] for f in facets["tag"]} == {"cloth": 1, "leather": 1}
+    assert [(f["value"], f["selected"]) for f in facets["origin"]] == [("KE", True)]
+
+    response = client.get(reverse("product:catalog"), {"tag": ["cloth", "woven"]})
+    assert [p.title for p in response.context["products"]] == ["Kente"]
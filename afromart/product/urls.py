@@ -1,3 +1,11 @@
+from django.urls import path
+
+from .views import catalog, detail, search
+
 app_name = "product"
 
-urlpatterns = []
+urlpatterns = [
+    path(route="", view=catalog, name="catalog"),
+    path(route="search/", view=search, name="search"),
+    path(route="<uuid:product_id>/", view=detail, name="detail"),
+]
@@ -0,0 +1,5 @@
+from .catalog import catalog
+from .detail import detail
+from .search import search
+
+__all__ = ("catalog", "detail", "search")
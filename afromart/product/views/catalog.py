@@ -0,0 +1,35 @@
+from uuid import UUID
+
+from django.http import HttpRequest, HttpResponse, HttpResponseBadRequest
+from django.shortcuts import render
+from django.views.decorators.http import require_GET
+
+from .. import catalog as product_catalog
+from .. import facets as product_facets
+
+
+@require_GET
+async def catalog(request: HttpRequest) -> HttpResponse:
+    request.user = await request.auser()  # pyright: ignore[reportAttributeAccessIssue]
+
+    try:
+        after = UUID(cursor) if (cursor := request.GET.get("after")) else None
+    except ValueError:
+        return HttpResponseBadRequest(content="Invalid cursor.")
+
+    filters = product_facets.Filters.from_query(request.GET)
+
+    products, next_cursor = await product_catalog.apage(
+        filters.apply(product_catalog.listing()), after=after
+    )
+    counts = await product_facets.acounts(filters)
+
+    return render(
+        request=request,
+        template_name="product/catalog.html",
+        context={
+            "products": products,
+            "next_cursor": next_cursor,
+            "facets": product_facets.links(request.GET, counts),
+        },
+    )
@@ -0,0 +1,21 @@
+from uuid import UUID
+
+from django.http import Http404, HttpRequest, HttpResponse
+from django.shortcuts import render
+from django.views.decorators.http import require_GET
+
+from .. import cache
+
+
+@require_GET
+async def detail(request: HttpRequest, product_id: UUID) -> HttpResponse:
+    request.user = await request.auser()  # pyright: ignore[reportAttributeAccessIssue]
+
+    if (product := await cache.aget(product_id)) is None:
+        raise Http404("No Product matches the given query.")
+
+    return render(
+        request=request,
+        template_name="product/detail.html",
+        context={"product": product},
+    )
@@ -0,0 +1,33 @@
+from django.http import HttpRequest, HttpResponse, HttpResponseBadRequest
+from django.shortcuts import render
+from django.views.decorators.http import require_GET
+
+from .. import search as product_search
+
+
+@require_GET
+async def search(request: HttpRequest) -> HttpResponse:
+    request.user = await request.auser()  # pyright: ignore[reportAttributeAccessIssue]
+
+    terms = request.GET.get("q", "").strip()[:200]
+    products, next_cursor = [], None
+
+    if terms:
+        try:
+            after = (
+                product_search.decode_cursor(cursor)
+                if (cursor := request.GET.get("after"))
+                else None
+            )
+        except ValueError:
+            return HttpResponseBadRequest(content="Invalid cursor.")
+
+        products, next_cursor = await product_search.apage(
+            product_search.search(terms), after=after
+        )
+
+    return render(
+        request=request,
+        template_name="product/search.html",
+        context={"terms": terms, "products": products, "next_cursor": next_cursor},
+    )
@@ -0,0 +1,4 @@
+from .rate import RateAdmin
+from .zone import ZoneAdmin
+
+__all__ = ("RateAdmin", "ZoneAdmin")
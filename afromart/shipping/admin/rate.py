@@ -0,0 +1,11 @@
+from django.contrib import admin
+
+from ..models import Rate
+
+
+@admin.register(Rate)
+class RateAdmin(admin.ModelAdmin):  # pyright: ignore[reportMissingTypeArgument]
+    list_display = ("origin", "destination", "max_weight", "price")
+    list_filter = ("origin", "destination")
+    list_select_related = ("origin", "destination")
+    ordering = ("origin", "destination", "max_weight")
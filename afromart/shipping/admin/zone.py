@@ -0,0 +1,9 @@
+from django.contrib import admin
+
+from ..models import Zone
+
+
+@admin.register(Zone)
+class ZoneAdmin(admin.ModelAdmin):  # pyright: ignore[reportMissingTypeArgument]
+    list_display = ("code", "name", "countries")
+    search_fields = ("code", "name")
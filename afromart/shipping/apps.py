@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class ShippingConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "shipping"
+
+    def ready(self) -> None:
+        from . import signals  # noqa: F401
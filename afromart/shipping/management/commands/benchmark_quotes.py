@@ -0,0 +1,76 @@
+import random
+import time
+from argparse import ArgumentParser
+from typing import Any
+
+from django.core.management.base import BaseCommand
+
+from afromart import benchmark
+
+from ... import rates
+from ...models.rate import WEIGHT_STEP
+
+BANDS = 40
+
+
+class Command(BaseCommand):
+    help = "Measure per-quote cost against the in-memory table and the quote cache."
+
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        parser.add_argument("--zones", type=int, default=12)
+        parser.add_argument("--quotes", type=int, default=200_000)
+        parser.add_argument("--cart-size", type=int, default=8)
+        parser.add_argument("--carts", type=int, default=2000)
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        zones = [f"benchmark-{index}" for index in range(options["zones"])]
+        table = rates.RateTable(
+            zones={},
+            rates=(
+                (origin, destination, band * WEIGHT_STEP * 5, 500 + band * 150)
+                for origin in zones
+                for destination in zones
+                for band in range(1, BANDS + 1)
+            ),
+        )
+        heaviest = BANDS * WEIGHT_STEP * 5
+        parcels = [
+            rates.Parcel(
+                random.choice(zones), random.choice(zones), random.randint(1, heaviest)
+            )
+            for _ in range(options["quotes"])
+        ]
+
+        started = time.perf_counter()
+        for parcel in parcels:
+            table.quote(parcel)
+        elapsed = time.perf_counter() - started
+        self.stdout.write(
+            f"{'table lookup':<32} {elapsed / len(parcels) * 1e9:>9.0f} ns/quote"
+        )
+
+        size = options["cart_size"]
+        for label, warm in (("quote_many cold", False), ("quote_many warm", True)):
+            if not warm:
+                rates.reset()
+            carts = iter(
+                [
+                    parcels[index : index + size]
+                    for index in range(0, len(parcels), size)
+                ]
+            )
+
+            def quote_cart() -> bool:
+                return all(rates.quote_many(next(carts), rates=table))
+
+            result = benchmark.run(
+                f"{label} ({size}/cart)",
+                quote_cart,
+                concurrency=1,
+                requests=min(options["carts"], len(parcels) // size),
+            )
+            self.stdout.write(
+                f"{result}  {result.p50_ms / size * 1000:.1f}µs/quote at p50"
+            )
+
+        rates.reset()
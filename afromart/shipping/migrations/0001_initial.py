@@ -0,0 +1,39 @@
+# Generated by Django 5.2.7 on 2026-10-18 11:57
+
+import django.contrib.postgres.fields
+import django.db.models.deletion
+import shipping.models.rate
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Zone',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('code', models.SlugField(max_length=32, unique=True, verbose_name='Code')),
+                ('name', models.CharField(verbose_name='Name')),
+                ('countries', django.contrib.postgres.fields.ArrayField(base_field=models.CharField(max_length=2), size=None, verbose_name='Countries')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='Rate',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('max_weight', models.PositiveIntegerField(validators=[shipping.models.rate.validate_weight_step], verbose_name='Max Weight (g)')),
+                ('price', models.PositiveBigIntegerField(verbose_name='Price')),
+                ('destination', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='inbound_rates', to='shipping.zone', verbose_name='Destination')),
+                ('origin', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='outbound_rates', to='shipping.zone', verbose_name='Origin')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('origin', 'destination', 'max_weight'), name='shipping_rate_unique_band')],
+            },
+        ),
+    ]
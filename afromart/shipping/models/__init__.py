@@ -0,0 +1,4 @@
+from .rate import Rate
+from .zone import Zone
+
+__all__ = ("Rate", "Zone")
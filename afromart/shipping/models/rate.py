@@ -0,0 +1,40 @@
+from django.core.exceptions import ValidationError
+from django.db import models
+
+# Quotes are cached per step of weight, so band limits must land on one.
+WEIGHT_STEP = 100
+
+
+def validate_weight_step(value: int) -> None:
+    if value % WEIGHT_STEP:
+        raise ValidationError(f"Weight bands must be multiples of {WEIGHT_STEP} g.")
+
+
+class Rate(models.Model):
+    origin = models.ForeignKey(
+        "shipping.Zone",
+        on_delete=models.CASCADE,
+        related_name="outbound_rates",
+        verbose_name="Origin",
+    )
+    destination = models.ForeignKey(
+        "shipping.Zone",
+        on_delete=models.CASCADE,
+        related_name="inbound_rates",
+        verbose_name="Destination",
+    )
+    max_weight = models.PositiveIntegerField(
+        verbose_name="Max Weight (g)", validators=[validate_weight_step]
+    )
+    price = models.PositiveBigIntegerField(verbose_name="Price")
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["origin", "destination", "max_weight"],
+                name="shipping_rate_unique_band",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.origin} → {self.destination} ≤ {self.max_weight} g"
@@ -0,0 +1,14 @@
+from django.contrib.postgres.fields import ArrayField
+from django.db import models
+
+
+class Zone(models.Model):
+    code = models.SlugField(verbose_name="Code", max_length=32, unique=True)
+    name = models.CharField(verbose_name="Name")
+    # ISO 3166-1 alpha-2 codes; a country belongs to one zone.
+    countries = ArrayField(
+        base_field=models.CharField(max_length=2), verbose_name="Countries"
+    )
+
+    def __str__(self) -> str:
+        return self.name
@@ -0,0 +1,188 @@
+import secrets
+import threading
+import time
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable, Sequence
+from typing import NamedTuple
+
+from asgiref.sync import sync_to_async
+
+from afromart.cache import hot
+
+from .models import Rate, Zone
+from .models.rate import WEIGHT_STEP
+
+TABLE_TTL = 300
+QUOTE_TTL = 60 * 60 * 24
+QUOTE_KEY = "shipping_quote"
+# Changed by every reset. Quote keys carry it, and each process reloads its
+# table once it sees a new one, so a rate change reaches every worker at once.
+VERSION_KEY = "shipping_rates_version"
+
+
+class Parcel(NamedTuple):
+    origin: str  # Zone code
+    destination: str  # Zone code
+    weight: int  # Grams
+
+
+def _grams(parcel: Parcel) -> int:
+    if parcel.weight <= 0:
+        raise ValueError(f"A parcel must weigh something, not {parcel.weight}g.")
+    return parcel.weight
+
+
+class Quote(NamedTuple):
+    origin: str
+    destination: str
+    band: int  # The band's max weight, in grams
+    price: int
+
+
+class RateTable:
+    """Every rate, held per zone pair as parallel arrays sorted by weight band."""
+
+    __slots__ = ("zones", "_bands", "_prices")
+
+    def __init__(
+        self, zones: dict[str, str], rates: Iterable[tuple[str, str, int, int]]
+    ) -> None:
+        self.zones = zones
+        self._bands: dict[tuple[str, str], array[int]] = {}
+        self._prices: dict[tuple[str, str], array[int]] = {}
+        for origin, destination, max_weight, price in sorted(rates):
+            self._bands.setdefault((origin, destination), array("L")).append(max_weight)
+            self._prices.setdefault((origin, destination), array("Q")).append(price)
+
+    @classmethod
+    def load(cls) -> RateTable:
+        return cls(
+            zones={
+                country: code
+                for code, countries in Zone.objects.values_list("code", "countries")
+                for country in countries
+            },
+            rates=Rate.objects.values_list(
+                "origin__code", "destination__code", "max_weight", "price"
+            ),
+        )
+
+    def zone(self, country: str) -> str | None:
+        return self.zones.get(country.upper())
+
+    def quote(self, parcel: Parcel) -> Quote | None:
+        """The smallest band that fits, or None if the route or weight isn't served."""
+
+        pair = (parcel.origin, parcel.destination)
+        if (bands := self._bands.get(pair)) is None:
+            return None
+        if (index := bisect_left(bands, _grams(parcel))) == len(bands):
+            return None
+        return Quote(*pair, bands[index], self._prices[pair][index])
+
+
+_table: RateTable | None = None
+_table_version = ""
+_loaded_at = 0.0
+_lock = threading.Lock()
+
+
+def table(version: str = "") -> RateTable:
+    """This process's rate table, reloaded every TABLE_TTL seconds and whenever
+    `version` isn't the one it was loaded at.
+    """
+
+    global _table, _table_version, _loaded_at
+
+    with _lock:
+        if (
+            _table is None
+            or version != _table_version
+            or time.monotonic() - _loaded_at > TABLE_TTL
+        ):
+            _table, _table_version, _loaded_at = (
+                RateTable.load(),
+                version,
+                time.monotonic(),
+            )
+        return _table
+
+
+def reset() -> None:
+    """Move every process to a new table and drop every cached quote, after a
+    rate change.
+    """
+
+    global _table
+
+    with _lock:
+        _table = None
+
+    hot.set(VERSION_KEY, secrets.token_hex(4), timeout=None)
+    hot.delete_matching(f"{QUOTE_KEY}:*")
+
+
+def key(parcel: Parcel, version: str = "") -> str:
+    # Band limits are multiples of WEIGHT_STEP, so every weight within one step
+    # lands in the same band and the key needs no table lookup.
+    step = -(-_grams(parcel) // WEIGHT_STEP)
+    return f"{QUOTE_KEY}:{version}:{parcel.origin}:{parcel.destination}:{step}"
+
+
+def _merge(
+    parcels: Sequence[Parcel],
+    keys: list[str],
+    cached: dict[str, tuple[int, ...]],
+    rates: RateTable | None,
+) -> tuple[list[Quote | None], dict[str, tuple[int, ...]]]:
+    quotes: list[Quote | None] = []
+    missed: dict[str, tuple[int, ...]] = {}
+
+    for parcel, parcel_key in zip(parcels, keys):
+        if (found := cached.get(parcel_key)) is None:
+            quote = rates.quote(parcel)  # pyright: ignore[reportOptionalMemberAccess]
+            # () caches "not served" too, so dead routes don't miss every time.
+            found = missed[parcel_key] = (quote.band, quote.price) if quote else ()
+        quotes.append(
+            Quote(parcel.origin, parcel.destination, *found) if found else None
+        )
+
+    return quotes, missed
+
+
+def quote_many(
+    parcels: Sequence[Parcel], *, rates: RateTable | None = None
+) -> list[Quote | None]:
+    """Quote every parcel of a cart, one per trader, in one cache round trip.
+
+    Only misses touch the rate table, so processes that only see hot routes
+    never load it. The table version is read from this process's copy of the
+    hot cache, so it seldom costs a round trip of its own.
+    """
+
+    version = hot.get(VERSION_KEY, "")
+    keys = [key(parcel, version) for parcel in parcels]
+    cached = hot.get_many(keys)
+    if len(cached) < len(set(keys)):
+        rates = rates or table(version)
+
+    quotes, missed = _merge(parcels, keys, cached, rates)
+    if missed:
+        hot.fill_many(missed, timeout=QUOTE_TTL)
+    return quotes
+
+
+async def aquote_many(
+    parcels: Sequence[Parcel], *, rates: RateTable | None = None
+) -> list[Quote | None]:
+    version = await hot.aget(VERSION_KEY, "")
+    keys = [key(parcel, version) for parcel in parcels]
+    cached = await hot.aget_many(keys)
+    if len(cached) < len(set(keys)):
+        rates = rates or await sync_to_async(table)(version)
+
+    quotes, missed = _merge(parcels, keys, cached, rates)
+    if missed:
+        await hot.afill_many(missed, timeout=QUOTE_TTL)
+    return quotes
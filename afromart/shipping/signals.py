@@ -0,0 +1,16 @@
+from typing import Any
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from . import rates
+from .models import Rate, Zone
+
+
+@receiver(post_save, sender=Rate)
+@receiver(post_delete, sender=Rate)
+@receiver(post_save, sender=Zone)
+@receiver(post_delete, sender=Zone)
+def reset_rates(**kwargs: Any) -> None:
+    transaction.on_commit(rates.reset)
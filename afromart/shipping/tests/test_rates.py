@@ -0,0 +1,81 @@
+from collections.abc import Iterator
+
+import pytest
+
+from afromart.cache import hot
+from shipping import rates
+from shipping.models import Rate, Zone
+
+
+@pytest.fixture
+def table() -> rates.RateTable:
+    return rates.RateTable(
+        zones={"KE": "east", "NG": "west"},
+        rates=[
+            ("east", "west", 2_000, 1_800),
+            ("east", "west", 500, 900),
+            ("east", "west", 10_000, 5_000),
+        ],
+    )
+
+
+def test_quote_picks_smallest_band_that_fits(table: rates.RateTable) -> None:
+    assert table.quote(rates.Parcel("east", "west", 1)).price == 900  # pyright: ignore[reportOptionalMemberAccess]
+    assert table.quote(rates.Parcel("east", "west", 500)).price == 900  # pyright: ignore[reportOptionalMemberAccess]
+    assert table.quote(rates.Parcel("east", "west", 501)).band == 2_000  # pyright: ignore[reportOptionalMemberAccess]
+    assert table.quote(rates.Parcel("east", "west", 10_001)) is None
+    assert table.quote(rates.Parcel("west", "east", 1)) is None
+    assert table.zone("ke") == "east"
+
+
+@pytest.mark.parametrize("weight", [0, -1])
+def test_parcels_must_weigh_something(table: rates.RateTable, weight: int) -> None:
+    with pytest.raises(ValueError):
+        table.quote(rates.Parcel("east", "west", weight))
+    with pytest.raises(ValueError):
+        rates.key(rates.Parcel("east", "west", weight))
+
+
+def test_key_shares_a_step() -> None:
+    assert rates.key(rates.Parcel("east", "west", 401)) == rates.key(
+        rates.Parcel("east", "west", 500)
+    )
+    assert rates.key(rates.Parcel("east", "west", 500)) != rates.key(
+        rates.Parcel("east", "west", 501)
+    )
+
+
+@pytest.fixture
+def routes(db: None) -> Iterator[tuple[Zone, Zone]]:
+    east = Zone.objects.create(code="east", name="East Africa", countries=["KE"])
+    west = Zone.objects.create(code="west", name="West Africa", countries=["NG"])
+    Rate.objects.create(origin=east, destination=west, max_weight=500, price=900)
+    rates.reset()
+    yield east, west
+    rates.reset()
+    hot.delete(rates.VERSION_KEY)
+
+
+def test_quote_many_caches_per_band(routes: tuple[Zone, Zone]) -> None:
+    east, _ = routes
+    cart = [
+        rates.Parcel("east", "west", 300),
+        rates.Parcel("east", "west", 900),
+        rates.Parcel("west", "east", 300),
+    ]
+    first = rates.quote_many(cart)
+    assert [quote and quote.price for quote in first] == [900, None, None]
+    assert hot.get(rates.key(cart[0], hot.get(rates.VERSION_KEY))) == (500, 900)
+
+    Rate.objects.filter(origin=east).update(price=1)  # No signal: stays cached.
+    assert rates.quote_many(cart) == first
+
+
+def test_resets_elsewhere_reload_this_table(routes: tuple[Zone, Zone]) -> None:
+    cart = [rates.Parcel("east", "west", 300)]
+    assert rates.quote_many(cart)[0].price == 900  # pyright: ignore[reportOptionalMemberAccess]
+
+    Rate.objects.update(price=1)
+    # Another process's reset changes the version but not this process's table.
+    hot.set(rates.VERSION_KEY, "elsewhere", timeout=None)
+    assert rates.quote_many(cart)[0].price == 1  # pyright: ignore[reportOptionalMemberAccess]
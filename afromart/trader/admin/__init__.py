@@ -0,0 +1,3 @@
+from .trader import TraderAdmin
+
+__all__ = ("TraderAdmin",)
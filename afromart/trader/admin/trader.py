@@ -0,0 +1,11 @@
+from django.contrib import admin
+
+from ..models import Trader
+
+
+@admin.register(Trader)
+class TraderAdmin(admin.ModelAdmin):  # pyright: ignore[reportMissingTypeArgument]
+    list_display = ("name", "user", "zone", "low_stock_threshold", "created_at")
+    list_select_related = ("user", "zone")
+    search_fields = ("name", "user__username")
+    raw_id_fields = ("user",)
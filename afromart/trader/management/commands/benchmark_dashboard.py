@@ -0,0 +1,106 @@
+from argparse import ArgumentParser
+from datetime import timedelta
+from typing import Any
+from uuid import uuid7
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.utils import timezone
+
+from afromart import benchmark
+from product.models import Product
+
+from ... import rollups
+from ...models import DailySales, SalesRollup, Trader
+
+PRODUCTS = 200
+
+SEED_ORDERS = """
+INSERT INTO order_order (id, customer_id, status, total, created_at)
+SELECT id, %s, 'paid', 0, %s - random() * interval '90 days'
+FROM unnest(%s::uuid[]) AS id
+"""
+
+SEED_LINES = """
+INSERT INTO order_orderline (order_id, product_id, title, unit_price, quantity)
+SELECT
+    id,
+    (%s::uuid[])[1 + floor(random() * %s)::int],
+    'Benchmark',
+    1000 + floor(random() * 9000)::int,
+    1 + floor(random() * 3)::int
+FROM unnest(%s::uuid[]) AS id
+"""
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the trader dashboard's rollup reads with aggregating orders "
+        "on the fly as order history grows. Everything is rolled back."
+    )
+
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        parser.add_argument(
+            "--orders", type=int, nargs="+", default=[1_000, 10_000, 100_000]
+        )
+        parser.add_argument("--requests", type=int, default=50)
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        with transaction.atomic():
+            customer = User.objects.create_user(username=f"benchmark-{uuid7()}")
+            trader = Trader.objects.create(user=customer, name="Benchmark")
+            product_ids = [
+                product.pk
+                for product in Product.objects.bulk_create(
+                    Product(
+                        trader=trader,
+                        title=f"Benchmark {index}",
+                        description="",
+                        in_stock=index % 20,
+                        price=1000,
+                    )
+                    for index in range(PRODUCTS)
+                )
+            ]
+            settled = timezone.now() - rollups.SETTLE_AFTER - timedelta(minutes=1)
+
+            seeded = 0
+            for total in sorted(options["orders"]):
+                order_ids = [uuid7() for _ in range(total - seeded)]
+                with connection.cursor() as cursor:
+                    cursor.execute(SEED_ORDERS, (customer.pk, settled, order_ids))
+                    cursor.execute(
+                        SEED_LINES, (product_ids, len(product_ids), order_ids)
+                    )
+                    cursor.execute("ANALYZE order_order, order_orderline")
+                seeded = total
+                rollups.roll_up()
+
+                def rollup_read() -> bool:
+                    SalesRollup.objects.get(trader=trader)
+                    return bool(
+                        list(
+                            DailySales.objects.filter(
+                                trader=trader,
+                                day__gte=timezone.localdate() - timedelta(days=30),
+                            )
+                        )
+                    )
+
+                def live_read() -> bool:
+                    return bool(rollups.live_totals(trader))
+
+                for name, call in (("rollup", rollup_read), ("on the fly", live_read)):
+                    self.stdout.write(
+                        str(
+                            benchmark.run(
+                                f"{name} @ {total} orders",
+                                call,
+                                concurrency=1,
+                                requests=options["requests"],
+                            )
+                        )
+                    )
+
+            transaction.set_rollback(True)
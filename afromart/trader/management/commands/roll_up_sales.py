@@ -0,0 +1,30 @@
+import time
+from argparse import ArgumentParser
+from typing import Any
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from ... import rollups
+
+
+class Command(BaseCommand):
+    help = "Fold settled orders into the trader sales rollups."
+
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        parser.add_argument(
+            "--every",
+            type=int,
+            default=0,
+            help="Keep running, rolling up every this many seconds.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        while True:
+            close_old_connections()
+            if read := rollups.roll_up():
+                self.stdout.write(f"Rolled up {read} orders.")
+
+            if not options["every"]:
+                return
+            time.sleep(options["every"])
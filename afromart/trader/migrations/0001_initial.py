@@ -0,0 +1,63 @@
+# Generated by Django 5.2.7 on 2026-10-18 11:58
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('shipping', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RollupWatermark',
+            fields=[
+                ('name', models.CharField(primary_key=True, serialize=False, verbose_name='Name')),
+                ('last_order_id', models.UUIDField(blank=True, null=True, verbose_name='Last Order')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Updated At')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='Trader',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid7, editable=False, primary_key=True, serialize=False)),
+                ('name', models.CharField(verbose_name='Name')),
+                ('low_stock_threshold', models.PositiveIntegerField(default=5, verbose_name='Low Stock Threshold')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created At')),
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.PROTECT, related_name='trader', to=settings.AUTH_USER_MODEL, verbose_name='User')),
+                ('zone', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='traders', to='shipping.zone', verbose_name='Shipping Zone')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='SalesRollup',
+            fields=[
+                ('trader', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='rollup', serialize=False, to='trader.trader', verbose_name='Trader')),
+                ('revenue', models.PositiveBigIntegerField(default=0, verbose_name='Revenue')),
+                ('units', models.PositiveBigIntegerField(default=0, verbose_name='Units Sold')),
+                ('orders', models.PositiveBigIntegerField(default=0, verbose_name='Orders')),
+                ('low_stock', models.PositiveIntegerField(default=0, verbose_name='Low Stock')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Updated At')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='DailySales',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField(verbose_name='Day')),
+                ('revenue', models.PositiveBigIntegerField(default=0, verbose_name='Revenue')),
+                ('units', models.PositiveBigIntegerField(default=0, verbose_name='Units Sold')),
+                ('orders', models.PositiveIntegerField(default=0, verbose_name='Orders')),
+                ('trader', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_sales', to='trader.trader', verbose_name='Trader')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('trader', 'day'), name='trader_daily_sales_unique_day')],
+            },
+        ),
+    ]
@@ -0,0 +1,4 @@
+from .sales import DailySales, RollupWatermark, SalesRollup
+from .trader import Trader
+
+__all__ = ("DailySales", "RollupWatermark", "SalesRollup", "Trader")
@@ -0,0 +1,49 @@
+from django.db import models
+
+
+class SalesRollup(models.Model):
+    """A trader's running totals, maintained by trader.rollups."""
+
+    trader = models.OneToOneField(
+        "trader.Trader",
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="rollup",
+        verbose_name="Trader",
+    )
+    revenue = models.PositiveBigIntegerField(verbose_name="Revenue", default=0)
+    units = models.PositiveBigIntegerField(verbose_name="Units Sold", default=0)
+    orders = models.PositiveBigIntegerField(verbose_name="Orders", default=0)
+    low_stock = models.PositiveIntegerField(verbose_name="Low Stock", default=0)
+    updated_at = models.DateTimeField(verbose_name="Updated At", auto_now=True)
+
+
+class DailySales(models.Model):
+    trader = models.ForeignKey(
+        "trader.Trader",
+        on_delete=models.CASCADE,
+        related_name="daily_sales",
+        verbose_name="Trader",
+    )
+    day = models.DateField(verbose_name="Day")
+    revenue = models.PositiveBigIntegerField(verbose_name="Revenue", default=0)
+    units = models.PositiveBigIntegerField(verbose_name="Units Sold", default=0)
+    orders = models.PositiveIntegerField(verbose_name="Orders", default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["trader", "day"], name="trader_daily_sales_unique_day"
+            )
+        ]
+
+
+class RollupWatermark(models.Model):
+    """How far trader.rollups has read the order table."""
+
+    name = models.CharField(verbose_name="Name", primary_key=True)
+    last_order_id = models.UUIDField(verbose_name="Last Order", blank=True, null=True)
+    updated_at = models.DateTimeField(verbose_name="Updated At", auto_now=True)
+
+    def __str__(self) -> str:
+        return self.name
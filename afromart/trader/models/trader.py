@@ -0,0 +1,30 @@
+from uuid import uuid7
+
+from django.conf import settings
+from django.db import models
+
+
+class Trader(models.Model):
+    id = models.UUIDField(default=uuid7, primary_key=True, editable=False)
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.PROTECT,
+        related_name="trader",
+        verbose_name="User",
+    )
+    name = models.CharField(verbose_name="Name")
+    zone = models.ForeignKey(
+        "shipping.Zone",
+        on_delete=models.SET_NULL,
+        related_name="traders",
+        verbose_name="Shipping Zone",
+        blank=True,
+        null=True,
+    )
+    low_stock_threshold = models.PositiveIntegerField(
+        verbose_name="Low Stock Threshold", default=5
+    )
+    created_at = models.DateTimeField(verbose_name="Created At", auto_now_add=True)
+
+    def __str__(self) -> str:
+        return self.name
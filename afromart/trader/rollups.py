@@ -0,0 +1,138 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Count, F, Sum
+from django.utils import timezone
+
+from order.models import Order, OrderLine
+from order.reservations import RESERVATION_TTL
+from product.models import Product
+
+from .models import RollupWatermark, Trader
+
+WATERMARK = "sales"
+ROLLUP_BATCH = 5000
+# An order settles once its holds can't be pending any more: it's either been
+# paid or cancelled by release_expired. Only settled orders are rolled up, so
+# the rollups never need correcting, at the price of lagging by this much.
+SETTLE_AFTER = RESERVATION_TTL + timedelta(minutes=5)
+
+# Reads the next batch of settled orders after the watermark (uuid7 ids are
+# time ordered) and adds their lines to the daily and running totals. A batch
+# stops short of the first order still pending past SETTLE_AFTER, as when
+# release_expired lags: the watermark waits there until it's paid or cancelled.
+ROLLUP = """
+WITH stalled AS (
+    SELECT id FROM order_order
+    WHERE (%(after)s::uuid IS NULL OR id > %(after)s::uuid) AND created_at < %(before)s
+        AND status = 'pending'
+    ORDER BY id
+    LIMIT 1
+), batch AS (
+    SELECT id, status, created_at FROM order_order
+    WHERE (%(after)s::uuid IS NULL OR id > %(after)s::uuid) AND created_at < %(before)s
+        AND id < coalesce((SELECT id FROM stalled), 'ffffffff-ffff-ffff-ffff-ffffffffffff')
+    ORDER BY id
+    LIMIT %(limit)s
+), sales AS (
+    SELECT
+        product.trader_id,
+        (batch.created_at AT TIME ZONE %(time_zone)s)::date AS day,
+        sum(line.unit_price * line.quantity) AS revenue,
+        sum(line.quantity) AS units,
+        count(DISTINCT batch.id) AS orders
+    FROM batch
+    JOIN order_orderline AS line ON line.order_id = batch.id
+    JOIN product_product AS product ON product.id = line.product_id
+    WHERE batch.status <> 'cancelled' AND product.trader_id IS NOT NULL
+    GROUP BY 1, 2
+), daily AS (
+    INSERT INTO trader_dailysales AS daily (trader_id, day, revenue, units, orders)
+    SELECT trader_id, day, revenue, units, orders FROM sales
+    ON CONFLICT (trader_id, day) DO UPDATE SET
+        revenue = daily.revenue + excluded.revenue,
+        units = daily.units + excluded.units,
+        orders = daily.orders + excluded.orders
+), totals AS (
+    INSERT INTO trader_salesrollup AS rollup
+        (trader_id, revenue, units, orders, low_stock, updated_at)
+    SELECT trader_id, sum(revenue), sum(units), sum(orders), 0, now()
+    FROM sales
+    GROUP BY trader_id
+    ON CONFLICT (trader_id) DO UPDATE SET
+        revenue = rollup.revenue + excluded.revenue,
+        units = rollup.units + excluded.units,
+        orders = rollup.orders + excluded.orders,
+        updated_at = excluded.updated_at
+)
+SELECT (SELECT count(*) FROM batch), (SELECT id FROM batch ORDER BY id DESC LIMIT 1)
+"""
+
+# Stock moves on every reservation, so low stock is recounted rather than
+# folded in; product_trader_in_stock keeps it to the low rows.
+LOW_STOCK = """
+INSERT INTO trader_salesrollup AS rollup
+    (trader_id, revenue, units, orders, low_stock, updated_at)
+SELECT trader.id, 0, 0, 0, count(product.id), now()
+FROM trader_trader AS trader
+LEFT JOIN product_product AS product
+    ON product.trader_id = trader.id AND product.in_stock <= trader.low_stock_threshold
+GROUP BY trader.id
+ON CONFLICT (trader_id) DO UPDATE SET
+    low_stock = excluded.low_stock,
+    updated_at = excluded.updated_at
+WHERE rollup.low_stock <> excluded.low_stock
+"""
+
+
+def roll_up(*, batch_size: int = ROLLUP_BATCH) -> int:
+    """Fold settled orders past the watermark into the rollups; returns orders read."""
+
+    before = timezone.now() - SETTLE_AFTER
+    read = 0
+
+    while True:
+        with transaction.atomic(), connection.cursor() as cursor:
+            watermark, _ = RollupWatermark.objects.select_for_update().get_or_create(
+                name=WATERMARK
+            )
+            cursor.execute(
+                ROLLUP,
+                {
+                    "after": watermark.last_order_id,
+                    "before": before,
+                    "limit": batch_size,
+                    "time_zone": settings.TIME_ZONE,
+                },
+            )
+            count, last_order_id = cursor.fetchone()
+            if count:
+                watermark.last_order_id = last_order_id
+                watermark.save(update_fields=["last_order_id", "updated_at"])
+        read += count
+        if count < batch_size:
+            break
+
+    with connection.cursor() as cursor:
+        cursor.execute(LOW_STOCK)
+
+    return read
+
+
+def live_totals(trader: Trader) -> dict[str, int]:
+    """The rollups' numbers aggregated straight from the orders, for comparison."""
+
+    totals = (
+        OrderLine.objects.filter(product__trader=trader)
+        .exclude(order__status=Order.Status.CANCELLED)
+        .aggregate(
+            revenue=Sum(F("unit_price") * F("quantity"), default=0),
+            units=Sum("quantity", default=0),
+            orders=Count("order", distinct=True),
+        )
+    )
+    totals["low_stock"] = Product.objects.filter(
+        trader=trader, in_stock__lte=trader.low_stock_threshold
+    ).count()
+    return totals
@@ -0,0 +1,112 @@
+from datetime import timedelta
+
+import pytest
+from django.contrib.auth.models import User
+from django.test import Client
+from django.urls import reverse
+from django.utils import timezone
+
+from order import reservations
+from order.checkout import checkout
+from order.models import Order
+from product.models import Product
+from trader import rollups
+from trader.models import DailySales, SalesRollup, Trader
+
+
+@pytest.fixture
+def trader() -> Trader:
+    return Trader.objects.create(
+        user=User.objects.create_user(username="trader", password="secret"),
+        name="Kente House",
+    )
+
+
+@pytest.fixture
+def customer() -> User:
+    return User.objects.create_user(username="customer")
+
+
+@pytest.fixture
+def product(trader: Trader) -> Product:
+    return Product.objects.create(
+        trader=trader, title="Kente", description="", in_stock=10, price=4_500
+    )
+
+
+def settle(*orders: Order) -> None:
+    Order.objects.filter(pk__in=[order.pk for order in orders]).update(
+        created_at=timezone.now() - rollups.SETTLE_AFTER - timedelta(minutes=1)
+    )
+
+
+@pytest.mark.django_db
+def test_roll_up_matches_live_totals(
+    trader: Trader, customer: User, product: Product
+) -> None:
+    kept = checkout(customer, {product.pk: 2})
+    reservations.consume(kept)
+    cancelled = checkout(customer, {product.pk: 3})
+    Order.objects.filter(pk=cancelled.pk).update(status=Order.Status.CANCELLED)
+    unsettled = checkout(customer, {product.pk: 1})
+    reservations.consume(unsettled)
+    settle(kept, cancelled)
+
+    assert rollups.roll_up() == 2
+    rollup = SalesRollup.objects.get(trader=trader)
+    assert (rollup.revenue, rollup.units, rollup.orders) == (9_000, 2, 1)
+    assert rollup.low_stock == 1  # 4 left, threshold 5
+    assert DailySales.objects.get(trader=trader).units == 2
+
+    # Nothing is counted twice, and later orders are picked up once settled.
+    assert rollups.roll_up() == 0
+    settle(unsettled)
+    assert rollups.roll_up() == 1
+
+    rollup.refresh_from_db()
+    live = rollups.live_totals(trader)
+    assert (rollup.revenue, rollup.units, rollup.orders, rollup.low_stock) == (
+        live["revenue"],
+        live["units"],
+        live["orders"],
+        live["low_stock"],
+    )
+
+
+@pytest.mark.django_db
+def test_roll_up_waits_for_pending_orders(
+    trader: Trader, customer: User, product: Product
+) -> None:
+    stalled = checkout(customer, {product.pk: 1})
+    paid = checkout(customer, {product.pk: 2})
+    reservations.consume(paid)
+    settle(stalled, paid)
+
+    # Settled by age, but release_expired hasn't cancelled it yet.
+    assert rollups.roll_up() == 0
+    assert SalesRollup.objects.get(trader=trader).orders == 0
+
+    Order.objects.filter(pk=stalled.pk).update(status=Order.Status.CANCELLED)
+    assert rollups.roll_up() == 2
+    rollup = SalesRollup.objects.get(trader=trader)
+    assert (rollup.revenue, rollup.units, rollup.orders) == (9_000, 2, 1)
+
+
+@pytest.mark.django_db
+def test_dashboard(trader: Trader, django_assert_max_num_queries) -> None:
+    rollups.roll_up()
+    client = Client()
+    client.force_login(trader.user)
+
+    # User, trader, rollup and daily sales; sessions live in the cache.
+    with django_assert_max_num_queries(4):
+        response = client.get(reverse("trader:dashboard"))
+    assert response.status_code == 200
+    assert response.context["rollup"].low_stock == 0
+
+
+@pytest.mark.django_db
+def test_dashboard_is_for_traders(customer: User) -> None:
+    client = Client()
+    client.force_login(customer)
+    assert client.get(reverse("trader:dashboard")).status_code == 404
@@ -1,3 +1,9 @@
+from django.urls import path
+
+from .views import dashboard
+
 app_name = "trader"
 
-urlpatterns = []
+urlpatterns = [
+    path(route="", view=dashboard, name="dashboard"),
+]
@@ -0,0 +1,45 @@
+from datetime import timedelta
+
+from django.contrib.auth.decorators import login_required
+from django.http import Http404, HttpRequest, HttpResponse
+from django.shortcuts import render
+from django.utils import timezone
+from django.views.decorators.http import require_GET
+
+from ..models import DailySales, SalesRollup, Trader
+from ..rollups import SETTLE_AFTER
+
+DAYS = 30
+
+
+@require_GET
+@login_required
+async def dashboard(request: HttpRequest) -> HttpResponse:
+    request.user = await request.auser()  # pyright: ignore[reportAttributeAccessIssue]
+
+    if not (trader := await Trader.objects.filter(user=request.user).afirst()):
+        raise Http404
+
+    # Both reads are bounded: one rollup row and at most DAYS daily rows.
+    rollup = await SalesRollup.objects.filter(trader=trader).afirst() or SalesRollup(
+        trader=trader
+    )
+    since = timezone.localdate() - timedelta(days=DAYS)
+    daily = [
+        day
+        async for day in DailySales.objects.filter(
+            trader=trader, day__gte=since
+        ).order_by("-day")
+    ]
+
+    return render(
+        request=request,
+        template_name="trader/dashboard.html",
+        context={
+            "trader": trader,
+            "rollup": rollup,
+            "daily": daily,
+            "days": DAYS,
+            "lag_minutes": int(SETTLE_AFTER.total_seconds() // 60),
+        },
+    )